@@ -0,0 +1,211 @@
+"""
+LLM 백엔드 라우터
+백엔드(런팟, 로컬 올라마)별 성공률과 지연 시간을 기록하고,
+연속 실패한 백엔드는 회로 차단기로 잠시 제외합니다.
+"""
+
+from collections import deque
+from typing import List, Dict, Optional
+import threading
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import LLM_CIRCUIT_FAILURES, LLM_CIRCUIT_BACKOFF, LLM_CIRCUIT_BACKOFF_MAX
+
+
+# 지연 시간 통계에 사용할 최근 호출 수
+LATENCY_WINDOW = 50
+
+# 회로 상태
+CIRCUIT_CLOSED = "closed"  # 정상
+CIRCUIT_OPEN = "open"  # 차단 (대기 시간 동안 호출하지 않음)
+CIRCUIT_HALF_OPEN = "half_open"  # 시험 호출 중 (성공하면 정상, 실패하면 더 길게 차단)
+
+
+class BackendHealth:
+    """백엔드 하나의 호출 기록과 회로 상태"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)  # 최근 성공 호출의 지연 시간 (초)
+
+        self.state = CIRCUIT_CLOSED
+        self.open_until = 0.0  # 차단이 풀리는 시각 (time.monotonic 기준)
+        self.backoff = LLM_CIRCUIT_BACKOFF  # 다음 차단 시간 (실패할 때마다 두 배)
+
+    def percentile(self, ratio: float) -> Optional[float]:
+        """최근 지연 시간의 백분위수 (기록이 없으면 None)"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+    def success_rate(self) -> Optional[float]:
+        """성공률 (호출 기록이 없으면 None)"""
+        total = self.successes + self.failures
+        return self.successes / total if total else None
+
+
+def _expected_latency(backend: BackendHealth) -> tuple:
+    """
+    정상 백엔드 정렬 키 (측정된 백엔드 먼저, 그 안에서는 성공 한 번에 걸리는 예상 시간 순)
+
+    실패한 호출은 다음 백엔드를 다시 시도해야 하므로 p50을 성공률로 나눠 느린 쪽으로 칩니다.
+    지연 시간은 성공한 호출만 기록하므로 기록이 있으면 성공률은 0보다 큽니다.
+    """
+    latency = backend.percentile(0.5)
+    if latency is None:
+        return (1, 0.0)  # 기록 없음: 측정된 백엔드 다음 (정렬이 안정적이라 이름 순서 유지)
+    return (0, latency / backend.success_rate())
+
+
+class BackendRouter:
+    """
+    호출할 백엔드 순서를 정합니다.
+
+    - 정상 백엔드 중 예상 지연 시간(p50 ÷ 성공률)이 짧은 순서로 시도
+      (지연 시간 기록이 없는 백엔드는 측정된 백엔드 다음에 이름 순서대로)
+    - LLM_CIRCUIT_FAILURES번 연속 실패하면 회로를 열고 backoff초 동안 제외
+    - 대기 시간이 지나면 한 번만 시험 호출, 또 실패하면 backoff를 두 배로 늘림
+    - 실제로 요청을 보내기 직전에 acquire를 호출해야 시험 호출로 처리
+      (select만 하고 보내지 않은 백엔드는 차단 상태 그대로 다음 select에 다시 나옴)
+    """
+
+    def __init__(self, names: List[str]):
+        """
+        Args:
+            names: 백엔드 이름 (지연 시간이 같으면 이 순서를 우선)
+        """
+        self._backends = {name: BackendHealth(name) for name in names}
+        self._lock = threading.Lock()
+
+    def select(self) -> List[str]:
+        """
+        이번 호출에서 시도할 백엔드 이름을 순서대로 반환합니다 (모두 차단이면 빈 리스트).
+
+        상태는 바꾸지 않으므로, 요청을 보내기 직전에 acquire로 확인해야 합니다.
+        """
+        now = time.monotonic()
+        healthy = []
+        probes = []
+
+        with self._lock:
+            for backend in self._backends.values():
+                if backend.state == CIRCUIT_CLOSED:
+                    healthy.append(backend)
+                elif now >= backend.open_until:
+                    # 대기 시간이 지난 차단, 또는 결과 없이 시간이 지난 시험 호출
+                    probes.append(backend)
+
+            healthy.sort(key=_expected_latency)
+
+        # 시험 호출은 정상 백엔드를 모두 시도한 뒤에
+        return [backend.name for backend in healthy + probes]
+
+    def acquire(self, name: str) -> bool:
+        """
+        백엔드에 요청을 보내도 되는지 확인합니다 (보내기 직전에 호출).
+
+        차단 대기 시간이 지났으면 시험 호출로 표시하고 True를 반환합니다.
+        시험 호출은 한 번에 하나만 허용하며, backoff초 안에 결과가 기록되지 않으면
+        다시 시험 호출할 수 있습니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            backend = self._backends[name]
+            if backend.state == CIRCUIT_CLOSED:
+                return True
+            if now < backend.open_until:
+                return False
+            backend.state = CIRCUIT_HALF_OPEN
+            backend.open_until = now + backend.backoff
+            return True
+
+    def record_success(self, name: str, latency: float):
+        """호출 성공을 기록합니다 (시험 호출이었다면 회로를 닫음)."""
+        with self._lock:
+            backend = self._backends[name]
+            backend.successes += 1
+            backend.consecutive_failures = 0
+            backend.latencies.append(latency)
+            backend.state = CIRCUIT_CLOSED
+            backend.backoff = LLM_CIRCUIT_BACKOFF
+
+    def record_failure(self, name: str):
+        """호출 실패를 기록합니다 (연속 실패 또는 시험 호출 실패면 회로를 엶)."""
+        with self._lock:
+            backend = self._backends[name]
+            backend.failures += 1
+            backend.consecutive_failures += 1
+
+            if backend.state == CIRCUIT_HALF_OPEN:
+                backend.backoff = min(backend.backoff * 2, LLM_CIRCUIT_BACKOFF_MAX)
+                self._open(backend)
+            elif backend.consecutive_failures >= LLM_CIRCUIT_FAILURES:
+                self._open(backend)
+
+    def _open(self, backend: BackendHealth):
+        """회로를 열어 backoff초 동안 백엔드를 제외합니다."""
+        backend.state = CIRCUIT_OPEN
+        backend.open_until = time.monotonic() + backend.backoff
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        백엔드별 상태를 반환합니다.
+
+        Returns:
+            {이름: {'state', 'success_rate', 'p50', 'p95', 'calls'}}
+        """
+        with self._lock:
+            return {
+                name: {
+                    'state': backend.state,
+                    'success_rate': backend.success_rate(),
+                    'p50': backend.percentile(0.5),
+                    'p95': backend.percentile(0.95),
+                    'calls': backend.successes + backend.failures
+                }
+                for name, backend in self._backends.items()
+            }
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 백엔드 라우터 테스트 ===\n")
+
+    router = BackendRouter(['runpod', 'local'])
+    router.record_success('local', 0.5)
+    for _ in range(LLM_CIRCUIT_FAILURES):
+        router.record_failure('runpod')
+    print(f"연속 실패 후: {router.select()} {router.get_stats()['runpod']['state']}")
+
+    # 대기 시간이 지난 것처럼 만듦
+    router._backends['runpod'].open_until = 0.0
+    print(f"대기 시간 경과: {router.select()} {router.get_stats()['runpod']['state']}")
+
+    # 정상 백엔드가 먼저 성공해 시험 호출을 보내지 않아도 다음 select에 다시 나옴
+    router.record_success('local', 0.5)
+    print(f"시험 호출 없이 다시 선택: {router.select()} {router.get_stats()['runpod']['state']}")
+
+    print(f"시험 호출 허용: {router.acquire('runpod')}, 중복 시험 호출 허용: {router.acquire('runpod')}")
+    print(f"시험 호출 중: {router.select()} {router.get_stats()['runpod']['state']}")
+
+    # 시험 호출 결과가 기록되지 않은 채 시간이 지나면 다시 시험 가능
+    router._backends['runpod'].open_until = 0.0
+    print(f"시험 호출 시간 초과: {router.select()}, 다시 허용: {router.acquire('runpod')}")
+
+    router.record_success('runpod', 0.3)
+    print(f"시험 호출 성공 후: {router.select()} {router.get_stats()['runpod']['state']}")
+
+    # 성공률 반영: runpod(p50 0.3초, 성공률 1/4)보다 local(p50 0.5초, 성공률 100%)이 먼저
+    print(f"성공률 반영 순서: {router.select()} {router.get_stats()['runpod']['success_rate']:.2f}")
+
+    # 기록 없는 백엔드는 측정된 백엔드 다음
+    router = BackendRouter(['runpod', 'local'])
+    router.record_success('local', 2.0)
+    print(f"기록 없는 백엔드는 뒤로: {router.select()}")
@@ -0,0 +1,138 @@
+"""
+NPC 대사 응답 형식
+Ollama 구조화 출력(format)에 넘길 JSON 스키마와, 조금 깨진 응답도 살려 쓰는
+관대한 파서를 제공합니다.
+"""
+
+from typing import Optional, Tuple
+import json
+import re
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import LLM_TALK_MAX_LENGTH, LLM_INNER_MAX_LENGTH
+from ai.json_stream import JsonFieldStream
+
+
+# Ollama chat(format=...)에 넘길 응답 스키마 (모델 출력이 이 형식으로 제한됨)
+DIALOGUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "속마음": {"type": "string", "maxLength": LLM_INNER_MAX_LENGTH},
+        "하는말": {"type": "string", "maxLength": LLM_TALK_MAX_LENGTH}
+    },
+    "required": ["속마음", "하는말"]
+}
+
+# ```json ... ``` 코드 블록
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# 문장 끝 (길이 제한으로 자를 때 이 위치에서 끊음)
+_SENTENCE_END = re.compile(r"[.!?…~。]+")
+
+
+def parse_dialogue(content: str) -> Optional[Tuple[str, str]]:
+    """
+    모델 응답에서 (하는말, 속마음)을 꺼냅니다.
+
+    정상 JSON이 아니어도 코드 블록, 앞뒤 설명, 중간에 끊긴 응답(닫는 따옴표나
+    괄호가 없는 경우)은 복구하고, 글자 수 제한을 넘는 대사는 잘라 냅니다.
+
+    Args:
+        content: 모델 응답 문자열
+
+    Returns:
+        (하는말, 속마음) - '하는말'을 찾을 수 없으면 None
+    """
+    if not content:
+        return None
+
+    text = content.strip()
+    fence = _CODE_FENCE.search(text)
+    if fence:
+        text = fence.group(1).strip()
+
+    data = _loads_object(text)
+    if data is not None:
+        talk, inner = data.get('하는말'), data.get('속마음')
+    else:
+        talk, inner = _extract_field(text, '하는말'), _extract_field(text, '속마음')
+
+    if not isinstance(talk, str) or not talk.strip():
+        return None
+    if not isinstance(inner, str) or not inner.strip():
+        inner = "..."
+
+    return (clamp_text(talk.strip(), LLM_TALK_MAX_LENGTH),
+            clamp_text(inner.strip(), LLM_INNER_MAX_LENGTH))
+
+
+def clamp_text(text: str, max_length: int) -> str:
+    """
+    대사를 max_length자 이내로 자릅니다.
+
+    제한 안쪽에 문장 끝이 있으면 그 문장까지만 남기고, 없으면 잘라서 '…'를 붙입니다.
+    """
+    if len(text) <= max_length:
+        return text
+
+    cut = 0
+    for match in _SENTENCE_END.finditer(text, 0, max_length):
+        cut = match.end()
+    if cut > 0:
+        return text[:cut]
+    return text[:max_length - 1].rstrip() + "…"
+
+
+def close_partial_text(text: str, max_length: int) -> str:
+    """
+    스트리밍 도중 끊긴 대사를 마무리합니다 (마감이 지났거나 응답이 끊겼을 때).
+
+    clamp_text로 길이를 맞추고, 문장 끝으로 끝나지 않았으면 '…'를 붙입니다.
+    """
+    text = clamp_text(text.rstrip(), max_length)
+    if _SENTENCE_END.search(text[-1:]):
+        return text
+    return clamp_text(text + "…", max_length)
+
+
+def _loads_object(text: str) -> Optional[dict]:
+    """첫 '{'부터 JSON 객체를 읽습니다 (뒤에 붙은 설명은 무시, 실패하면 None)."""
+    start = text.find('{')
+    if start < 0:
+        return None
+    try:
+        data, _ = json.JSONDecoder().raw_decode(text, start)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _extract_field(text: str, key: str) -> Optional[str]:
+    """문자열 필드 하나를 꺼냅니다 (닫는 따옴표가 없으면 끝까지 읽고 '…'를 붙임)."""
+    stream = JsonFieldStream(key)
+    stream.feed(text)
+    value = stream.value.rstrip()
+    if not value:
+        return None
+    if stream.done or _SENTENCE_END.search(value[-1]):
+        return value
+    return value + "…"
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 대사 응답 파서 테스트 ===\n")
+
+    samples = [
+        '{"속마음": "좋은 패다.", "하는말": "한 번 가볼까?"}',
+        '```json\n{"속마음": "좋은 패다.", "하는말": "한 번 가볼까?"}\n```',
+        '알겠습니다. {"속마음": "좋은 패다.", "하는말": "한 번 가볼까?"} 입니다.',
+        '{"속마음": "좋은 패다.", "하는말": "한 번 가볼',
+        '{"속마음": "좋은 패다.", "하는말": "이번 판은 내가 가져간다. 따라올 테면 따라와 봐라, 고니야. 오늘 밤은 길다."}',
+        '{"속마음": "좋은 패다."',
+        'JSON이 아닌 응답'
+    ]
+    for sample in samples:
+        print(f"{sample[:40]!r:45} → {parse_dialogue(sample)}")
@@ -0,0 +1,338 @@
+"""
+NPC 대사 백그라운드 생성 서비스
+LLM 호출을 작업 스레드에서 처리해 게임 루프(프레임)가 멈추지 않게 합니다.
+"""
+
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+import queue
+import threading
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import LLM_DEADLINE, LLM_TALK_MAX_LENGTH
+from ai.dialogue_format import close_partial_text
+
+
+class DialogueService:
+    """
+    NPC 대사 생성 요청을 받아 작업 스레드에서 처리합니다.
+
+    - request(): 프롬프트를 만들어 작업 큐에 넣고 바로 Future를 반환
+    - prefetch(): 다음 NPC 턴에 필요할 대사를 미리 생성해 상황별로 캐시
+    - poll(): 완료된 대사를 꺼냄 (게임 루프에서 매 프레임 호출, 대기 없음)
+
+    표시 요청은 응답을 스트리밍으로 받아, 대사 앞부분이 도착할 때마다
+    'partial': True인 결과를 poll()로 내보냅니다 (말풍선에 실시간 출력).
+    LLM_DEADLINE초 안에 첫 글자도 오지 않으면 NPC 기본 대사로 대신하고,
+    늦게 도착한 응답은 버립니다. 라운드가 끝나면 cancel_all()로 남은 요청을 모두 버립니다.
+    """
+
+    def __init__(self, handler=None):
+        """
+        Args:
+            handler: 대사 생성기 (build_messages, generate_from_messages 제공),
+                또는 요청할 때마다 대사 생성기를 돌려주는 함수 (예: lambda: game.llm)
+                None이면 처음 요청할 때 LLMHandler를 불러와 생성
+        """
+        self._handler = handler
+        self._requests = queue.Queue()  # 작업 스레드가 처리할 요청
+        self._completed = queue.Queue()  # 완료된 대사 (메인 스레드가 poll로 꺼냄)
+        self._pending = 0  # 완료되지 않은 요청 수 (미리 생성은 표시 요청으로 바뀐 것만)
+        self._lock = threading.Lock()
+        
+        # 미리 생성 (상황 키 → 결과 / 진행 중 요청)
+        self._prefetched = {}  # 완성된 대사
+        self._prefetching = {}  # 생성 중인 요청 {'deliver': 완성되면 바로 표시할지, 'future', 'fallback'}
+
+        # 표시 요청 마감 (Future → (마감 시각, 기본 대사 결과))
+        self._deadlines = {}
+        self._expired = set()  # 마감이 지나 기본 대사로 대신한 요청
+        self._generation = 0  # cancel_all 호출 횟수 (이전 세대 요청의 결과는 버림)
+
+        # 데몬 스레드: 응답을 기다리는 중에도 게임 종료를 막지 않음
+        self._worker = threading.Thread(target=self._run, name="dialogue-worker", daemon=True)
+        self._worker.start()
+
+    def request(self, game, speaker: str) -> Future:
+        """
+        대사 생성을 요청합니다 (기다리지 않음).
+
+        게임 상태는 계속 바뀌므로 프롬프트는 호출한 스레드에서 바로 만들고,
+        LLM 호출만 작업 스레드에서 처리합니다.
+
+        Args:
+            game: 현재 게임 (SutdaGame)
+            speaker: 대사를 말할 NPC 이름
+
+        Returns:
+            결과 딕셔너리 {'speaker', 'talk', 'inner', 'game', 'round', 'key', 'partial'}를 담을 Future
+        """
+        key = situation_key(game)
+        self.discard_stale(game)
+        
+        with self._lock:
+            # 미리 생성한 대사가 있으면 바로 완료 처리
+            result = self._prefetched.pop(key, None)
+            if result is not None:
+                self._completed.put(result)
+                future = Future()
+                future.set_result(result)
+                return future
+            
+            # 같은 상황을 생성 중이면 완성되는 대로 표시하도록 전환
+            if key in self._prefetching:
+                entry = self._prefetching[key]
+                if not entry['deliver']:
+                    entry['deliver'] = True
+                    self._pending += 1
+                    self._deadlines[entry['future']] = (time.monotonic() + LLM_DEADLINE, entry['fallback'])
+                return entry['future']
+        
+        return self._submit(game, speaker, key, deliver=True)
+    
+    def prefetch(self, game, speaker: str):
+        """
+        현재 상황의 대사를 미리 생성합니다 (베팅 페이즈 시작 시 호출).
+        
+        플레이어가 베팅을 고르는 동안 생성해 두면, NPC 턴의 request()가
+        모델 응답을 기다리지 않고 캐시에서 바로 대사를 가져갑니다.
+        상황이 바뀌면 이전 상황의 캐시와 생성 중인 요청 결과는 버립니다.
+        """
+        key = situation_key(game)
+        self.discard_stale(game)
+        
+        with self._lock:
+            if key in self._prefetched or key in self._prefetching:
+                return
+        
+        self._submit(game, speaker, key, deliver=False)
+    
+    def discard_stale(self, game):
+        """현재 상황과 다른 미리 생성 대사를 버립니다."""
+        key = situation_key(game)
+        with self._lock:
+            for stale_key in [k for k in self._prefetched if k != key]:
+                del self._prefetched[stale_key]
+            for stale_key in [k for k, entry in self._prefetching.items()
+                              if k != key and not entry['deliver']]:
+                del self._prefetching[stale_key]
+    
+    def cancel_all(self):
+        """
+        진행 중인 요청과 미리 생성한 대사를 모두 버립니다 (라운드가 끝날 때 호출).
+        
+        작업 큐에서 기다리는 요청은 취소하고, 이미 모델을 호출 중인 요청은
+        응답이 도착해도 표시하지 않습니다. 아직 꺼내지 않은 완료 대사도 버립니다.
+        """
+        with self._lock:
+            self._generation += 1
+            for future in list(self._deadlines) + [entry['future'] for entry in self._prefetching.values()]:
+                future.cancel()  # 작업 스레드가 아직 꺼내지 않은 요청만 취소됨
+            self._deadlines.clear()
+            self._expired.clear()
+            self._prefetching.clear()
+            self._prefetched.clear()
+            self._pending = 0
+            while True:
+                try:
+                    self._completed.get_nowait()
+                except queue.Empty:
+                    break
+    
+    @property
+    def handler(self):
+        """대사 생성기 (LLM을 쓸 수 없으면 None)"""
+        if self._handler is None:
+            try:
+                from ai.llm_handler import LLMHandler  # 첫 요청 때 LLM 모듈을 불러옴
+                self._handler = LLMHandler()
+            except ImportError:
+                self._handler = lambda: None  # 이후 요청은 모두 기본 대사
+        if callable(self._handler) and not hasattr(self._handler, 'build_messages'):
+            return self._handler()
+        return self._handler
+    
+    def _submit(self, game, speaker: str, key: tuple, deliver: bool) -> Future:
+        """요청을 작업 큐에 넣습니다."""
+        future = Future()
+        handler = self.handler
+        
+        # 마감까지 응답이 없을 때 대신 표시할 결과 (게임 상태를 읽으므로 호출한 스레드에서)
+        fallback = {
+            'speaker': speaker,
+            'talk': game.npc.get_fallback_dialogue('betting'),
+            'inner': '...',
+            'game': game,
+            'round': game.current_round,
+            'key': key,
+            'partial': False
+        }
+        
+        # LLM을 쓸 수 없으면 기본 대사로 바로 완료
+        if handler is None:
+            if deliver:
+                self._completed.put(fallback)
+            future.set_result(fallback)
+            return future
+        
+        request = {
+            'speaker': speaker,
+            'handler': handler,
+            'messages': handler.build_messages(game),
+            'game': game,
+            'round': game.current_round,
+            'key': key,
+            'prefetch': not deliver,
+            'fallback': (fallback['talk'], fallback['inner'])
+        }
+        
+        with self._lock:
+            request['generation'] = self._generation
+            if deliver:
+                self._pending += 1
+                self._deadlines[future] = (time.monotonic() + LLM_DEADLINE, fallback)
+            else:
+                self._prefetching[key] = {'deliver': False, 'future': future, 'fallback': fallback}
+        self._requests.put((request, future))
+        return future
+
+    def poll(self) -> List[Dict]:
+        """
+        완료된 대사를 모두 꺼냅니다 (없으면 빈 리스트, 대기하지 않음).
+
+        마감이 지난 표시 요청은 기본 대사를 대신 내보냅니다.
+        """
+        results = []
+        now = time.monotonic()
+        with self._lock:
+            for future, (deadline, fallback) in list(self._deadlines.items()):
+                if now >= deadline:
+                    del self._deadlines[future]
+                    self._expired.add(future)
+                    self._pending -= 1
+                    results.append(fallback)
+
+        while True:
+            try:
+                results.append(self._completed.get_nowait())
+            except queue.Empty:
+                return results
+
+    def is_busy(self) -> bool:
+        """생성 중인 대사가 있는지 확인합니다 ("생각 중" 표시용)."""
+        return self._pending > 0
+
+    def shutdown(self):
+        """작업 스레드를 종료합니다 (처리 중인 요청은 기다리지 않음)."""
+        self._requests.put(None)
+
+    def _run(self):
+        """작업 스레드: 요청을 하나씩 꺼내 LLM을 호출합니다."""
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+
+            request, future = item
+            if not future.set_running_or_notify_cancel():
+                self._finish(request, future, None)
+                continue
+            
+            # 대기 중에 상황이 바뀐 미리 생성 요청은 모델을 호출하지 않음
+            if request['prefetch'] and not self._is_wanted(request['key'], future):
+                future.set_result(None)
+                continue
+
+            def on_talk(talk, request=request, future=future):
+                self._stream(request, future, talk)
+
+            try:
+                talk, inner = request['handler'].generate_from_messages(
+                    request['messages'], fallback=request['fallback'], on_talk=on_talk
+                )
+            except Exception:
+                # 대사 일부를 이미 보여줬으면 기본 대사로 바꾸지 않음
+                if request.get('streamed'):
+                    talk, inner = close_partial_text(request['streamed'], LLM_TALK_MAX_LENGTH), '...'
+                else:
+                    talk, inner = request['fallback']
+
+            result = {
+                'speaker': request['speaker'],
+                'talk': talk,
+                'inner': inner,
+                'game': request['game'],
+                'round': request['round'],
+                'key': request['key'],
+                'partial': False
+            }
+            self._finish(request, future, result)
+            future.set_result(result)
+
+    def _is_wanted(self, key: tuple, future: Future) -> bool:
+        """미리 생성 요청이 아직 유효한지 확인합니다."""
+        with self._lock:
+            entry = self._prefetching.get(key)
+            return entry is not None and entry['future'] is future
+    
+    def _stream(self, request: Dict, future: Future, talk: str):
+        """생성 중인 대사 앞부분을 표시 큐로 보냅니다 (표시할 요청만)."""
+        with self._lock:
+            if request['generation'] != self._generation or future in self._expired:
+                return  # 라운드가 끝나 버렸거나 기본 대사로 대신한 요청
+            if request['prefetch']:
+                entry = self._prefetching.get(request['key'])
+                if entry is None or entry['future'] is not future or not entry['deliver']:
+                    return  # 아직 미리 생성 중이거나 버린 요청
+            
+            # 첫 글자가 도착했으면 기본 대사로 바꾸지 않음
+            self._deadlines.pop(future, None)
+            request['streamed'] = talk
+            self._completed.put({
+                'speaker': request['speaker'],
+                'talk': talk,
+                'inner': None,
+                'game': request['game'],
+                'round': request['round'],
+                'key': request['key'],
+                'partial': True
+            })
+    
+    def _finish(self, request: Dict, future: Future, result: Optional[Dict]):
+        """완료된 요청을 표시 큐 또는 미리 생성 캐시로 보냅니다."""
+        key = request['key']
+        with self._lock:
+            if request['generation'] != self._generation:
+                return  # cancel_all로 버린 요청
+            if request['prefetch']:
+                entry = self._prefetching.get(key)
+                if entry is None or entry['future'] is not future:
+                    return  # 상황이 바뀌어 버린 요청
+                del self._prefetching[key]
+                if not entry['deliver']:
+                    if result is not None:
+                        self._prefetched[key] = result
+                    return
+            
+            # 마감이 지나 기본 대사를 이미 표시한 요청은 버림
+            if future in self._expired:
+                self._expired.discard(future)
+                return
+            
+            self._deadlines.pop(future, None)
+            self._pending -= 1
+            if result is not None:
+                self._completed.put(result)
+
+
+def situation_key(game) -> tuple:
+    """
+    NPC 대사 상황 키 (게임, 라운드, 베팅 페이즈, NPC 패, 플레이어 공개 패)
+    
+    판돈은 플레이어 베팅에 따라 조금씩 바뀌므로 키에 넣지 않습니다.
+    """
+    return (id(game), game.current_round, game.betting_phase,
+            game.npc.card_mask, game.player.revealed_mask)
@@ -0,0 +1,190 @@
+"""
+스트리밍 JSON 필드 추출기
+LLM 응답이 토큰 단위로 도착하는 동안 JSON 문자열 필드 하나의 값을 미리 꺼냅니다.
+"""
+
+import json
+
+
+# JSON 문자열 이스케이프 (\uXXXX 제외)
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t'
+}
+
+
+class JsonFieldStream:
+    """
+    JSON 응답 조각을 받아 문자열 필드 하나의 값을 점진적으로 추출합니다.
+
+    전체 응답이 완성되기 전에도 지금까지 도착한 값(앞부분)을 돌려주므로,
+    말풍선에 대사를 실시간으로 찍을 수 있습니다.
+
+    키는 최상위 객체의 키 자리에서만 찾습니다 (중첩 깊이와 문자열 안인지를 추적하므로
+    다른 필드 값 안에 같은 글자가 있어도 잘못 잡지 않음).
+
+    사용 예:
+        stream = JsonFieldStream('하는말')
+        for chunk in chunks:
+            if stream.feed(chunk):
+                print(stream.value)
+    """
+
+    def __init__(self, key: str):
+        """
+        Args:
+            key: 추출할 필드 이름
+        """
+        self.key = key
+        self.value = ""  # 지금까지 해석한 값
+        self.done = False  # 값의 닫는 따옴표까지 받았는지
+
+        self._buffer = ""  # 지금까지 받은 응답 전체
+        self._pos = 0  # 다음에 해석할 위치
+        self._in_value = False
+
+        # 키 검색 상태 (조각 사이에서 이어서 검색)
+        self._depth = 0  # 객체/배열 중첩 깊이
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0  # 지금 읽는 문자열의 여는 따옴표 위치
+        self._string_is_key = False
+        self._expect_key = False  # 최상위 객체에서 다음 문자열이 키인지
+        self._last_key = None  # 최상위 객체에서 마지막으로 읽은 키 (':' 뒤 값을 기다리는 중)
+
+    def feed(self, chunk: str) -> bool:
+        """
+        응답 조각을 추가합니다.
+
+        Returns:
+            값이 늘어났으면 True
+        """
+        self._buffer += chunk
+        if self.done:
+            return False
+
+        if not self._in_value and not self._find_value():
+            return False
+
+        before = len(self.value)
+        self._decode()
+        return len(self.value) > before
+
+    def _find_value(self) -> bool:
+        """
+        새로 받은 부분을 이어서 읽으며 최상위 키 다음의 문자열 값 시작을 찾습니다.
+
+        Returns:
+            값이 시작됐으면 True (self._pos가 값의 첫 글자)
+        """
+        buffer = self._buffer
+        pos = self._pos
+
+        while pos < len(buffer):
+            char = buffer[pos]
+            pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        try:
+                            self._last_key = json.loads(buffer[self._string_start:pos])
+                        except ValueError:
+                            self._last_key = None
+                continue
+
+            if char == '"':
+                if self._depth == 1 and self._last_key == self.key and not self._expect_key:
+                    self._in_value = True
+                    self._pos = pos
+                    return True
+                self._in_string = True
+                self._string_start = pos - 1
+                self._string_is_key = self._depth == 1 and self._expect_key
+                self._expect_key = False
+            elif char in '{[':
+                self._depth += 1
+                self._expect_key = self._depth == 1 and char == '{'
+                self._last_key = None
+            elif char in '}]':
+                self._depth -= 1
+                self._last_key = None
+            elif char == ',' and self._depth == 1:
+                self._expect_key = True
+                self._last_key = None
+            elif char == ':' or char.isspace():
+                continue
+            else:
+                # 문자열이 아닌 값 (숫자, true 등)
+                self._last_key = None
+
+        self._pos = pos
+        return False
+
+    def _decode(self):
+        """버퍼에서 값 문자열을 해석합니다 (이스케이프가 잘려 있으면 다음 조각까지 대기)."""
+        buffer = self._buffer
+        pos = self._pos
+        parts = []
+
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self.done = True
+                pos += 1
+                break
+
+            if char != '\\':
+                parts.append(char)
+                pos += 1
+                continue
+
+            if pos + 1 >= len(buffer):
+                break
+            escape = buffer[pos + 1]
+            if escape == 'u':
+                if pos + 6 > len(buffer):
+                    break
+                try:
+                    parts.append(chr(int(buffer[pos + 2:pos + 6], 16)))
+                except ValueError:
+                    parts.append(buffer[pos:pos + 6])
+                pos += 6
+            else:
+                parts.append(_ESCAPES.get(escape, escape))
+                pos += 2
+
+        self.value += ''.join(parts)
+        self._pos = pos
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 스트리밍 JSON 필드 추출 테스트 ===\n")
+
+    response = '{"속마음": "이번 판은 \\"장땡\\"이다", "하는말": "한 번 가볼까?\\n따라와 봐\\u0021"}'
+    stream = JsonFieldStream('하는말')
+    for i in range(0, len(response), 5):
+        if stream.feed(response[i:i + 5]):
+            print(f"  {stream.value!r}")
+
+    print(f"\n완료: {stream.done}")
+    print(f"json.loads와 일치: {stream.value == json.loads(response)['하는말']}")
+
+    # 다른 필드 값 안이나 중첩 객체에 같은 키 글자가 있어도 최상위 키만 사용
+    tricky = '{"속마음": "\\"하는말\\": \\"속임수\\"", "기록": {"하는말": "옛날 대사"}, "하는말": "진짜 대사"}'
+    stream = JsonFieldStream('하는말')
+    for char in tricky:
+        stream.feed(char)
+    print(f"값 안의 키 무시: {stream.value!r} (json.loads와 일치: {stream.value == json.loads(tricky)['하는말']})")
@@ -4,20 +4,67 @@ NPC 대사를 생성합니다. (추후 실제 LLM 연동 예정)
 """
 
 import random
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 import sys
 import os
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import ollama
 import time
-import core.game as SutdaGame
 from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import LLM_MODEL, LLM_API_URL, LLM_TIMEOUT, LLM_TEMPERATURE, MODEL_NAME
+from config import (
+    LLM_MODEL, LLM_API_URL, LLM_TIMEOUT, LLM_TEMPERATURE, MODEL_NAME,
+    LLM_LOCAL_HOST, LLM_RUNPOD_HOST, LLM_CONNECT_TIMEOUT, LLM_READ_TIMEOUT,
+    LLM_KEEPALIVE_CONNECTIONS, LLM_KEEPALIVE_EXPIRY, LLM_KEEP_ALIVE, LLM_NUM_CTX,
+    LLM_DEADLINE, LLM_MIN_ATTEMPT_TIME, LLM_CACHE_PATH, LLM_TALK_MAX_LENGTH
+)
+from ai.backend_router import BackendRouter
+from ai.json_stream import JsonFieldStream
+from ai.dialogue_format import DIALOGUE_SCHEMA, parse_dialogue, clamp_text, close_partial_text
+from ai.response_cache import ResponseCache, parse_cache_key
+
+if TYPE_CHECKING:
+    from core.game import SutdaGame  # 타입 표시용 (core.game과 순환 import 방지)
 
 load_dotenv()
 
+# 백엔드(호스트)별 Ollama 클라이언트 - 프로세스 안에서 공유해 TCP/TLS 연결을 재사용
+_clients = {}
+_clients_lock = threading.Lock()
+
+# 모델 호출을 실행할 스레드 (호출한 쪽은 마감까지만 기다리고 돌아감)
+_call_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-call")
+
+# 페르소나별 시스템 프롬프트 캐시 (페르소나 이름 → 프롬프트 문자열)
+_system_prompts = {}
+
+
+def get_client(host: str) -> ollama.Client:
+    """
+    호스트별로 재사용하는 Ollama 클라이언트를 반환합니다.
+    
+    처음 요청할 때 한 번만 만들고, 이후에는 keep-alive 연결 풀을 그대로 씁니다.
+    """
+    with _clients_lock:
+        client = _clients.get(host)
+        if client is None:
+            client = ollama.Client(
+                host=host,
+                timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_keepalive_connections=LLM_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+                )
+            )
+            _clients[host] = client
+        return client
+
+
 class LLMHandler:
     """LLM API 통신 핸들러"""
     
@@ -29,104 +76,222 @@ class LLMHandler:
         self.temperature = LLM_TEMPERATURE
         self.enabled = False  # 현재는 비활성화 (추후 활성화)
         self.model_name = MODEL_NAME
+        
+        # 백엔드 주소 (클라이언트는 get_client로 공유)
+        pod_id = os.getenv("POD_ID")
+        self.runpod_host = LLM_RUNPOD_HOST.format(pod_id=pod_id) if pod_id else None
+        self.local_host = os.getenv("LLM_LOCAL_HOST", LLM_LOCAL_HOST)  # 스텁 서버(ai/stub_server.py) 등으로 교체 가능
+        
+        # 백엔드 (지연 시간이 같으면 앞쪽 우선) 및 라우터
+        self.backends = {}
+        if self.runpod_host is not None:
+            self.backends['runpod'] = self.chat_with_eeve_runpod
+        self.backends['local'] = self.chat_with_eeve
+        self.router = BackendRouter(list(self.backends))
+        
+        # 비슷한 상황의 대사 캐시
+        self.cache = ResponseCache(path=LLM_CACHE_PATH)
 
     
-    def chat_with_eeve(self,messages):
+    def chat_with_eeve(self, messages, on_talk=None, deadline=None):
     
-        start_time = time.time()
-        response = ollama.chat(
-            model=self.model_name,
-            messages=messages
-        )
-        end_time = time.time()
-        return response['message'], end_time - start_time
+        return self._chat(get_client(self.local_host), self.model_name, messages, on_talk, deadline)
 
 
 
-    def chat_with_eeve_runpod(self, messages, model:str = "EEVE-Korean-10.8B"):
+    def chat_with_eeve_runpod(self, messages, on_talk=None, deadline=None, model:str = "EEVE-Korean-10.8B"):
 
-        POD_ID = os.getenv("POD_ID")
-        
-        RUNPOD_OLLAMA_URL = f"https://{POD_ID}-11434.proxy.runpod.net/"
+        if self.runpod_host is None:
+            raise ConnectionError("POD_ID 환경변수가 없어 런팟을 사용할 수 없습니다")
 
-        start_time = time.time()
-        client = ollama.Client(host=RUNPOD_OLLAMA_URL)
+        return self._chat(get_client(self.runpod_host), model, messages, on_talk, deadline)
 
-        response = client.chat(
-            model=model,
-            messages=messages
-        )
-
-        end_time = time.time()
-        return response['message'], end_time - start_time
+    def _chat(self, client: ollama.Client, model: str, messages: list, on_talk=None,
+              deadline: Optional[float] = None):
+        """
+        채팅 API를 호출합니다.
+        
+        응답은 구조화 출력(DIALOGUE_SCHEMA)으로 요청해 '속마음'/'하는말' JSON만 나오게 합니다.
+        응답은 항상 스트리밍으로 받고, on_talk가 있으면 '하는말' 값이 늘어날 때마다
+        지금까지의 대사로 on_talk(대사)를 호출합니다.
+        
+        ollama 클라이언트는 호출별 타임아웃을 받지 않으므로 호출은 별도 스레드에서 하고,
+        deadline(time.monotonic 기준)까지만 기다립니다. 마감을 넘긴 호출은 다음 조각에서
+        연결을 닫고 작업 스레드를 돌려줍니다 (한 번에 받는 호출이었다면 응답이 끝나거나
+        LLM_READ_TIMEOUT이 지날 때까지 스레드를 붙잡음). on_talk도 더 이상 부르지 않습니다.
+        
+        Returns:
+            (응답 메시지 {'content': 전체 응답}, 지연 시간)
+            
+        Raises:
+            TimeoutError: deadline까지 응답을 다 받지 못함
+        """
+        start_time = time.time()
+        cancelled = threading.Event()
+        
+        def call():
+            talk_stream = JsonFieldStream('하는말') if on_talk is not None else None
+            chunks = []
+            stream = client.chat(
+                model=model,
+                messages=messages,
+                stream=True,
+                format=DIALOGUE_SCHEMA,
+                keep_alive=LLM_KEEP_ALIVE,
+                options={'num_ctx': LLM_NUM_CTX}
+            )
+            try:
+                for part in stream:
+                    if cancelled.is_set():
+                        break
+                    chunk = part['message']['content']
+                    chunks.append(chunk)
+                    if talk_stream is not None and talk_stream.feed(chunk):
+                        on_talk(clamp_text(talk_stream.value, LLM_TALK_MAX_LENGTH))
+            finally:
+                stream.close()  # 응답 스트림(HTTP 연결)을 닫음
+            return {'content': ''.join(chunks)}
+        
+        future = _call_executor.submit(call)
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            message = future.result(timeout=timeout)
+        except TimeoutError:
+            cancelled.set()
+            future.cancel()
+            raise TimeoutError(f"{model}: 마감까지 응답이 없습니다") from None
+        return message, time.time() - start_time
 
     
     
-    def generate_dialogue(self, game: SutdaGame) -> str:
-       
-        talk , inner= '...', '...'
-        is_runpod_ok = True
-        try:
-            # 프롬프트 생성
-            system_prompt, user_prompt = self._build_prompt(game)
+    def generate_dialogue(self, game: 'SutdaGame') -> Tuple[str, str]:
+        """
+        현재 게임 상황에 맞는 NPC 대사를 생성합니다 (동기 호출).
+        
+        Returns:
+            (하는말, 속마음) - 실패하면 NPC 기본 대사
+        """
+        fallback = (game.npc.get_fallback_dialogue('betting'), '...')
+        return self.generate_from_messages(self.build_messages(game), fallback=fallback)
+    
+    def build_messages(self, game: 'SutdaGame') -> list:
+        """
+        현재 게임 상황으로 채팅 메시지를 만듭니다.
+        
+        게임 상태를 읽는 부분이라 메인 스레드에서 호출하고,
+        결과 메시지만 백그라운드 작업(generate_from_messages)에 넘깁니다.
+        """
+        system_prompt, user_prompt = self._build_prompt(game)
+        
+        messages = []
+        if system_prompt:
+            messages.append({'role': 'system', 'content': system_prompt})
+        
+        if user_prompt:
+            messages.append({'role': 'user', 'content': user_prompt})
+        
+        return messages
+    
+    def generate_from_messages(self, messages: list, fallback: Optional[tuple] = None,
+                               deadline: Optional[float] = None, on_talk=None):
+        """
+        채팅 메시지로 대사를 생성합니다.
+        
+        비슷한 상황의 대사가 캐시에 모여 있으면 모델을 호출하지 않고 그중 하나를 씁니다.
+        캐시에 없으면 백엔드 라우터가 정한 순서(정상 백엔드 중 빠른 것 먼저)로 시도하고,
+        연속 실패로 차단된 백엔드는 요청을 보내지 않고 건너뜁니다.
+        모든 백엔드가 마감 하나를 나눠 쓰므로, 남은 시간이 LLM_MIN_ATTEMPT_TIME보다 짧으면
+        다음 백엔드는 시도하지 않습니다 (응답할 시간이 없었던 것을 실패로 기록하지 않음).
+        스트리밍으로 대사 일부를 이미 보여준 뒤 실패하면(마감 초과 등) 다음 백엔드나
+        fallback으로 바꾸지 않고, 받은 데까지의 대사를 마무리해 반환합니다.
+        
+        Args:
+            messages: 채팅 메시지
+            fallback: 대사를 얻지 못했을 때 반환할 (하는말, 속마음)
+            deadline: 이 시각(time.monotonic 기준)까지만 기다림 (호출 중이면 중단, 다음 백엔드도 시도하지 않음)
+            on_talk: 스트리밍 중 '하는말'이 늘어날 때마다 호출할 함수 (지금까지의 대사를 받음)
             
-            messages = []
-            if system_prompt:
-                messages.append({'role': 'system', 'content': system_prompt})
+        Returns:
+            (하는말, 속마음) - 모두 실패하면 받은 데까지의 대사, fallback, ('...', '...') 순
+        """
+        cache_key = self._cache_key(messages)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if on_talk is not None:
+                    on_talk(cached[0])
+                return cached
+        
+        if deadline is None:
+            deadline = time.monotonic() + LLM_DEADLINE
+        
+        # 스트리밍으로 이미 보여준 '하는말' (마지막 값)
+        shown = {'talk': ''}
+        show_talk = None
+        if on_talk is not None:
+            def show_talk(talk):
+                shown['talk'] = talk
+                on_talk(talk)
+        
+        for backend in self.router.select():
+            if deadline - time.monotonic() < LLM_MIN_ATTEMPT_TIME or shown['talk']:
+                break
+            if not self.router.acquire(backend):
+                continue  # 다른 요청이 시험 호출 중
             
-            if user_prompt:
-                messages.append({'role': 'user', 'content': user_prompt})
-
-            # 런팟에서 호출
-            res, _ = self.chat_with_eeve_runpod(messages)
+            try:
+                res, latency = self.backends[backend](messages, on_talk=show_talk, deadline=deadline)
+            except Exception:
+                self.router.record_failure(backend)
+                continue
             
-            content = res['content']
-
-            response_json = json.loads(content)
-            # print(json.dumps(response_json, ensure_ascii=False, indent=4))
-            talk = response_json.get('하는말', '')
-            inner = response_json.get('속마음', '')
+            # 코드 블록, 끊긴 응답 등은 복구하고 '하는말'이 아예 없으면 실패로 기록하고 다음 백엔드 시도
+            parsed = parse_dialogue(res['content'])
+            if parsed is None:
+                self.router.record_failure(backend)
+                continue
+            self.router.record_success(backend, latency)
+            talk, inner = parsed
 
             if talk == "..." or inner == "...":
                 return "...","..."
 
+            if cache_key is not None and talk:
+                self.cache.put(cache_key, talk, inner)
             return talk, inner
-            
-        except Exception as e:
-            is_runpod_ok = False
-
-        try:
-            # 프롬프트 생성
-            system_prompt, user_prompt = self._build_prompt(game)
-            
-            messages = []
-            if system_prompt:
-                messages.append({'role': 'system', 'content': system_prompt})
-            
-            if user_prompt:
-                messages.append({'role': 'user', 'content': user_prompt})
-
-            # 올라마에서 모델 호출
-            res, _ = self.chat_with_eeve(messages)
-            # res, _ = self.chat_with_eeve_runpod(messages)
-            
-            content = res['content']
-
-            response_json = json.loads(content)
-            # print(json.dumps(response_json, ensure_ascii=False, indent=4))
-            talk = response_json.get('하는말', '')
-            inner = response_json.get('속마음', '')
-            
-            return talk, inner
-            
-        except Exception as e:
-            is_runpod_ok = False
 
-        return '...','...'
+        # 대사 일부를 이미 보여줬으면 기본 대사로 바꾸지 않고 받은 데까지 마무리
+        if shown['talk']:
+            return close_partial_text(shown['talk'], LLM_TALK_MAX_LENGTH), '...'
+        return fallback if fallback is not None else ('...', '...')
         
 
+    def _cache_key(self, messages: list) -> Optional[str]:
+        """
+        채팅 메시지로 대사 캐시 키를 만듭니다.
+        
+        페르소나는 시스템 프롬프트 해시로 구분하므로, 프롬프트를 고치면
+        파일에 남아 있던 이전 대사는 자연히 쓰이지 않습니다.
+        """
+        system_prompt = next((m['content'] for m in messages if m.get('role') == 'system'), '')
+        persona = hashlib.sha1(system_prompt.encode('utf-8')).hexdigest()[:12]
+        return parse_cache_key(persona, messages)
     
-    def _build_prompt(self, game: SutdaGame) -> str:
+    def get_system_prompt(self, persona_name: str) -> str:
+        """
+        페르소나의 시스템 프롬프트를 반환합니다.
+        
+        처음 요청한 페르소나만 새로 만들고, 이후에는 캐시된 문자열을 그대로 씁니다.
+        매번 같은 접두어가 전달되므로 Ollama가 이전 요청의 KV 캐시를 재사용할 수 있습니다.
+        """
+        system_prompt = _system_prompts.get(persona_name)
+        if system_prompt is None:
+            system_prompt = self._build_system_prompt(persona_name)
+            _system_prompts[persona_name] = system_prompt
+        return system_prompt
+    
+    def _build_system_prompt(self, selected_persona_name: str) -> str:
+        """페르소나의 시스템 프롬프트를 만듭니다 (get_system_prompt에서 한 번만 호출)."""
 
         # 페르소나 및 입출력 데이터 정의
         # 이 셀은 프롬프트에 사용될 데이터 예시를 정의합니다.
@@ -201,10 +366,6 @@ class LLMHandler:
             }
         }
 
-        # ★★★★★ 여기서 페르소나를 선택하세요 ★★★★★
-        selected_persona_name = game.npc.name
-        # ★★★★★★★★★★★★★★★★★★★★★★★★★★★
-
         # 선택된 페르소나
         persona = personas[selected_persona_name]
 
@@ -310,6 +471,13 @@ class LLMHandler:
         {output2_str}
         """
 
+        return system_prompt
+
+    def _build_prompt(self, game: 'SutdaGame') -> str:
+
+        # 시스템 프롬프트 (페르소나별로 한 번만 만들고 같은 문자열을 재사용)
+        system_prompt = self.get_system_prompt(game.npc.name)
+
         # ========================================
         # 실제 게임 정보로 user_prompt 구성
         # ========================================
@@ -319,7 +487,8 @@ class LLMHandler:
         
         hand_info = HandEvaluator.estimate_hand_for_npc(
             npc_cards=game.npc.cards,
-            player_revealed_cards=game.player.get_revealed_cards()
+            player_revealed_cards=game.player.get_revealed_cards(),
+            npc_revealed_cards=game.npc.get_revealed_cards()
         )
         
         # 현재 상황 파악
@@ -531,35 +700,22 @@ class LLMHandler:
 if __name__ == "__main__":
     print("=== LLM 핸들러 테스트 ===\n")
     
+    from core.game import SutdaGame
+    
     handler = LLMHandler()
     
-    # 테스트 컨텍스트
-    contexts = [
-        {
-            'name': '고니',
-            'persona': '대학 시절 타짜였던 노련한 플레이어',
-            'situation': 'card_received',
-            'mental': 80,
-            'anger': 20
-        },
-        {
-            'name': '고니',
-            'persona': '대학 시절 타짜였던 노련한 플레이어',
-            'situation': 'betting',
-            'mental': 25,
-            'anger': 15
-        },
-        {
-            'name': '고니',
-            'persona': '대학 시절 타짜였던 노련한 플레이어',
-            'situation': 'result_lose',
-            'mental': 40,
-            'anger': 85
-        }
-    ]
+    # 테스트 게임 (1차 베팅, 2차 베팅 상황에서 대사 생성)
+    game = SutdaGame("테스터")
+    game.start_new_game()
+    game.player.reveal_card(0)
+    game.npc.reveal_card(0)
+    game.start_new_betting_phase(0)
     
-    for i, context in enumerate(contexts, 1):
-        dialogue = handler.generate_dialogue(context)
-        print(f"{i}. 상황: {context['situation']}")
-        print(f"   멘탈: {context['mental']}, 분노: {context['anger']}")
-        print(f"   대사: \"{dialogue}\"\n")
+    for i in range(1, 3):
+        talk, inner = handler.generate_dialogue(game)
+        print(f"{i}. 베팅 페이즈: {game.betting_phase + 1}차, NPC 패: {[str(c) for c in game.npc.cards]}")
+        print(f"   하는말: \"{talk}\"")
+        print(f"   속마음: \"{inner}\"\n")
+        
+        if i == 1:
+            game.deal_third_card()
@@ -16,7 +16,8 @@ from config import (
     ANGER_START, ANGER_THRESHOLD
 )
 from core.player import Player
-from core.card import Card
+from core.card import Card, cards_to_mask
+from core.equity import calculate_equity_from_masks
 
 
 class NPCPlayer(Player):
@@ -135,6 +136,9 @@ class NPCPlayer(Player):
         """
         승률을 계산합니다.
         
+        남은 카드를 모두 열거한 정확한 승률(core.equity)을 사용합니다.
+        무승부와 구사 재경기는 판돈이 이월되므로 절반의 승리로 칩니다.
+        
         Args:
             my_hand: 내 족보 정보
             opponent_visible_cards: 상대 공개 카드
@@ -143,62 +147,43 @@ class NPCPlayer(Player):
         Returns:
             승률 (0.0 ~ 1.0)
         """
-        # 상대 패를 계산할 수 없으면 자신의 패만 보고 판단
-        if not self.can_calculate_opponent_hand():
-            # 자신의 족보 랭크만으로 단순 판단
-            if my_hand['rank'] <= 3:  # 삼팔광땡, 광땡, 땡
-                return 0.8
-            elif my_hand['rank'] <= 6:  # 특수 조합
-                return 0.6
-            elif my_hand['rank'] == 10:  # 끗
-                return 0.3 + (my_hand['score'] * 0.05)  # 끗수에 따라
-            else:  # 망통
-                return 0.1
-        
-        # 상대 패를 계산할 수 있으면 더 정확한 판단
-        # (실제로는 더 복잡한 로직이 필요하지만, 기본 구현)
-        
-        # 상대 공개 카드로 추정
-        if len(opponent_visible_cards) > 0:
-            # 상대가 광을 공개했으면 광땡 가능성
-            from config import CARD_TYPE_GWANG
-            if any(card.card_type == CARD_TYPE_GWANG for card in opponent_visible_cards):
-                # 내가 광땡 이상이 아니면 승률 낮춤
-                if my_hand['rank'] > 2:
-                    return 0.3
+        # 카드 없이 족보만 주어진 경우 (테스트 등): 족보 랭크로 추정
+        if len(self.cards) < 2:
+            return self._estimate_win_probability_by_rank(my_hand)
         
-        # 기본 승률 계산
-        base_prob = 0.5
+        # 상대 패를 계산할 수 없으면 상대 공개 카드를 무시하고 자신의 패만 보고 판단
+        opponent_mask = 0
+        if self.can_calculate_opponent_hand():
+            opponent_mask = cards_to_mask(opponent_visible_cards)
         
-        # 내 족보에 따른 보정
+        equity = calculate_equity_from_masks(self.card_mask, opponent_mask)
+        return equity['win'] + (equity['draw'] + equity['rematch']) * 0.5
+    
+    def _estimate_win_probability_by_rank(self, my_hand: Dict) -> float:
+        """카드 정보가 없을 때 족보 랭크만으로 승률을 대략 추정합니다."""
         if my_hand['rank'] == 1:  # 삼팔광땡
-            base_prob = 0.95
+            return 0.95
         elif my_hand['rank'] == 2:  # 광땡
-            base_prob = 0.85
+            return 0.85
         elif my_hand['rank'] == 3:  # 땡
-            base_prob = 0.7 + (my_hand['score'] * 0.02)
+            return 0.7 + (my_hand['score'] * 0.02)
         elif my_hand['rank'] <= 9:  # 특수 조합
-            base_prob = 0.6
+            return 0.6
         elif my_hand['rank'] == 10:  # 끗
-            base_prob = 0.3 + (my_hand['score'] * 0.05)
+            return 0.3 + (my_hand['score'] * 0.05)
         else:  # 망통
-            base_prob = 0.1
-        
-        return base_prob
+            return 0.1
     
-    def choose_card_to_reveal(self, opponent_cards: List[Card]) -> int:
+    def choose_card_to_reveal(self, opponent_revealed: List[Card]) -> int:
         """
         공개할 카드를 선택합니다.
         
         Args:
-            opponent_cards: 상대방의 카드 (공개된 카드 확인용)
+            opponent_revealed: 상대방이 공개한 카드 (Player.get_revealed_cards())
             
         Returns:
             공개할 카드의 인덱스 (0, 1, 2)
         """
-        # 상대방이 공개한 카드 확인
-        opponent_revealed = [card for card in opponent_cards if card.is_revealed]
-        
         # 자신의 카드 평가
         card_values = []
         for i, card in enumerate(self.cards):
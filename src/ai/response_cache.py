@@ -0,0 +1,189 @@
+"""
+NPC 대사 응답 캐시
+비슷한 상황(정규화한 프롬프트)에서 생성한 대사를 저장해 두고 다시 사용합니다.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import json
+import random
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import LLM_CACHE_SIZE, LLM_CACHE_VARIANTS
+
+
+class ResponseCache:
+    """
+    상황 키별로 대사 여러 개(변형)를 저장하는 LRU 캐시
+
+    - 키마다 variants개까지 서로 다른 대사를 모은 뒤부터 캐시에서 응답
+      (그 전에는 모델을 호출해 변형을 채움), 응답은 변형 중 무작위 선택
+    - max_entries개를 넘으면 가장 오래 쓰지 않은 키부터 삭제
+    - path를 주면 JSONL 파일에 추가 기록하고, 다음 실행 때 다시 읽어 들임
+    """
+
+    def __init__(self, max_entries: int = LLM_CACHE_SIZE, variants: int = LLM_CACHE_VARIANTS,
+                 path: Optional[str] = None, rng: Optional[random.Random] = None):
+        """
+        Args:
+            max_entries: 저장할 최대 키 수
+            variants: 키별로 모을 대사 수
+            path: 캐시 파일 경로 (JSONL, None이면 메모리에만 저장)
+            rng: 변형 선택에 사용할 난수 생성기
+        """
+        self.max_entries = max_entries
+        self.variants = variants
+        self.path = path
+        self.rng = rng if rng is not None else random.Random()
+
+        self._entries = OrderedDict()  # 키 → [(하는말, 속마음), ...]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None:
+            self._load()
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        저장된 대사 중 하나를 무작위로 반환합니다.
+
+        Returns:
+            (하는말, 속마음) - 변형이 아직 다 모이지 않았으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or len(entry) < self.variants:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self.rng.choice(entry)
+
+    def put(self, key: str, talk: str, inner: str):
+        """대사를 저장합니다 (같은 대사가 있거나 변형이 다 찼으면 무시)."""
+        with self._lock:
+            if not self._add(key, talk, inner):
+                return
+
+            if self.path is not None:
+                try:
+                    with open(self.path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps({'key': key, 'talk': talk, 'inner': inner},
+                                           ensure_ascii=False) + '\n')
+                except OSError:
+                    pass  # 파일 기록 실패는 메모리 캐시에 영향 없음
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, key: str, talk: str, inner: str) -> bool:
+        """메모리 캐시에 대사를 추가합니다 (잠금 상태에서 호출)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = []
+        self._entries.move_to_end(key)
+
+        if len(entry) >= self.variants or (talk, inner) in entry:
+            return False
+        entry.append((talk, inner))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def _load(self):
+        """캐시 파일을 읽어 메모리 캐시를 채웁니다 (깨진 줄은 건너뜀)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+                self._add(record['key'], record['talk'], record['inner'])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+def normalize_prompt(persona: str, user_prompt_json: dict) -> str:
+    """
+    프롬프트를 캐시 키로 정규화합니다.
+
+    대사에 영향이 큰 항목(페르소나, 상황, 상대 이름, 나의 족보 이름, 상대 예상 족보,
+    공개 카드 수, 판돈 규모)만 남기고 카드 이름과 정확한 판돈은 버립니다.
+    대사가 상대 이름이나 족보("7땡", "5끗")를 직접 말할 수 있으므로 둘은 키에 그대로 넣습니다.
+
+    Args:
+        persona: 페르소나 식별자 (NPC 이름 또는 시스템 프롬프트 해시)
+        user_prompt_json: LLMHandler._build_prompt가 만든 user_prompt 딕셔너리
+
+    Returns:
+        캐시 키 문자열
+    """
+    pot_digits = ''.join(ch for ch in str(user_prompt_json.get("현재판돈", "")) if ch.isdigit())
+    revealed = user_prompt_json.get("공개된패", {})
+    my_hand = user_prompt_json.get("나의최고족보", {})
+
+    # "땡 ~ 끗 가능 (공개: 3월 띠)" → "땡 ~ 끗 가능"
+    opponent = str(user_prompt_json.get("상대의 예상족보", "")).split(" (공개")[0]
+
+    key = {
+        "페르소나": persona,
+        "상황": user_prompt_json.get("상황"),
+        "상대이름": user_prompt_json.get("상대이름"),
+        "족보": my_hand.get("이름"),
+        "상대예상": opponent,
+        "공개수": [len(revealed.get("나", [])), len(revealed.get("상대", []))],
+        "판돈규모": int(pot_digits).bit_length() if pot_digits else 0  # 2배 단위
+    }
+    return json.dumps(key, ensure_ascii=False, sort_keys=True)
+
+
+def parse_cache_key(persona: str, messages: List[dict]) -> Optional[str]:
+    """채팅 메시지의 마지막 user 프롬프트(JSON)로 캐시 키를 만듭니다 (JSON이 아니면 None)."""
+    for message in reversed(messages):
+        if message.get('role') == 'user':
+            try:
+                return normalize_prompt(persona, json.loads(message['content']))
+            except (ValueError, TypeError, AttributeError):
+                return None
+    return None
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 응답 캐시 테스트 ===\n")
+
+    prompt = {
+        "상황": "섯다 초기 베팅 (2장)",
+        "상대이름": "플레이어",
+        "나의패": ["3월 광", "8월 광"],
+        "공개된패": {"나": ["3월 광"], "상대": ["5월 띠"]},
+        "나의최고족보": {"이름": "삼팔광땡", "순위": 1},
+        "상대의 예상족보": "땡 ~ 끗 가능 (공개: 5월 띠)",
+        "현재판돈": "12,000원"
+    }
+    key = normalize_prompt("아귀", prompt)
+    print(f"키: {key}")
+
+    similar = dict(prompt, 나의패=["3월 광", "8월 열끗"], 현재판돈="14,000원")
+    print(f"비슷한 상황 같은 키: {normalize_prompt('아귀', similar) == key}")
+    other_hand = dict(prompt, 나의최고족보={"이름": "9땡", "순위": 2})
+    print(f"족보가 다르면 다른 키: {normalize_prompt('아귀', other_hand) != key}")
+    other_name = dict(prompt, 상대이름="고니")
+    print(f"상대 이름이 다르면 다른 키: {normalize_prompt('아귀', other_name) != key}")
+
+    cache = ResponseCache(variants=2, rng=random.Random(0))
+    print(f"\n변형 1개: {cache.get(key)}")
+    cache.put(key, "한 번 가볼까?", "좋은 패다")
+    print(f"변형 1개 저장 후: {cache.get(key)}")
+    cache.put(key, "따라올 수 있겠어?", "이번 판은 내 거다")
+    print(f"변형 2개 저장 후: {[cache.get(key)[0] for _ in range(4)]}")
+    print(f"적중 {cache.hits}회, 실패 {cache.misses}회")
@@ -0,0 +1,239 @@
+"""
+Ollama 호환 스텁 서버
+실제 모델 없이 /api/chat, /api/generate에 NPC 대사 형식의 응답을 돌려줍니다.
+지연 시간, 스트리밍, 깨진 JSON, 오류 비율을 조절해 오프라인에서 대사 처리 경로
+(백그라운드 생성, 캐시, 기본 대사 대체, 회로 차단)를 시험하고 측정할 수 있습니다.
+
+사용법:
+    python ai/stub_server.py --port 11435 --latency 1.5 --error-rate 0.1
+    LLM_LOCAL_HOST=http://localhost:11435 python main.py
+"""
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+import json
+import random
+import threading
+import time
+
+
+# 응답에 사용할 대사 (속마음, 하는말)
+STUB_LINES = [
+    ("패가 괜찮은데, 티 내지 말자.", "한 번 가볼까?"),
+    ("상대가 겁먹은 것 같다.", "따라올 수 있겠어?"),
+    ("이번 판은 내 거다.", "이 정도면 충분하지."),
+    ("패가 별로네... 블러핑이다.", "더 올려볼까?"),
+    ("조심해야겠다.", "체크!"),
+    ("뭘 들고 있는 거지?", "흠... 재밌네."),
+]
+
+
+class StubConfig:
+    """스텁 서버 동작 설정"""
+
+    def __init__(self, latency: float = 1.0, jitter: float = 0.3, first_token: float = 0.2,
+                 token_delay: float = 0.03, error_rate: float = 0.0, malformed_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            latency: 전체 응답 평균 지연 시간 (초, 스트리밍이 아닐 때)
+            jitter: 지연 시간 표준편차 (초, 정규분포)
+            first_token: 첫 조각까지의 지연 시간 (초, 스트리밍)
+            token_delay: 조각 사이 지연 시간 (초, 스트리밍)
+            error_rate: HTTP 500 오류를 돌려줄 비율 (0.0 ~ 1.0)
+            malformed_rate: 형식이 깨진 응답(끊긴 JSON, 코드 블록, 앞뒤 설명)을 돌려줄 비율 (0.0 ~ 1.0)
+            seed: 난수 시드 (같은 시드와 요청 순서면 같은 응답)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.first_token = first_token
+        self.token_delay = token_delay
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()  # 요청 스레드들이 rng를 공유
+
+    def draw(self) -> Dict:
+        """요청 하나의 동작(오류 여부, 지연 시간, 응답 내용)을 뽑습니다."""
+        with self.lock:
+            inner, talk = self.rng.choice(STUB_LINES)
+            content = json.dumps({'속마음': inner, '하는말': talk}, ensure_ascii=False)
+            if self.rng.random() < self.malformed_rate:
+                content = self._malform(content)
+            return {
+                'error': self.rng.random() < self.error_rate,
+                'latency': max(0.0, self.rng.gauss(self.latency, self.jitter)),
+                'first_token': max(0.0, self.rng.gauss(self.first_token, self.jitter / 4)),
+                'content': content
+            }
+
+    def _malform(self, content: str) -> str:
+        """모델이 자주 내는 형식 오류 중 하나를 적용합니다 (잠금 상태에서 호출)."""
+        kind = self.rng.choice(("truncate", "fence", "chatter"))
+        if kind == "truncate":
+            return content[:self.rng.randint(len(content) // 2, len(content) - 1)]  # 중간에 끊긴 JSON
+        if kind == "fence":
+            return f"```json\n{content}\n```"
+        return f"네, 알겠습니다.\n{content}\n이상입니다."
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Ollama API 요청 처리"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive (클라이언트 연결 풀 재사용)
+    config = StubConfig()
+
+    def log_message(self, format, *args):
+        """요청 로그를 출력하지 않습니다."""
+        pass
+
+    def do_GET(self):
+        if self.path == "/api/version":
+            self._send_json(200, {'version': "0.0.0-stub"})
+        elif self.path == "/api/tags":
+            self._send_json(200, {'models': []})
+        else:
+            self._send_json(404, {'error': "not found"})
+
+    def do_POST(self):
+        if self.path not in ("/api/chat", "/api/generate"):
+            self._send_json(404, {'error': "not found"})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {'error': "invalid request body"})
+            return
+
+        plan = self.config.draw()
+        model = body.get('model', "stub")
+        chat = self.path == "/api/chat"
+        content = plan['content']
+
+        # Ollama와 같이 stream을 지정하지 않으면 스트리밍
+        if not body.get('stream', True):
+            time.sleep(plan['latency'])
+            if plan['error']:
+                self._send_json(500, {'error': "stub: injected server error"})
+                return
+            self._send_json(200, self._chunk(model, chat, content, done=True))
+            return
+
+        time.sleep(plan['first_token'])
+        if plan['error']:
+            self._send_json(500, {'error': "stub: injected server error"})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', "application/x-ndjson")
+        self.send_header('Transfer-Encoding', "chunked")
+        self.end_headers()
+        for i in range(0, len(content), 3):
+            if i > 0:
+                time.sleep(self.config.token_delay)
+            self._write_chunk(self._chunk(model, chat, content[i:i + 3], done=False))
+        self._write_chunk(self._chunk(model, chat, "", done=True))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, model: str, chat: bool, content: str, done: bool) -> Dict:
+        """Ollama 응답 형식의 딕셔너리를 만듭니다."""
+        chunk = {
+            'model': model,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'done': done
+        }
+        if chat:
+            chunk['message'] = {'role': "assistant", 'content': content}
+        else:
+            chunk['response'] = content
+        if done:
+            chunk['done_reason'] = "stop"
+        return chunk
+
+    def _write_chunk(self, data: Dict):
+        """스트리밍 응답 한 줄(NDJSON)을 chunked 인코딩으로 보냅니다."""
+        line = (json.dumps(data, ensure_ascii=False) + "\n").encode('utf-8')
+        self.wfile.write(f"{len(line):x}\r\n".encode('ascii') + line + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, data: Dict):
+        """JSON 응답을 보냅니다."""
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', "application/json; charset=utf-8")
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StubServer:
+    """
+    스텁 서버를 백그라운드 스레드에서 실행합니다 (테스트, 벤치마크용).
+
+    사용 예:
+        with StubServer(StubConfig(latency=0.1, seed=0)) as server:
+            handler.local_host = server.url
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            config: 동작 설정 (None이면 기본값)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        handler = type("ConfiguredStubHandler", (StubHandler,),
+                       {'config': config if config is not None else StubConfig()})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="ollama-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ollama 호환 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=11435, help="포트")
+    parser.add_argument("--latency", type=float, default=1.0, help="평균 지연 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.3, help="지연 시간 표준편차 (초)")
+    parser.add_argument("--first-token", type=float, default=0.2, help="첫 조각 지연 시간 (초)")
+    parser.add_argument("--token-delay", type=float, default=0.03, help="조각 사이 지연 시간 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 비율")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="깨진 JSON 비율")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency, args.jitter, args.first_token, args.token_delay,
+                        args.error_rate, args.malformed_rate, args.seed)
+    server = StubServer(config, args.host, args.port)
+    print(f"=== Ollama 스텁 서버: {server.url} ===")
+    print(f"게임 연결: LLM_LOCAL_HOST={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
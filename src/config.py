@@ -16,6 +16,12 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# 변경된 영역만 화면에 반영 (False면 매 프레임 전체 화면 flip)
+DIRTY_RECT_RENDERING = True
+DIRTY_RECT_LIMIT = 8  # 다시 그릴 영역이 이보다 많으면 하나로 합침
+IDLE_FPS = 15  # 화면이 멈춰 있을 때 프레임 수 (입력이 들어오면 바로 FPS로 복귀)
+IDLE_AFTER_FRAMES = 30  # 이 프레임 수 동안 변화가 없으면 유휴 상태
+
 # ==================== 색상 설정 ====================
 # RGB 색상 코드 (R, G, B)
 
@@ -58,6 +64,9 @@ DEFAULT_START_MONEY = 100000  # 시작 금액 (원)
 DEFAULT_MIN_BET = 1000  # 최소 베팅 금액 (원)
 DEFAULT_BET_TIME = 10  # 베팅 제한 시간 (초)
 
+# 승률 계산 결과 캐시 개수 (내 카드, 상대 공개 카드 조합별, 항목당 수백 바이트)
+EQUITY_CACHE_SIZE = 65536
+
 # ==================== Zone 시스템 설정 ====================
 # Zone 발동 확률 (0.0 ~ 1.0)
 ZONE_BASE_CHANCE = 0.05  # 기본 5%
@@ -72,6 +81,41 @@ ZONE_DURATION = 60
 NPC_STAT_MIN = 1
 NPC_STAT_MAX = 10
 
+# ==================== NPC 프로필 ====================
+# 상대 선택 화면의 NPC 정보와 능력치 (게임 화면과 토너먼트 시뮬레이션에서 공용)
+NPC_PROFILES = [
+    {
+        "name": "호구",
+        "composure": 1,
+        "deception": 1,
+        "boldness": 2,
+        "recovery": 1,
+        "persona": "도박판의 가장 밑바닥",
+        "catchphrase": "그래, 파도! 올라갔으면 내려가고, 내려갔다가 다시 올라가는 거야!",
+        "difficulty": "초급"
+    },
+    {
+        "name": "고광렬",
+        "composure": 3,
+        "deception": 9,
+        "boldness": 7,
+        "recovery": 5,
+        "persona": "대학 시절 타짜였던 노련한 플레이어",
+        "catchphrase": "아유... 뭐 돈 따려고 칩니까? 재미있자고 치는 거지.",
+        "difficulty": "중급"
+    },
+    {
+        "name": "아귀",
+        "composure": 10,
+        "deception": 9,
+        "boldness": 9,
+        "recovery": 10,
+        "persona": "냉철하고 계산적인 베테랑 도박사",
+        "catchphrase": "깨끗이 칩시다. 혹시나 뽀록나면 저 망치로 손모가지 분질러 블랑게.",
+        "difficulty": "고급"
+    }
+]
+
 # ==================== 멘탈/분노 설정 ====================
 # 멘탈 설정
 MENTAL_START = 100  # 시작 멘탈
@@ -99,6 +143,24 @@ FONTS_PATH = f"{ASSETS_PATH}/fonts"
 LLM_MODEL = "eeve"  # Ollama 모델명
 LLM_API_URL = "http://localhost:11434/api/generate"  # Ollama API URL
 LLM_TIMEOUT = 30  # API 타임아웃 (초)
+LLM_LOCAL_HOST = "http://localhost:11434"  # 로컬 Ollama 서버
+LLM_RUNPOD_HOST = "https://{pod_id}-11434.proxy.runpod.net/"  # 런팟 Ollama 프록시 (POD_ID 환경변수)
+LLM_CONNECT_TIMEOUT = 5  # 연결 타임아웃 (초)
+LLM_KEEPALIVE_CONNECTIONS = 2  # 백엔드별로 유지할 연결 수
+LLM_KEEPALIVE_EXPIRY = 300  # 쉬는 연결 유지 시간 (초)
+LLM_KEEP_ALIVE = "30m"  # 모델을 메모리에 유지할 시간 (같은 시스템 프롬프트의 KV 캐시 재사용)
+LLM_NUM_CTX = 4096  # 컨텍스트 길이 (시스템 프롬프트 전체가 잘리지 않도록, 요청마다 같은 값 유지)
+LLM_DEADLINE = 8  # 대사 생성 최대 대기 시간 (초), 넘으면 NPC 기본 대사 사용
+LLM_READ_TIMEOUT = LLM_DEADLINE  # 응답 조각 사이 최대 대기 시간 (초, 응답은 항상 스트리밍으로 받음)
+LLM_MIN_ATTEMPT_TIME = 1.5  # 마감까지 남은 시간이 이보다 짧으면 다음 백엔드를 시도하지 않음 (초)
+LLM_CIRCUIT_FAILURES = 3  # 연속 실패 횟수 (넘으면 백엔드 차단)
+LLM_CIRCUIT_BACKOFF = 5  # 첫 차단 시간 (초), 시험 호출이 실패할 때마다 두 배
+LLM_CIRCUIT_BACKOFF_MAX = 300  # 최대 차단 시간 (초)
+LLM_CACHE_SIZE = 512  # 대사 캐시에 저장할 최대 상황 수
+LLM_CACHE_VARIANTS = 3  # 상황별로 모을 대사 수 (다 모이면 모델 호출 없이 그중 무작위 사용)
+LLM_CACHE_PATH = None  # 대사 캐시 파일 (JSONL, None이면 메모리에만 저장)
+LLM_TALK_MAX_LENGTH = 40  # '하는말' 최대 글자 수 (프롬프트 권장 20자, 넘으면 잘라서 표시)
+LLM_INNER_MAX_LENGTH = 100  # '속마음' 최대 글자 수 (프롬프트 권장 50자)
 LLM_TEMPERATURE = 0.8  # 응답 다양성 (0.0 ~ 1.0)
 
 # ==================== 카드 설정 ====================
@@ -106,6 +168,8 @@ LLM_TEMPERATURE = 0.8  # 응답 다양성 (0.0 ~ 1.0)
 CARD_WIDTH = 100
 CARD_HEIGHT = 150
 CARD_SCALE = 1.0  # 카드 스케일 조정
+CARD_ATLAS_SCALES = (0.2, 0.3, 0.8, 1.0)  # 아틀라스에 미리 만들어 둘 배율 (족보 안내, 조합, 기본 크기)
+CARD_SURFACE_CACHE_SIZE = 128  # 크기별 카드 이미지 캐시 개수 (족보 안내 + 게임 화면에서 쓰는 크기보다 넉넉하게)
 
 # 카드 배치 위치
 CARD_SPACING = 20  # 카드 간 간격
@@ -122,6 +186,9 @@ FONT_SIZE_MEDIUM = 28
 FONT_SIZE_LARGE = 36
 FONT_SIZE_XLARGE = 48
 
+# 렌더링한 텍스트 캐시 개수 (족보 안내 + 게임 화면의 문자열보다 넉넉하게)
+TEXT_CACHE_SIZE = 512
+
 # ==================== 화투 카드 정의 ====================
 # 화투 패 타입
 CARD_TYPE_GWANG = "gwang"  # 광
@@ -165,3 +232,4 @@ CARD_NAMES = {
 # ==================== 디버그 설정 ====================
 DEBUG_MODE = False  # 디버그 모드 (True 시 상대 카드 공개)
 DEBUG_SHOW_FPS = False  # FPS 표시
+DEBUG_GAME_LOG = False  # 베팅 진행 DEBUG 로그 콘솔 출력 (턴 전환, 베팅 종료 판정 등)
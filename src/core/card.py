@@ -4,6 +4,8 @@
 """
 
 import random
+import warnings
+import weakref
 from typing import List, Optional
 import sys
 import os
@@ -17,9 +19,44 @@ from config import (
 )
 
 
+# 카드 ID: 월 오름차순, 월 안에서는 HWATU_CARDS 순서 (0 ~ DECK_SIZE-1)
+CARD_IDS = {}
+for _month in sorted(HWATU_CARDS):
+    for _card_type in HWATU_CARDS[_month]:
+        CARD_IDS[(_month, _card_type)] = len(CARD_IDS)
+DECK_SIZE = len(CARD_IDS)
+
+# 카드 집합 비트마스크: 카드 ID n번 카드 → 1 << n
+FULL_DECK_MASK = (1 << DECK_SIZE) - 1
+
+# 카드를 마지막으로 받은 플레이어 {카드 ID: Player} (Card.reveal/hide/is_revealed 하위 호환용)
+# 카드 인스턴스를 여러 게임이 공유하므로 같은 카드를 동시에 든 게임이 있으면 마지막으로 받은 쪽을 가리킴
+_CARD_HOLDERS = weakref.WeakValueDictionary()
+
+
+def register_card_holder(card: 'Card', player):
+    """카드를 받은 플레이어를 기록합니다 (Player.add_card에서 호출)."""
+    _CARD_HOLDERS[card.id] = player
+
+
+def release_card_holder(card: 'Card', player):
+    """플레이어가 카드를 내려놓았음을 기록합니다 (Player.clear_cards에서 호출)."""
+    if _CARD_HOLDERS.get(card.id) is player:
+        del _CARD_HOLDERS[card.id]
+
+
+def _warn_deprecated(name: str, replacement: str):
+    warnings.warn(f"Card.{name}은(는) 더 이상 사용되지 않습니다. {replacement}을(를) 사용하세요.",
+                  DeprecationWarning, stacklevel=3)
+
+
 class Card:
     """화투 카드 클래스"""
     
+    # 카드 인스턴스는 DECK_CARDS로 모든 게임이 공유하므로 게임별 상태(공개 여부 등)를 두지 않음
+    # (공개 여부는 Player.revealed_mask)
+    __slots__ = ('id', 'mask', 'month', 'card_type')
+    
     def __init__(self, month: int, card_type: str):
         """
         Args:
@@ -36,23 +73,39 @@ class Card:
         if card_type not in HWATU_CARDS[month]:
             raise ValueError(f"{month}월에는 {card_type} 타입이 없습니다")
         
+        self.id = CARD_IDS[(month, card_type)]  # 카드 ID (0 ~ DECK_SIZE-1)
+        self.mask = 1 << self.id  # 카드 집합 비트마스크에서의 비트
         self.month = month
         self.card_type = card_type
-        self.is_revealed = False  # 공개 여부
-    
-    def reveal(self):
-        """카드를 공개합니다."""
-        self.is_revealed = True
-    
-    def hide(self):
-        """카드를 숨깁니다."""
-        self.is_revealed = False
     
     def get_image_path(self) -> str:
         """카드 이미지 경로를 반환합니다."""
         type_code = CARD_TYPE_CODES[self.card_type]
         return f"{CARDS_PATH}/{self.month}{type_code}.png"
     
+    # ---------- 하위 호환 (공개 여부는 카드를 든 Player.revealed_mask에 위임) ----------
+    
+    def reveal(self):
+        """카드를 공개합니다. (deprecated: Player.reveal_card 사용)"""
+        _warn_deprecated('reveal()', 'Player.reveal_card()')
+        holder = _CARD_HOLDERS.get(self.id)
+        if holder is not None:
+            holder.revealed_mask |= self.mask
+    
+    def hide(self):
+        """카드를 숨깁니다. (deprecated: Player.revealed_mask 사용)"""
+        _warn_deprecated('hide()', 'Player.revealed_mask')
+        holder = _CARD_HOLDERS.get(self.id)
+        if holder is not None:
+            holder.revealed_mask &= ~self.mask
+    
+    @property
+    def is_revealed(self) -> bool:
+        """카드 공개 여부 (deprecated: Player.is_card_revealed 사용, 든 플레이어가 없으면 False)"""
+        _warn_deprecated('is_revealed', 'Player.is_card_revealed()')
+        holder = _CARD_HOLDERS.get(self.id)
+        return holder is not None and bool(holder.revealed_mask & self.mask)
+    
     def __str__(self) -> str:
         """카드를 문자열로 표현합니다."""
         type_name = {
@@ -61,41 +114,89 @@ class Card:
             CARD_TYPE_YEOLKKUT: "열끗"
         }
         card_name = CARD_NAMES[self.month]
-        revealed = "공개" if self.is_revealed else "비공개"
-        return f"{card_name}({self.month}월) {type_name[self.card_type]} [{revealed}]"
+        return f"{card_name}({self.month}월) {type_name[self.card_type]}"
     
     def __repr__(self) -> str:
-        return f"Card({self.month}, {self.card_type}, revealed={self.is_revealed})"
+        return f"Card({self.month}, {self.card_type})"
     
     def __eq__(self, other) -> bool:
-        """카드 동등성 비교 (월과 타입만 비교)"""
+        """카드 동등성 비교 (카드 ID 비교)"""
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
-        return self.month == other.month and self.card_type == other.card_type
+        return self.id == other.id
     
     def __hash__(self) -> int:
         """해시 값 반환 (set, dict 사용을 위해)"""
-        return hash((self.month, self.card_type))
+        return self.id
+
+
+# 덱에서 사용하는 카드 인스턴스 (카드 ID 순서, 모듈 로드 시 한 번만 생성)
+DECK_CARDS = tuple(Card(month, card_type) for month, card_type in CARD_IDS)
+
+
+def get_card(card_id: int) -> Card:
+    """카드 ID에 해당하는 덱 카드 인스턴스를 반환합니다."""
+    return DECK_CARDS[card_id]
+
+
+def cards_to_mask(cards) -> int:
+    """카드 목록을 비트마스크로 변환합니다."""
+    mask = 0
+    for card in cards:
+        mask |= card.mask
+    return mask
+
+
+def mask_to_ids(mask: int) -> List[int]:
+    """비트마스크에 포함된 카드 ID를 오름차순으로 반환합니다."""
+    ids = []
+    while mask:
+        low_bit = mask & -mask
+        ids.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return ids
 
 
 class Deck:
-    """화투 덱 클래스 (20장)"""
+    """
+    화투 덱 클래스 (20장)
+    
+    카드 ID 배열(_order)과 다음에 뽑을 위치(_cursor)로 덱을 표현합니다.
+    리셋은 배열을 제자리에서 섞고 커서를 되돌리는 것뿐이라 카드를 새로 만들지 않습니다.
+    """
     
-    def __init__(self):
-        """덱을 생성하고 초기화합니다."""
-        self.cards: List[Card] = []
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        덱을 생성하고 초기화합니다.
+        
+        Args:
+            rng: 섞기에 사용할 난수 생성기 (None이면 독립적인 random.Random 생성)
+                 게임마다 시드를 준 생성기를 넘기면 같은 시드에서 같은 패가 나옵니다.
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self._order: List[int] = list(range(DECK_SIZE))  # 카드 ID 배열
+        self._cursor = 0  # 다음에 뽑을 위치 (앞쪽은 이미 뽑은 카드)
         self._initialize_deck()
     
+    @property
+    def cards(self) -> List[Card]:
+        """남은 카드 목록 (다음에 뽑힐 카드가 마지막)"""
+        return [DECK_CARDS[card_id] for card_id in reversed(self._order[self._cursor:])]
+    
     def _initialize_deck(self):
-        """덱을 초기화합니다 (20장 생성)."""
-        self.cards = []
-        for month in range(1, 11):
-            for card_type in HWATU_CARDS[month]:
-                self.cards.append(Card(month, card_type))
+        """덱을 초기화합니다 (20장, 미리 만든 카드 인스턴스를 재사용)."""
+        self._cursor = 0
     
     def shuffle(self):
-        """덱을 섞습니다."""
-        random.shuffle(self.cards)
+        """남은 카드를 섞습니다."""
+        if self._cursor == 0:
+            self.rng.shuffle(self._order)
+        else:
+            remaining = self._order[self._cursor:]
+            self.rng.shuffle(remaining)
+            self._order[self._cursor:] = remaining
     
     def draw(self) -> Optional[Card]:
         """
@@ -104,9 +205,11 @@ class Deck:
         Returns:
             뽑은 카드 (덱이 비어있으면 None)
         """
-        if len(self.cards) == 0:
+        if self._cursor >= DECK_SIZE:
             return None
-        return self.cards.pop()
+        card_id = self._order[self._cursor]
+        self._cursor += 1
+        return DECK_CARDS[card_id]
     
     def draw_multiple(self, count: int) -> List[Card]:
         """
@@ -132,17 +235,24 @@ class Deck:
     
     def remaining_count(self) -> int:
         """남은 카드 수를 반환합니다."""
-        return len(self.cards)
+        return DECK_SIZE - self._cursor
+    
+    def remaining_mask(self) -> int:
+        """남은 카드의 비트마스크를 반환합니다."""
+        mask = 0
+        for card_id in self._order[self._cursor:]:
+            mask |= 1 << card_id
+        return mask
     
     def __len__(self) -> int:
         """덱의 카드 수를 반환합니다."""
-        return len(self.cards)
+        return DECK_SIZE - self._cursor
     
     def __str__(self) -> str:
-        return f"Deck(남은 카드: {len(self.cards)}장)"
+        return f"Deck(남은 카드: {len(self)}장)"
     
     def __repr__(self) -> str:
-        return f"Deck(cards={len(self.cards)})"
+        return f"Deck(cards={len(self)})"
 
 
 def get_card_image_path(month: int, card_type: str) -> str:
@@ -175,7 +285,6 @@ if __name__ == "__main__":
     print(f"  {card1}")
     
     card2 = Card(8, CARD_TYPE_GWANG)
-    card2.reveal()
     print(f"  {card2}")
     
     # 덱 생성 및 섞기 테스트
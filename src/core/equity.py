@@ -0,0 +1,252 @@
+"""
+승률(에퀴티) 계산
+보이는 카드와 남은 카드를 모두 열거해 정확한 승/무/재경기 확률을 구합니다.
+"""
+
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Dict, Iterable
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.card import Card, DECK_SIZE, FULL_DECK_MASK, cards_to_mask, mask_to_ids
+from config import EQUITY_CACHE_SIZE
+from core.hand_evaluator import (
+    PAIR_COUNT, MATCHUP_TABLE,
+    MATCH_DRAW, MATCH_WIN, MATCH_LOSE, MATCH_REMATCH,
+    pair_key, best_pair_key
+)
+
+
+# 쇼다운 시 각자 가진 카드 수
+FINAL_HAND_SIZE = 3
+
+# 재경기 플래그가 붙은 결과는 모두 MATCH_REMATCH 하나로 모음
+_OUTCOME_CODES = bytes(
+    MATCH_REMATCH if code & MATCH_REMATCH else code
+    for code in range(256)
+)
+
+# 대결표 한 행(내 조합 키 기준)을 bytes.translate용 256바이트 테이블로 변환
+# 상대 조합 키 목록을 translate하면 대결 결과 코드 목록이 한 번에 나옵니다.
+_ROW_TABLES = tuple(
+    (MATCHUP_TABLE[key * PAIR_COUNT:(key + 1) * PAIR_COUNT] + bytes(256 - PAIR_COUNT)).translate(_OUTCOME_CODES)
+    for key in range(PAIR_COUNT)
+)
+
+
+# 3장의 최고 조합 키 (인덱스 (a * DECK_SIZE + b) * DECK_SIZE + c, 카드 순서와 무관)
+# 열거 루프에서 함수 호출 없이 인덱스 계산만으로 조합 키를 꺼냅니다.
+_TRIPLE_BEST_KEYS = bytes(
+    best_pair_key(a, b, c) if len({a, b, c}) == FINAL_HAND_SIZE else 0
+    for a in range(DECK_SIZE) for b in range(DECK_SIZE) for c in range(DECK_SIZE)
+)
+
+
+def _final_pair_key(indices) -> int:
+    """2장 또는 3장(카드 인덱스)의 최고 조합 키를 반환합니다."""
+    if len(indices) == 2:
+        return pair_key(indices[0], indices[1])
+    return _TRIPLE_BEST_KEYS[(indices[0] * DECK_SIZE + indices[1]) * DECK_SIZE + indices[2]]
+
+
+def _opponent_keys(revealed: tuple, unseen: List[int]) -> bytes:
+    """상대의 미공개 카드를 unseen에서 채우는 모든 경우의 최고 조합 키를 구합니다 (bytes)."""
+    keys = _TRIPLE_BEST_KEYS
+    need = FINAL_HAND_SIZE - len(revealed)
+
+    if need == 3:
+        return bytes([keys[(a * DECK_SIZE + b) * DECK_SIZE + c] for a, b, c in combinations(unseen, 3)])
+    if need == 2:
+        base = revealed[0] * DECK_SIZE * DECK_SIZE
+        return bytes([keys[base + a * DECK_SIZE + b] for a, b in combinations(unseen, 2)])
+    if need == 1:
+        base = (revealed[0] * DECK_SIZE + revealed[1]) * DECK_SIZE
+        return bytes([keys[base + a] for a in unseen])
+    return bytes([_final_pair_key(revealed)])
+
+
+def _count_outcomes(opponent_keys: bytes, my_key: int, counts: List[int], sign: int = 1):
+    """상대 조합 키 목록과 내 조합의 대결 결과를 counts에 누적합니다."""
+    outcomes = opponent_keys.translate(_ROW_TABLES[my_key])
+    win = outcomes.count(MATCH_WIN)
+    lose = outcomes.count(MATCH_LOSE)
+    draw = outcomes.count(MATCH_DRAW)
+    counts[0] += sign * win
+    counts[1] += sign * lose
+    counts[2] += sign * draw
+    counts[3] += sign * (len(outcomes) - win - lose - draw)
+
+
+def calculate_equity(my_cards: List[Card], opponent_revealed: Iterable[Card] = ()) -> Dict:
+    """
+    쇼다운까지 남은 모든 경우를 열거해 정확한 승률을 계산합니다.
+
+    상대의 미공개 카드와 아직 받지 않은 3번째 카드(양쪽 모두)를 남은 카드에서
+    전부 열거하고, 양쪽 모두 최고 조합을 고른다고 가정합니다.
+
+    Args:
+        my_cards: 내 카드 (2장 또는 3장)
+        opponent_revealed: 상대가 공개한 카드
+
+    Returns:
+        {
+            'win': float,  # 승리 확률
+            'lose': float,  # 패배 확률
+            'draw': float,  # 무승부 확률
+            'rematch': float,  # 구사 재경기 확률
+            'outcomes': int  # 열거한 경우의 수
+        }
+    """
+    return calculate_equity_from_masks(cards_to_mask(my_cards), cards_to_mask(opponent_revealed))
+
+
+def calculate_equity_from_masks(my_mask: int, opponent_revealed_mask: int = 0) -> Dict:
+    """
+    카드 비트마스크로 승률을 계산합니다 (calculate_equity와 같은 결과).
+
+    Player.card_mask / Player.revealed_mask를 그대로 넘기면 카드 목록을
+    다시 만들지 않고 남은 카드를 비트 연산으로 구합니다.
+
+    Args:
+        my_mask: 내 카드 비트마스크 (2장 또는 3장)
+        opponent_revealed_mask: 상대가 공개한 카드 비트마스크
+    """
+    if my_mask & opponent_revealed_mask:
+        raise ValueError("내 카드와 상대 공개 카드가 겹칩니다")
+
+    counts = _EQUITY_TABLE.get((my_mask << DECK_SIZE) | opponent_revealed_mask)
+    if counts is None:
+        if opponent_revealed_mask == 0 and bin(my_mask).count('1') == 2:
+            # 공개 카드가 없는 2장은 미리 계산한 표에서 바로 꺼냄
+            counts = _NO_REVEAL_PAIR_COUNTS[pair_key(*mask_to_ids(my_mask))]
+        else:
+            counts = _count_equity(my_mask, opponent_revealed_mask)
+    total = sum(counts)
+    if total == 0:
+        return {'win': 0.0, 'lose': 0.0, 'draw': 0.0, 'rematch': 0.0, 'outcomes': 0}
+
+    return {
+        'win': counts[0] / total,
+        'lose': counts[1] / total,
+        'draw': counts[2] / total,
+        'rematch': counts[3] / total,
+        'outcomes': total
+    }
+
+
+@lru_cache(maxsize=EQUITY_CACHE_SIZE)
+def _count_equity(my_mask: int, opponent_revealed_mask: int) -> tuple:
+    """
+    (승, 패, 무, 재경기) 경우의 수를 셉니다.
+
+    결과는 두 마스크로만 정해지므로 최근 EQUITY_CACHE_SIZE개를 캐시합니다.
+    (시뮬레이션에서 같은 상황이 반복될 때 열거를 다시 하지 않음)
+    """
+    return _enumerate_equity(my_mask, opponent_revealed_mask)
+
+
+def _enumerate_equity(my_mask: int, opponent_revealed_mask: int) -> tuple:
+    """남은 카드를 모두 열거해 (승, 패, 무, 재경기) 경우의 수를 셉니다."""
+    mine = tuple(mask_to_ids(my_mask))
+    revealed = tuple(mask_to_ids(opponent_revealed_mask))
+
+    if not 2 <= len(mine) <= FINAL_HAND_SIZE:
+        raise ValueError(f"내 카드는 2~{FINAL_HAND_SIZE}장이어야 합니다: {len(mine)}")
+    if len(revealed) > FINAL_HAND_SIZE:
+        raise ValueError(f"상대 공개 카드는 {FINAL_HAND_SIZE}장 이하여야 합니다: {len(revealed)}")
+
+    unseen = mask_to_ids(FULL_DECK_MASK & ~(my_mask | opponent_revealed_mask))
+    all_keys = _opponent_keys(revealed, unseen)
+
+    # counts: [승, 패, 무, 재경기]
+    counts = [0, 0, 0, 0]
+
+    if len(mine) == FINAL_HAND_SIZE:
+        _count_outcomes(all_keys, _final_pair_key(mine), counts)
+    else:
+        # 내 3번째 카드를 열거하고, 그 카드를 쓰는 상대 경우(그 카드를 공개한 것처럼 열거)는 빼줍니다.
+        for third in unseen:
+            my_key = _final_pair_key(mine + (third,))
+            _count_outcomes(all_keys, my_key, counts)
+            if len(revealed) < FINAL_HAND_SIZE:
+                rest = [index for index in unseen if index != third]
+                _count_outcomes(_opponent_keys(revealed + (third,), rest), my_key, counts, sign=-1)
+
+    return tuple(counts)
+
+
+def _build_no_reveal_pair_counts() -> tuple:
+    """
+    상대 공개 카드가 없을 때 내 2장 190가지의 (승, 패, 무, 재경기) 경우의 수 표를 만듭니다.
+
+    첫 베팅에서 가장 자주 묻는 상황이고 열거가 가장 큰 경우(상대 3장을 모두 열거)라
+    모듈 로드 시 한 번만 계산해 둡니다. 인덱스는 조합 키(pair_key)입니다.
+    """
+    table = [None] * PAIR_COUNT
+    for first, second in combinations(range(DECK_SIZE), 2):
+        table[pair_key(first, second)] = _enumerate_equity((1 << first) | (1 << second), 0)
+    return tuple(table)
+
+
+def precompute_equity():
+    """
+    상대 공개 카드가 0~1장인 모든 상황(내 2장/3장)의 경우의 수를 표로 만들어 둡니다.
+
+    약 2만 4천 가지로 한 번 만드는 데 1~2초 걸리지만, 이후 승률 조회는 열거 없이
+    표에서 바로 꺼냅니다. 헤드리스 시뮬레이션처럼 많은 판을 돌릴 때 한 번 호출합니다.
+    (여러 번 호출해도 처음 한 번만 계산)
+    """
+    if _EQUITY_TABLE:
+        return
+
+    table = {}
+    for size in (2, FINAL_HAND_SIZE):
+        for mine in combinations(range(DECK_SIZE), size):
+            my_mask = sum(1 << index for index in mine)
+            table[my_mask << DECK_SIZE] = _enumerate_equity(my_mask, 0)
+            for revealed in range(DECK_SIZE):
+                if not my_mask >> revealed & 1:
+                    table[(my_mask << DECK_SIZE) | (1 << revealed)] = _enumerate_equity(my_mask, 1 << revealed)
+    _EQUITY_TABLE.update(table)
+
+
+# 모듈 로드 시 한 번만 생성
+_NO_REVEAL_PAIR_COUNTS = _build_no_reveal_pair_counts()
+
+# precompute_equity()로 채우는 전체 상황 표 {(내 마스크 << DECK_SIZE) | 상대 공개 마스크: 경우의 수}
+_EQUITY_TABLE = {}
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import time
+    from config import CARD_TYPE_GWANG, CARD_TYPE_TTI, CARD_TYPE_YEOLKKUT
+
+    print("=== 승률 계산 테스트 ===\n")
+
+    test_cases = [
+        ([Card(3, CARD_TYPE_GWANG), Card(8, CARD_TYPE_GWANG)], [Card(1, CARD_TYPE_GWANG)], "삼팔광땡"),
+        ([Card(9, CARD_TYPE_YEOLKKUT), Card(9, CARD_TYPE_TTI)], [Card(3, CARD_TYPE_TTI)], "9땡"),
+        ([Card(5, CARD_TYPE_YEOLKKUT), Card(5, CARD_TYPE_TTI)], [Card(1, CARD_TYPE_GWANG)], "5땡 (망통 가능)"),
+        ([Card(2, CARD_TYPE_TTI), Card(10, CARD_TYPE_TTI),
+          Card(7, CARD_TYPE_TTI)], [Card(4, CARD_TYPE_TTI)], "3장 (9끗)"),
+        ([Card(1, CARD_TYPE_GWANG), Card(3, CARD_TYPE_GWANG)], [], "1·3광땡 (공개 없음, 미리 계산한 표)"),
+    ]
+
+    for i, (mine, revealed, label) in enumerate(test_cases, 1):
+        start = time.perf_counter()
+        equity = calculate_equity(mine, revealed)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{i}. {label}")
+        print(f"   승 {equity['win']*100:.1f}% | 패 {equity['lose']*100:.1f}% | "
+              f"무 {equity['draw']*100:.1f}% | 재경기 {equity['rematch']*100:.1f}%")
+        print(f"   경우의 수: {equity['outcomes']}, 계산 시간: {elapsed:.3f}ms\n")
+
+    # 미리 계산한 표와 직접 열거가 같은지 확인
+    mismatches = sum(
+        _NO_REVEAL_PAIR_COUNTS[pair_key(a, b)] != _enumerate_equity((1 << a) | (1 << b), 0)
+        for a, b in combinations(range(DECK_SIZE), 2)
+    )
+    print(f"공개 없음 표 190개 검증: 불일치 {mismatches}개")
@@ -4,6 +4,7 @@
 """
 
 import time
+import random
 from typing import List, Dict, Optional, Tuple
 import sys
 import os
@@ -11,14 +12,15 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     DEFAULT_ROUNDS, DEFAULT_START_MONEY, DEFAULT_MIN_BET, DEFAULT_BET_TIME,
-    CARD_TYPE_PRIORITY
+    CARD_TYPE_PRIORITY, DEBUG_GAME_LOG
+)
+from core.card import Card, Deck, DECK_CARDS
+from core.hand_evaluator import (
+    HandEvaluator, MATCH_WIN, MATCH_LOSE, MATCH_REMATCH, THREE_CARD_COMBOS
 )
-from core.card import Card, Deck
-from core.hand_evaluator import HandEvaluator
 from core.player import Player, HumanPlayer
 from core.zone import ZoneSystem
 from ai.npc import NPCPlayer
-from ai.llm_handler import LLMHandler
 
 
 class GameState:
@@ -49,14 +51,23 @@ class SutdaGame:
     """섯다 게임 메인 클래스"""
     
     def __init__(self, player_name: str = "플레이어", 
-                 npc: Optional[NPCPlayer] = None):
+                 npc: Optional[NPCPlayer] = None,
+                 seed: Optional[int] = None,
+                 headless: bool = False,
+                 dialogue_provider=None):
         """
         게임을 초기화합니다.
         
         Args:
             player_name: 플레이어 이름
             npc: NPC 플레이어 (None이면 기본 NPC 생성)
+            seed: 카드 섞기 난수 시드 (None이면 매번 다른 패, 같은 시드면 같은 패)
+            headless: True면 콘솔 출력과 LLM 없이 규칙만 실행 (시뮬레이션용)
+            dialogue_provider: NPC 대사 생성기 (build_messages, generate_from_messages 제공)
+                None이면 처음 대사가 필요할 때 LLMHandler를 불러와 생성
         """
+        self.headless = headless
+        
         # 플레이어 생성
         self.player = HumanPlayer(player_name, DEFAULT_START_MONEY)
         
@@ -83,7 +94,8 @@ class SutdaGame:
         
         # 게임 상태
         self.state = GameState.MAIN_TITLE
-        self.deck = Deck()
+        self.rng = random.Random(seed)  # 게임마다 독립적인 난수 생성기
+        self.deck = Deck(self.rng)
         self.pot = 0  # 판돈
         self.carried_pot = 0  # 무승부로 이월된 판돈
         self.first_player = None  # 선 (먼저 베팅하는 사람)
@@ -111,7 +123,8 @@ class SutdaGame:
         
         # 시스템
         self.zone = ZoneSystem()
-        self.llm = LLMHandler()
+        self._llm = dialogue_provider  # 대사 생성기 (llm 속성에서 처음 사용할 때 생성)
+        self._llm_unavailable = False  # LLM 모듈을 불러오지 못함
         self.evaluator = HandEvaluator()
         
         # 현재 족보
@@ -124,6 +137,32 @@ class SutdaGame:
         self.player_selected_combo_index = None  # 플레이어가 선택한 조합 인덱스
         self.npc_selected_combo_index = None  # NPC가 선택한 조합 인덱스
     
+    @property
+    def llm(self):
+        """
+        NPC 대사 생성기를 반환합니다.
+        
+        LLM 모듈(ollama, httpx 등)은 불러오는 데 시간이 걸리므로 처음 사용할 때 불러옵니다.
+        헤드리스 모드이거나 모듈을 불러올 수 없으면 None (NPC 기본 대사 사용).
+        """
+        if self._llm is None and not self.headless and not self._llm_unavailable:
+            try:
+                from ai.llm_handler import LLMHandler
+                self._llm = LLMHandler()
+            except ImportError as e:
+                self._llm_unavailable = True
+                self._log(f"LLM 모듈을 불러올 수 없어 기본 대사를 사용합니다: {e}")
+        return self._llm
+    
+    @llm.setter
+    def llm(self, provider):
+        self._llm = provider
+    
+    def _log(self, *args):
+        """진행 상황을 콘솔에 출력합니다 (헤드리스 모드에서는 출력하지 않음)."""
+        if not self.headless:
+            print(*args)
+    
     def start_new_game(self):
         """새 게임을 시작합니다."""
         self.current_round = 0
@@ -151,7 +190,7 @@ class SutdaGame:
         if self.carried_pot > 0:
             self.pot = self.carried_pot
             self.carried_pot = 0  # 이월 판돈 초기화
-            print(f"\n이전 라운드 무승부로 {self.pot:,}원이 묻혔습니다!")
+            self._log(f"\n이전 라운드 무승부로 {self.pot:,}원이 묻혔습니다!")
         else:
             self.pot = 0
             
@@ -161,7 +200,7 @@ class SutdaGame:
                 self.pot += ante
             if self.npc.bet(ante):
                 self.pot += ante
-            print(f"\n기본 판돈: {self.pot:,}원 (각자 {ante:,}원씩)")
+            self._log(f"\n기본 판돈: {self.pot:,}원 (각자 {ante:,}원씩)")
 
         
         self.last_bet_amount = 0
@@ -193,22 +232,18 @@ class SutdaGame:
         # 카드 선택 단계로 이동
         self.state = GameState.CARD_SELECTION
         
-        print(f"\n{'='*50}")
-        print(f"라운드 {self.current_round}/{self.total_rounds}")
-        print(f"{'='*50}")
-        print(f"선: {self.first_player.name}")
-        print(f"{self.player.name}: {self.player.money:,}원")
-        print(f"{self.npc.name}: {self.npc.money:,}원")
+        self._log(f"\n{'='*50}")
+        self._log(f"라운드 {self.current_round}/{self.total_rounds}")
+        self._log(f"{'='*50}")
+        self._log(f"선: {self.first_player.name}")
+        self._log(f"{self.player.name}: {self.player.money:,}원")
+        self._log(f"{self.npc.name}: {self.npc.money:,}원")
     
     def _determine_first_player(self):
         """선을 결정합니다."""
         if self.current_round == 1:
-            # 첫 판: 랜덤 카드로 결정
-            temp_deck = Deck()
-            temp_deck.shuffle()
-            
-            player_card = temp_deck.draw()
-            npc_card = temp_deck.draw()
+            # 첫 판: 랜덤 카드로 결정 (서로 다른 카드 2장)
+            player_card, npc_card = self.rng.sample(DECK_CARDS, 2)
             
             # 월 비교
             if player_card.month > npc_card.month:
@@ -255,7 +290,8 @@ class SutdaGame:
             'bet_history': []
         }
         
-        print(f"DEBUG: 베팅 프로세스 초기화 - 선: {self.first_player.name}, 순서: {players_order}")
+        if DEBUG_GAME_LOG:
+            self._log(f"DEBUG: 베팅 프로세스 초기화 - 선: {self.first_player.name}, 순서: {players_order}")
     
     def get_current_turn_player(self):
         """현재 턴 플레이어를 반환합니다."""
@@ -280,7 +316,8 @@ class SutdaGame:
         ) % len(self.betting_process_this_round['players'])
         
         next_player = self.get_current_turn_player()
-        print(f"DEBUG: 턴 전환 → {next_player.name}의 차례")
+        if DEBUG_GAME_LOG:
+            self._log(f"DEBUG: 턴 전환 → {next_player.name}의 차례")
     
     def start_new_betting_phase(self, phase: int):
         """새로운 베팅 페이즈를 시작합니다."""
@@ -294,7 +331,8 @@ class SutdaGame:
         # 턴 인덱스를 first_player로 리셋
         self.betting_process_this_round['current_turn_index'] = 0
         
-        print(f"DEBUG: {phase + 1}차 베팅 시작 - {self.get_current_turn_player().name}부터")
+        if DEBUG_GAME_LOG:
+            self._log(f"DEBUG: {phase + 1}차 베팅 시작 - {self.get_current_turn_player().name}부터")
     
     def _deal_initial_cards(self):
 
@@ -332,7 +370,7 @@ class SutdaGame:
         """3번째 카드를 배분합니다 (1차 베팅 후)."""
         # 이미 3장 이상이면 배분하지 않음
         if len(self.player.cards) >= 3:
-            print("이미 3장의 카드를 보유하고 있습니다.")
+            self._log("이미 3장의 카드를 보유하고 있습니다.")
             return
         
         # 플레이어에게 1장
@@ -353,8 +391,8 @@ class SutdaGame:
             'npc_cards': [str(c) for c in self.npc.cards]
         })
         
-        print(f"\n3번째 카드가 배분되었습니다.")
-        print(f"2차 베팅을 시작합니다!")
+        self._log(f"\n3번째 카드가 배분되었습니다.")
+        self._log(f"2차 베팅을 시작합니다!")
         
         # # NPC 발화
         # if self.npc.should_speak():
@@ -391,7 +429,7 @@ class SutdaGame:
         self.npc_has_acted = False
         self.state = GameState.BETTING
         
-        print(f"\n--- 1차 베팅 ---")
+        self._log(f"\n--- 1차 베팅 ---")
         
         # 2장 중 1장 공개 필요
         # (UI에서 처리, 여기서는 자동으로 첫 번째 카드 공개)
@@ -414,7 +452,7 @@ class SutdaGame:
             self.player.money,
             is_special
         ):
-            print(f"\n⚡ Zone 발동! ⚡")
+            self._log(f"\n⚡ Zone 발동! ⚡")
             self.state = GameState.ZONE_ACTIVE    
     
     def start_second_betting(self):
@@ -426,7 +464,7 @@ class SutdaGame:
         self.npc_has_acted = False
         self.state = GameState.BETTING
         
-        print(f"\n--- 2차 베팅 (최종) ---")
+        self._log(f"\n--- 2차 베팅 (최종) ---")
         
         # Zone 발동 체크
         self._check_zone_activation()
@@ -446,7 +484,7 @@ class SutdaGame:
         # 현재 턴 플레이어 확인
         current_turn_player = self.get_current_turn_player()
         if player != current_turn_player:
-            print(f"ERROR: {player.name}의 차례가 아닙니다! (현재: {current_turn_player.name})")
+            self._log(f"ERROR: {player.name}의 차례가 아닙니다! (현재: {current_turn_player.name})")
             return False
         
         # 액션 기록 (레거시)
@@ -481,12 +519,12 @@ class SutdaGame:
             player.fold()
             bet_record['amount'] = 0
             self.bet_history.append((player.name, action_names[action], 0))
-            print(f"{player.name}: 다이")
+            self._log(f"{player.name}: 다이")
             
         elif action == BetAction.CHECK:
             bet_record['amount'] = 0
             self.bet_history.append((player.name, action_names[action], 0))
-            print(f"{player.name}: 체크")
+            self._log(f"{player.name}: 체크")
             self.check_count += 1
             
         elif action == BetAction.PPING:
@@ -510,7 +548,7 @@ class SutdaGame:
                     if self.npc_current_bet > self.player_current_bet:
                         is_raise = True
                 self.bet_history.append((player.name, action_names[action], self.min_bet))
-                print(f"{player.name}: 삥 ({self.min_bet:,}원)")
+                self._log(f"{player.name}: 삥 ({self.min_bet:,}원)")
             else:
                 return False
         
@@ -536,7 +574,7 @@ class SutdaGame:
                     if self.npc_current_bet > self.player_current_bet:
                         is_raise = True
                 self.bet_history.append((player.name, action_names[action], half_amount))
-                print(f"{player.name}: 하프 ({half_amount:,}원)")
+                self._log(f"{player.name}: 하프 ({half_amount:,}원)")
             else:
                 return False
         
@@ -554,7 +592,7 @@ class SutdaGame:
             if call_amount == 0:
                 bet_record['amount'] = 0
                 self.bet_history.append((player.name, action_names[action], 0))
-                print(f"{player.name}: 콜 (이미 베팅액 동일)")
+                self._log(f"{player.name}: 콜 (이미 베팅액 동일)")
                 # 베팅 히스토리에 기록
                 self.betting_process_this_round['bet_history'].append(bet_record)
                 # 턴 전환하지 않음 (베팅 완료)
@@ -572,7 +610,7 @@ class SutdaGame:
                 self.last_bet_player = player
                 self.check_count = 0
                 self.bet_history.append((player.name, action_names[action], call_amount))
-                print(f"{player.name}: 콜 ({call_amount:,}원)")
+                self._log(f"{player.name}: 콜 ({call_amount:,}원)")
             else:
                 return False
         
@@ -598,7 +636,7 @@ class SutdaGame:
                     if self.npc_current_bet > self.player_current_bet:
                         is_raise = True
                 self.bet_history.append((player.name, action_names[action], allin_amount))
-                print(f"{player.name}: 올인 ({allin_amount:,}원)!")
+                self._log(f"{player.name}: 올인 ({allin_amount:,}원)!")
             else:
                 return False
         
@@ -609,10 +647,12 @@ class SutdaGame:
         if is_raise:
             if player == self.player:
                 self.npc_has_acted = False
-                print(f"DEBUG: 플레이어가 레이즈 → NPC has_acted 리셋")
+                if DEBUG_GAME_LOG:
+                    self._log(f"DEBUG: 플레이어가 레이즈 → NPC has_acted 리셋")
             else:
                 self.player_has_acted = False
-                print(f"DEBUG: NPC가 레이즈 → 플레이어 has_acted 리셋")
+                if DEBUG_GAME_LOG:
+                    self._log(f"DEBUG: NPC가 레이즈 → 플레이어 has_acted 리셋")
         
         # ★★★ 핵심: 턴 전환
         self.advance_turn()
@@ -629,8 +669,9 @@ class SutdaGame:
         if action not in [BetAction.CHECK, BetAction.DIE]:
             self.betting_round_count += 1
         
-        print(f"현재 판돈: {self.pot:,}원")
-        print(f"DEBUG: 베팅 기록 수: {len(self.betting_process_this_round['bet_history'])}")
+        self._log(f"현재 판돈: {self.pot:,}원")
+        if DEBUG_GAME_LOG:
+            self._log(f"DEBUG: 베팅 기록 수: {len(self.betting_process_this_round['bet_history'])}")
         
         return True
     
@@ -638,33 +679,39 @@ class SutdaGame:
         """베팅이 완료되었는지 확인합니다."""
         # 한쪽이 다이했으면 종료
         if self.player.has_folded or self.npc.has_folded:
-            print(f"DEBUG: 베팅 종료 - 다이 (플레이어 폴드: {self.player.has_folded}, NPC 폴드: {self.npc.has_folded})")
+            if DEBUG_GAME_LOG:
+                self._log(f"DEBUG: 베팅 종료 - 다이 (플레이어 폴드: {self.player.has_folded}, NPC 폴드: {self.npc.has_folded})")
             return True
         
         # 둘 다 액션을 했는지 확인 - 아직 액션 안했으면 계속 진행
         if not (self.player_has_acted and self.npc_has_acted):
-            print(f"DEBUG: 베팅 진행 중 - 플레이어 액션: {self.player_has_acted}, NPC 액션: {self.npc_has_acted}")
+            if DEBUG_GAME_LOG:
+                self._log(f"DEBUG: 베팅 진행 중 - 플레이어 액션: {self.player_has_acted}, NPC 액션: {self.npc_has_acted}")
             return False
         
         # 둘 다 액션한 경우에만 아래 체크
         
         # 양쪽 모두 체크했으면 종료
         if self.check_count >= 2:
-            print(f"DEBUG: 베팅 종료 - 양쪽 체크 (체크 카운트: {self.check_count})")
+            if DEBUG_GAME_LOG:
+                self._log(f"DEBUG: 베팅 종료 - 양쪽 체크 (체크 카운트: {self.check_count})")
             return True
         
         # 한쪽 또는 양쪽이 올인했으면 (돈이 0원) 베팅 종료
         if self.player.money == 0 or self.npc.money == 0:
-            print(f"DEBUG: 베팅 종료 - 올인 (플레이어 잔액: {self.player.money}, NPC 잔액: {self.npc.money})")
+            if DEBUG_GAME_LOG:
+                self._log(f"DEBUG: 베팅 종료 - 올인 (플레이어 잔액: {self.player.money}, NPC 잔액: {self.npc.money})")
             return True
         
         # 양쪽 베팅 금액이 같고 둘 다 액션했으면 종료
         if self.player_current_bet == self.npc_current_bet:
-            print(f"DEBUG: 베팅 종료 - 베팅액 동일 & 둘 다 액션 완료 (플레이어: {self.player_current_bet}, NPC: {self.npc_current_bet})")
+            if DEBUG_GAME_LOG:
+                self._log(f"DEBUG: 베팅 종료 - 베팅액 동일 & 둘 다 액션 완료 (플레이어: {self.player_current_bet}, NPC: {self.npc_current_bet})")
             return True
         
         # 위 조건에 해당 안되면 계속 진행
-        print(f"DEBUG: 베팅 진행 중 - 플레이어 베팅: {self.player_current_bet}, NPC 베팅: {self.npc_current_bet}, 플레이어 잔액: {self.player.money}, NPC 잔액: {self.npc.money}")
+        if DEBUG_GAME_LOG:
+            self._log(f"DEBUG: 베팅 진행 중 - 플레이어 베팅: {self.player_current_bet}, NPC 베팅: {self.npc_current_bet}, 플레이어 잔액: {self.player.money}, NPC 잔액: {self.npc.money}")
         return False
     
     def get_all_hand_combinations(self, cards):
@@ -683,9 +730,7 @@ class SutdaGame:
         combinations = []
         # 3장 중 2장을 선택하는 모든 조합 (3C2 = 3가지)
         # [0,1], [0,2], [1,2]
-        indices = [(0, 1), (0, 2), (1, 2)]
-        
-        for i, j in indices:
+        for i, j in THREE_CARD_COMBOS:
             hand_cards = [cards[i], cards[j]]
             hand_eval = self.evaluator.evaluate(hand_cards)
             combinations.append({
@@ -709,27 +754,17 @@ class SutdaGame:
         if len(cards) < 3:
             return 0
         
-        combinations = self.get_all_hand_combinations(cards)
-        if not combinations:
-            return 0
-        
-        # 가장 높은 족보 찾기
-        best_index = 0
-        best_combo = combinations[0]
-        for i, combo in enumerate(combinations[1:], 1):
-            if self.evaluator.compare(combo['hand'], best_combo['hand']) > 0:
-                best_combo = combo
-                best_index = i
-        
-        return best_index
+        # 3장 최고 조합 테이블 조회
+        _, indices = self.evaluator.best_of_three(cards)
+        return THREE_CARD_COMBOS.index(indices)
     
     def showdown(self):
         """쇼다운을 진행합니다 (카드 조합 평가만 수행)."""
         self.state = GameState.SHOWDOWN
         
-        print(f"\n{'='*50}")
-        print("쇼다운!")
-        print(f"{'='*50}")
+        self._log(f"\n{'='*50}")
+        self._log("쇼다운!")
+        self._log(f"{'='*50}")
         
         # 다이한 경우 바로 승자 결정
         if self.player.has_folded or self.npc.has_folded:
@@ -756,8 +791,8 @@ class SutdaGame:
         # 플레이어는 UI에서 선택 대기
         self.player_selected_combo_index = None
         
-        print(f"\n플레이어는 2장 조합을 선택하세요...")
-        print(f"NPC는 자동으로 조합을 선택했습니다.")
+        self._log(f"\n플레이어는 2장 조합을 선택하세요...")
+        self._log(f"NPC는 자동으로 조합을 선택했습니다.")
     
     def select_player_combination(self, combo_index):
         """
@@ -772,30 +807,30 @@ class SutdaGame:
         self.player_selected_combo_index = combo_index
         self.player_hand = self.player_combinations[combo_index]['hand']
         
-        print(f"\n플레이어가 조합 {combo_index + 1}을 선택했습니다.")
-        print(f"족보: {self.player_hand['name']}")
+        self._log(f"\n플레이어가 조합 {combo_index + 1}을 선택했습니다.")
+        self._log(f"족보: {self.player_hand['name']}")
         
         return True
     
     def finalize_showdown(self):
         """쇼다운 결과를 확정하고 승자를 결정합니다."""
         if self.player_selected_combo_index is None:
-            print("플레이어가 아직 조합을 선택하지 않았습니다!")
+            self._log("플레이어가 아직 조합을 선택하지 않았습니다!")
             return False
         
-        print(f"\n{'='*50}")
-        print("최종 대결!")
-        print(f"{'='*50}")
+        self._log(f"\n{'='*50}")
+        self._log("최종 대결!")
+        self._log(f"{'='*50}")
         
-        print(f"\n{self.player.name}의 선택:")
+        self._log(f"\n{self.player.name}의 선택:")
         for card in self.player_combinations[self.player_selected_combo_index]['cards']:
-            print(f"  - {card}")
-        print(f"족보: {self.player_hand['name']} - {self.player_hand['description']}")
+            self._log(f"  - {card}")
+        self._log(f"족보: {self.player_hand['name']} - {self.player_hand['description']}")
         
-        print(f"\n{self.npc.name}의 선택:")
+        self._log(f"\n{self.npc.name}의 선택:")
         for card in self.npc_combinations[self.npc_selected_combo_index]['cards']:
-            print(f"  - {card}")
-        print(f"족보: {self.npc_hand['name']} - {self.npc_hand['description']}")
+            self._log(f"  - {card}")
+        self._log(f"족보: {self.npc_hand['name']} - {self.npc_hand['description']}")
         
         # 승패 판정
         self._determine_winner()
@@ -811,7 +846,7 @@ class SutdaGame:
             
             winner = self.npc
             loser = self.player
-            print(f"\n{self.player.name}가 다이 -> {self.npc.name} 승리!")
+            self._log(f"\n{self.player.name}가 다이 -> {self.npc.name} 승리!")
         elif self.npc.has_folded:
             # 다이했어도 카드 공개
             self.player.reveal_all_cards()
@@ -819,29 +854,29 @@ class SutdaGame:
             
             winner = self.player
             loser = self.npc
-            print(f"\n{self.npc.name}가 다이 -> {self.player.name} 승리!")
+            self._log(f"\n{self.npc.name}가 다이 -> {self.player.name} 승리!")
         else:
-            # 족보 비교
+            # 족보 비교 (구사 재경기 포함, 대결표 조회 한 번)
+            result = self.evaluator.matchup(self.player_hand, self.npc_hand)
+            
             # 구사 재경기 체크
-            if self.evaluator.needs_rematch(self.player_hand, self.npc_hand):
-                print(f"\n구사(4+9) 재경기!")
+            if result == MATCH_REMATCH:
+                self._log(f"\n구사(4+9) 재경기!")
                 self.last_winner = None
                 self._handle_draw()  # 무승부 처리와 동일하게 판돈 이월
                 return
-
-            result = self.evaluator.compare(self.player_hand, self.npc_hand)
             
-            if result > 0:
+            if result == MATCH_WIN:
                 winner = self.player
                 loser = self.npc
-                print(f"\n{self.player.name} 승리!")
-            elif result < 0:
+                self._log(f"\n{self.player.name} 승리!")
+            elif result == MATCH_LOSE:
                 winner = self.npc
                 loser = self.player
-                print(f"\n{self.npc.name} 승리!")
+                self._log(f"\n{self.npc.name} 승리!")
             else:
                 # 무승부 (드물지만 가능)
-                print(f"\n무승부!")
+                self._log(f"\n무승부!")
                 self.last_winner = None
                 self._handle_draw()
                 return
@@ -853,9 +888,9 @@ class SutdaGame:
         winner.win(self.pot)
         loser.lose()
         
-        print(f"{winner.name}이(가) {self.pot:,}원 획득!")
-        print(f"{self.player.name}: {self.player.money:,}원")
-        print(f"{self.npc.name}: {self.npc.money:,}원")
+        self._log(f"{winner.name}이(가) {self.pot:,}원 획득!")
+        self._log(f"{self.player.name}: {self.player.money:,}원")
+        self._log(f"{self.npc.name}: {self.npc.money:,}원")
         
         # NPC 상태 업데이트
         if winner == self.npc:
@@ -888,7 +923,7 @@ class SutdaGame:
     
     def _handle_draw(self):
         """무승부 처리 - 판돈을 묻고 다음 라운드로"""
-        print(f"\n무승부! 판돈 {self.pot:,}원을 묻고 다음 라운드로 넘어갑니다.")
+        self._log(f"\n무승부! 판돈 {self.pot:,}원을 묻고 다음 라운드로 넘어갑니다.")
         
         # 판돈을 다음 라운드로 이월
         self.carried_pot = self.pot
@@ -917,11 +952,11 @@ class SutdaGame:
         """게임 종료 조건 확인"""
         # 한쪽이 파산
         if self.player.is_bankrupt():
-            print(f"\n{self.player.name} 파산! 게임 오버!")
+            self._log(f"\n{self.player.name} 파산! 게임 오버!")
             return True
         
         if self.npc.is_bankrupt():
-            print(f"\n{self.npc.name} 파산! {self.player.name} 승리!")
+            self._log(f"\n{self.npc.name} 파산! {self.player.name} 승리!")
             return True
         
         # 모든 라운드 종료
@@ -932,20 +967,20 @@ class SutdaGame:
     
     def show_final_result(self):
         """최종 결과를 표시합니다."""
-        print(f"\n{'='*50}")
-        print("게임 종료!")
-        print(f"{'='*50}")
+        self._log(f"\n{'='*50}")
+        self._log("게임 종료!")
+        self._log(f"{'='*50}")
         
-        print(f"\n최종 결과:")
-        print(f"{self.player.name}: {self.player.wins}승 {self.player.losses}패, {self.player.money:,}원")
-        print(f"{self.npc.name}: {self.npc.wins}승 {self.npc.losses}패, {self.npc.money:,}원")
+        self._log(f"\n최종 결과:")
+        self._log(f"{self.player.name}: {self.player.wins}승 {self.player.losses}패, {self.player.money:,}원")
+        self._log(f"{self.npc.name}: {self.npc.wins}승 {self.npc.losses}패, {self.npc.money:,}원")
         
         if self.player.money > self.npc.money:
-            print(f"\n🏆 {self.player.name} 최종 승리! 🏆")
+            self._log(f"\n🏆 {self.player.name} 최종 승리! 🏆")
         elif self.npc.money > self.player.money:
-            print(f"\n{self.npc.name} 최종 승리!")
+            self._log(f"\n{self.npc.name} 최종 승리!")
         else:
-            print(f"\n무승부!")
+            self._log(f"\n무승부!")
 
 
 # 테스트용 간단한 실행 (추후 main.py로 이동)
@@ -3,13 +3,14 @@
 카드 조합을 평가하고 비교합니다.
 """
 
+from itertools import permutations
 from typing import List, Tuple, Dict, Optional
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import CARD_TYPE_GWANG, CARD_TYPE_TTI, CARD_TYPE_YEOLKKUT, CARD_NAMES
-from core.card import Card
+from core.card import Card, DECK_SIZE, DECK_CARDS
 
 
 # 족보 랭킹 (낮을수록 강함)
@@ -31,6 +32,59 @@ SPECIAL_GUSA = "gusa"  # 구사 (4+9)
 SPECIAL_MEONGTEONGGURI_GUSA = "meongteongguri_gusa"  # 멍텅구리 구사 (4열끗+9열끗)
 SPECIAL_AMHAENGEOSA = "amhaengeosa"  # 암행어사 (4열끗+7열끗)
 
+# 특수 족보 코드 (배치 평가 결과의 'special' 배열 값, 0은 특수 족보 없음)
+SPECIAL_CODES = (None, SPECIAL_TTAENGJABI, SPECIAL_GUSA,
+                 SPECIAL_MEONGTEONGGURI_GUSA, SPECIAL_AMHAENGEOSA)
+
+# 3장에서 2장을 고르는 조합 (3C2 = 3가지)
+THREE_CARD_COMBOS = ((0, 1), (0, 2), (1, 2))
+
+
+# 대결 결과 코드 (hand1 기준)
+MATCH_DRAW = 0  # 무승부
+MATCH_WIN = 1  # hand1 승리
+MATCH_LOSE = 2  # hand2 승리
+MATCH_REMATCH = 4  # 구사 재경기 (대결표에서는 비교 결과와 함께 저장되는 플래그)
+
+# 대결 코드 → compare() 반환값
+_COMPARE_RESULTS = (0, 1, -1)  # 인덱스: MATCH_DRAW, MATCH_WIN, MATCH_LOSE
+
+# 강도 키: 랭크(낮을수록 강함)와 점수(높을수록 강함)를 정수 하나로 합친 값
+STRENGTH_SCORE_RANGE = 16  # 점수 최대값(10)보다 큰 자리수
+
+
+def card_index(card: Card) -> int:
+    """카드의 덱 인덱스 (카드 ID, 0 ~ DECK_SIZE-1)를 반환합니다."""
+    return card.id
+
+
+def _strength_key(rank: int, score: int) -> int:
+    """족보 랭크와 점수를 비교용 강도 키로 변환합니다 (클수록 강함)."""
+    return (RANK_MANGTONG + 1 - rank) * STRENGTH_SCORE_RANGE + score
+
+
+class FrozenHand(dict):
+    """
+    변경할 수 없는 족보 레코드
+    
+    족보 테이블의 레코드는 모든 호출자가 공유하므로 수정을 막습니다.
+    dict를 상속하므로 기존처럼 hand['rank'] 형태로 읽을 수 있습니다.
+    """
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("족보 레코드는 수정할 수 없습니다")
+    
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+    
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
 
 class HandEvaluator:
     """섯다 족보 평가 클래스"""
@@ -40,6 +94,10 @@ class HandEvaluator:
         """
         카드 조합을 평가합니다.
         
+        미리 계산된 족보 테이블에서 바로 꺼내므로 O(1)입니다.
+        반환되는 족보는 테이블이 공유하는 레코드이므로 수정할 수 없습니다.
+        3장이면 세 가지 2장 조합 중 가장 강한 족보를 반환합니다.
+        
         Args:
             cards: 평가할 카드 리스트 (2장 또는 3장)
             
@@ -49,18 +107,148 @@ class HandEvaluator:
                 'name': str,  # 족보 이름
                 'score': int,  # 세부 점수 (같은 랭킹 내 비교용)
                 'description': str,  # 족보 설명
-                'special': Optional[str]  # 특수 족보 타입
+                'special': Optional[str],  # 특수 족보 타입
+                'strength': int,  # 강도 키 (클수록 강함, 특수 효과 제외)
+                'pair': Optional[int]  # 조합 키 (대결표 인덱스)
             }
         """
         if len(cards) < 2:
             raise ValueError("최소 2장의 카드가 필요합니다")
         
-        # 3장일 경우 처음 2장만 사용
-        eval_cards = cards[:2]
+        # 3장일 경우 최고 조합 테이블 사용
+        if len(cards) >= 3:
+            return HandEvaluator.best_of_three(cards)[0]
+        
+        card1, card2 = cards[0], cards[1]
+        pair_key = _PAIR_KEYS[card1.id * DECK_SIZE + card2.id]
+        if pair_key < 0:
+            # 같은 카드 2장 (실제 덱에서는 나올 수 없음): 테이블 없이 직접 계산
+            return HandEvaluator._evaluate_pair(
+                card1.month, card2.month, card1.card_type, card2.card_type
+            )
+        return _pair_hand(pair_key, card1.id, card2.id)
+    
+    @staticmethod
+    def evaluate_batch(card_ids) -> Dict:
+        """
+        카드 ID 배열을 한 번에 평가합니다 (NumPy 필요).
+        
+        족보 테이블을 NumPy 배열로 만들어 두고 팬시 인덱싱으로 조회하므로,
+        수천만 건의 시뮬레이션 결과도 파이썬 반복 없이 평가할 수 있습니다.
+        
+        Args:
+            card_ids: (N, 2) 또는 (N, 3) 정수 배열 (카드 ID: card_index() 값)
+            
+        Returns:
+            {
+                'pair': ndarray,  # 최고 조합 키 (N,)
+                'strength': ndarray,  # 강도 키 (N,)
+                'rank': ndarray,  # 족보 랭킹 (N,)
+                'special': ndarray  # 특수 족보 코드 (N,), SPECIAL_CODES 인덱스
+            }
+        """
+        np = _import_numpy()
+        tables = _get_batch_tables()
+        
+        ids = np.asarray(card_ids)
+        if ids.ndim != 2 or ids.shape[1] not in (2, 3):
+            raise ValueError(f"카드 ID 배열은 (N, 2) 또는 (N, 3) 형태여야 합니다: {ids.shape}")
+        if not np.issubdtype(ids.dtype, np.integer):
+            raise ValueError(f"카드 ID는 정수여야 합니다: {ids.dtype}")
+        if ids.size and (ids.min() < 0 or ids.max() >= DECK_SIZE):
+            raise ValueError(f"카드 ID는 0~{DECK_SIZE - 1} 사이여야 합니다")
+        
+        if ids.shape[1] == 2:
+            keys = tables['pair_keys'][ids[:, 0], ids[:, 1]]
+        else:
+            keys = tables['triple_best'][ids[:, 0], ids[:, 1], ids[:, 2]]
+        
+        if ids.size and keys.min() < 0:
+            raise ValueError("같은 카드가 중복된 조합이 있습니다")
+        
+        return {
+            'pair': keys,
+            'strength': tables['strength'][keys],
+            'rank': tables['rank'][keys],
+            'special': tables['special'][keys]
+        }
+    
+    @staticmethod
+    def best_of_three(cards: List[Card]) -> Tuple[Dict, Tuple[int, int]]:
+        """
+        3장 중 가장 강한 2장 조합을 찾습니다.
         
-        month1, month2 = eval_cards[0].month, eval_cards[1].month
-        type1, type2 = eval_cards[0].card_type, eval_cards[1].card_type
+        1140가지 3장 조합의 최고 족보가 미리 계산되어 있으므로 O(1)입니다.
         
+        Args:
+            cards: 카드 리스트 (3장)
+            
+        Returns:
+            (최고 족보, 사용한 카드 인덱스 (i, j)) - 족보의 'strength'가 강도 키
+        """
+        if len(cards) < 3:
+            raise ValueError("3장의 카드가 필요합니다")
+        
+        card1, card2, card3 = cards[0], cards[1], cards[2]
+        index1, index2, index3 = card1.id, card2.id, card3.id
+        
+        triple_key = _TRIPLE_KEYS[(index1 * DECK_SIZE + index2) * DECK_SIZE + index3]
+        if triple_key < 0:
+            # 같은 카드가 섞인 경우 (실제 덱에서는 나올 수 없음): 직접 비교
+            return HandEvaluator._best_of_three_rules(cards[:3])
+        
+        pair_key, excluded = TRIPLE_BEST[triple_key]
+        if excluded == index1:
+            indices = (1, 2)
+        elif excluded == index2:
+            indices = (0, 2)
+        else:
+            indices = (0, 1)
+        return _pair_hand(pair_key, cards[indices[0]].id, cards[indices[1]].id), indices
+    
+    @staticmethod
+    def _best_of_three_rules(cards: List[Card]) -> Tuple[Dict, Tuple[int, int]]:
+        """
+        규칙대로 3장 중 최고 조합을 고릅니다 (테이블 생성 및 테이블 밖 조합용).
+        
+        특수 족보 때문에 비교가 순환할 수 있으므로, 나머지 두 조합과의
+        승패 차가 가장 큰 조합을 고르고 같으면 강도 키, 조합 순서로 정합니다.
+        """
+        combos = []
+        for i, j in THREE_CARD_COMBOS:
+            hand = HandEvaluator.evaluate([cards[i], cards[j]])
+            combos.append((hand, (i, j)))
+        
+        best, best_rank = None, None
+        for order, (hand, indices) in enumerate(combos):
+            margin = sum(HandEvaluator.compare(hand, other) for other, _ in combos)
+            rank = (margin, hand['strength'], -order)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = (hand, indices), rank
+        return best
+    
+    @staticmethod
+    def _evaluate_pair(month1: int, month2: int, type1: str, type2: str,
+                       pair_key: Optional[int] = None) -> Dict:
+        """
+        두 장의 족보를 규칙대로 계산합니다 (족보 테이블 생성용).
+        
+        Args:
+            month1, month2: 두 카드의 월
+            type1, type2: 두 카드의 타입
+            pair_key: 족보 테이블의 조합 키 (테이블 밖의 조합이면 None)
+            
+        Returns:
+            evaluate()와 같은 형식의 족보 (변경 불가)
+        """
+        hand = HandEvaluator._evaluate_pair_rules(month1, month2, type1, type2)
+        hand['strength'] = _strength_key(hand['rank'], hand['score'])
+        hand['pair'] = pair_key
+        return FrozenHand(hand)
+    
+    @staticmethod
+    def _evaluate_pair_rules(month1: int, month2: int, type1: str, type2: str) -> Dict:
+        """섯다 규칙에 따라 두 장의 족보를 판정합니다."""
         # 특수 족보 체크
         special = HandEvaluator._check_special_hand(month1, month2, type1, type2)
         
@@ -241,21 +429,33 @@ class HandEvaluator:
             -1: hand2 승리
             0: 무승부
         """
-        # 특수 족보 처리
-        result = HandEvaluator._handle_special_hands(hand1, hand2)
-        if result is not None:
-            return result
+        pair1, pair2 = hand1.get('pair'), hand2.get('pair')
+        if pair1 is not None and pair2 is not None:
+            code = MATCHUP_TABLE[pair1 * PAIR_COUNT + pair2] & ~MATCH_REMATCH
+            return _COMPARE_RESULTS[code]
         
-        # 랭크 비교 (낮을수록 강함)
-        if hand1['rank'] < hand2['rank']:
-            return 1
-        elif hand1['rank'] > hand2['rank']:
-            return -1
-        
-        # 같은 랭크일 경우 점수 비교
-        if hand1['score'] > hand2['score']:
+        return HandEvaluator._compare_rules(hand1, hand2)
+    
+    @staticmethod
+    def _compare_rules(hand1: Dict, hand2: Dict) -> int:
+        """규칙대로 두 족보를 비교합니다 (대결표 생성 및 테이블 밖 족보용)."""
+        # 특수 족보 처리 (특수 족보가 있을 때만)
+        if hand1.get('special') is not None or hand2.get('special') is not None:
+            result = HandEvaluator._handle_special_hands(hand1, hand2)
+            if result is not None:
+                return result
+        
+        # 강도 키 비교 (랭크 → 점수 순서를 정수 하나로 합친 값)
+        strength1 = hand1.get('strength')
+        if strength1 is None:
+            strength1 = _strength_key(hand1['rank'], hand1['score'])
+        strength2 = hand2.get('strength')
+        if strength2 is None:
+            strength2 = _strength_key(hand2['rank'], hand2['score'])
+        
+        if strength1 > strength2:
             return 1
-        elif hand1['score'] < hand2['score']:
+        elif strength1 < strength2:
             return -1
         
         # 무승부
@@ -320,6 +520,15 @@ class HandEvaluator:
     @staticmethod
     def needs_rematch(hand1: Dict, hand2: Dict) -> bool:
         """구사로 인한 재경기 필요 여부"""
+        pair1, pair2 = hand1.get('pair'), hand2.get('pair')
+        if pair1 is not None and pair2 is not None:
+            return bool(MATCHUP_TABLE[pair1 * PAIR_COUNT + pair2] & MATCH_REMATCH)
+        
+        return HandEvaluator._needs_rematch_rules(hand1, hand2)
+    
+    @staticmethod
+    def _needs_rematch_rules(hand1: Dict, hand2: Dict) -> bool:
+        """규칙대로 구사 재경기 여부를 판정합니다."""
         special1 = hand1.get('special')
         special2 = hand2.get('special')
         
@@ -334,6 +543,45 @@ class HandEvaluator:
                 return True
         
         return False
+    
+    @staticmethod
+    def matchup(hand1: Dict, hand2: Dict) -> int:
+        """
+        쇼다운 결과를 판정합니다 (구사 재경기 포함).
+        
+        두 족보 모두 테이블 족보이면 대결표를 한 번 읽는 것으로 끝납니다.
+        
+        Args:
+            hand1: 첫 번째 족보
+            hand2: 두 번째 족보
+            
+        Returns:
+            MATCH_WIN / MATCH_LOSE / MATCH_DRAW / MATCH_REMATCH (hand1 기준)
+        """
+        pair1, pair2 = hand1.get('pair'), hand2.get('pair')
+        if pair1 is not None and pair2 is not None:
+            code = MATCHUP_TABLE[pair1 * PAIR_COUNT + pair2]
+        else:
+            code = HandEvaluator._matchup_code(hand1, hand2)
+        
+        if code & MATCH_REMATCH:
+            return MATCH_REMATCH
+        return code
+    
+    @staticmethod
+    def _matchup_code(hand1: Dict, hand2: Dict) -> int:
+        """대결표에 저장할 코드 (비교 결과 | 재경기 플래그)를 계산합니다."""
+        result = HandEvaluator._compare_rules(hand1, hand2)
+        if result > 0:
+            code = MATCH_WIN
+        elif result < 0:
+            code = MATCH_LOSE
+        else:
+            code = MATCH_DRAW
+        
+        if HandEvaluator._needs_rematch_rules(hand1, hand2):
+            code |= MATCH_REMATCH
+        return code
 
 
     @staticmethod
@@ -357,13 +605,15 @@ class HandEvaluator:
 
 
     @staticmethod
-    def estimate_hand_for_npc(npc_cards: List[Card], player_revealed_cards: List[Card]) -> Dict:
+    def estimate_hand_for_npc(npc_cards: List[Card], player_revealed_cards: List[Card],
+                              npc_revealed_cards: List[Card] = ()) -> Dict:
         """
         NPC 관점에서 자신과 상대방의 예상 족보를 계산합니다.
         
         Args:
             npc_cards: NPC가 가진 카드 리스트
             player_revealed_cards: 플레이어가 공개한 카드 리스트
+            npc_revealed_cards: NPC가 공개한 카드 리스트
             
         Returns:
             {
@@ -379,7 +629,7 @@ class HandEvaluator:
         
         # NPC의 카드 정보 (카드 이름 생성)
         my_cards = [HandEvaluator._get_card_name(card) for card in npc_cards]
-        my_revealed = [HandEvaluator._get_card_name(card) for card in npc_cards if card.is_revealed]
+        my_revealed = [HandEvaluator._get_card_name(card) for card in npc_revealed_cards]
         
         # 플레이어 공개 카드 정보
         opponent_revealed = [HandEvaluator._get_card_name(card) for card in player_revealed_cards]
@@ -412,6 +662,173 @@ class HandEvaluator:
         }
 
 
+def _build_pair_table():
+    """
+    20장 덱에서 나올 수 있는 190가지 2장 조합의 족보 테이블을 만듭니다.
+    
+    Returns:
+        (pair_keys, pair_hands, reversed_hands, pair_strengths)
+        - pair_keys: 카드 인덱스 i*DECK_SIZE+j → 조합 키 (같은 카드는 -1)
+        - pair_hands: 조합 키 → 족보 레코드 (인덱스가 작은 카드가 먼저)
+        - reversed_hands: 조합 키 → 카드를 반대 순서로 냈을 때의 족보 레코드
+          (설명의 월 순서만 다르고, 설명까지 같으면 pair_hands와 같은 객체)
+        - pair_strengths: 조합 키 → 강도 키
+    """
+    pair_keys = [-1] * (DECK_SIZE * DECK_SIZE)
+    pair_hands = []
+    reversed_hands = []
+    
+    for i in range(DECK_SIZE):
+        for j in range(i + 1, DECK_SIZE):
+            card1, card2 = DECK_CARDS[i], DECK_CARDS[j]
+            pair_key = len(pair_hands)
+            pair_keys[i * DECK_SIZE + j] = pair_key
+            pair_keys[j * DECK_SIZE + i] = pair_key
+            hand = HandEvaluator._evaluate_pair(
+                card1.month, card2.month, card1.card_type, card2.card_type, pair_key
+            )
+            reversed_hand = HandEvaluator._evaluate_pair(
+                card2.month, card1.month, card2.card_type, card1.card_type, pair_key
+            )
+            pair_hands.append(hand)
+            reversed_hands.append(hand if reversed_hand == hand else reversed_hand)
+    
+    pair_strengths = tuple(hand['strength'] for hand in pair_hands)
+    return tuple(pair_keys), tuple(pair_hands), tuple(reversed_hands), pair_strengths
+
+
+def _build_matchup_table(pair_hands) -> bytes:
+    """
+    모든 조합 쌍(190 x 190)의 대결 결과표를 만듭니다.
+    
+    Returns:
+        MATCHUP_TABLE[pair1 * PAIR_COUNT + pair2] = 비교 결과 | 재경기 플래그
+    """
+    # 족보 비교는 랭킹, 점수, 특수 족보, 강도만 보므로 같은 값의 조합끼리는 한 번만 비교
+    classes = {}
+    pair_classes = []
+    for hand in pair_hands:
+        signature = (hand['rank'], hand['score'], hand['special'], hand['strength'])
+        if signature not in classes:
+            classes[signature] = (len(classes), hand)
+        pair_classes.append(classes[signature][0])
+    
+    representatives = [hand for _, hand in classes.values()]
+    class_codes = [
+        bytes(HandEvaluator._matchup_code(hand1, hand2) for hand2 in representatives)
+        for hand1 in representatives
+    ]
+    return b''.join(
+        bytes(class_codes[class1][class2] for class2 in pair_classes)
+        for class1 in pair_classes
+    )
+
+
+def _build_triple_table(pair_keys, pair_strengths, matchup_table):
+    """
+    20장 덱에서 나올 수 있는 1140가지 3장 조합의 최고 족보 테이블을 만듭니다.
+    
+    HandEvaluator._best_of_three_rules와 같은 규칙(승패 차, 강도 키, 조합 순서)을
+    2장 조합 테이블과 대결표로 계산합니다.
+    
+    Returns:
+        (triple_keys, triple_best)
+        - triple_keys: (i*DECK_SIZE+j)*DECK_SIZE+k → 조합 키 (카드 순서 무관, 중복 카드는 -1)
+        - triple_best: 조합 키 → (최고 조합 키, 최고 조합에서 빠진 카드 인덱스)
+    """
+    pair_count = len(pair_strengths)
+    triple_keys = [-1] * (DECK_SIZE ** 3)
+    triple_best = []
+    
+    for i in range(DECK_SIZE):
+        for j in range(i + 1, DECK_SIZE):
+            for k in range(j + 1, DECK_SIZE):
+                triple_key = len(triple_best)
+                for a, b, c in permutations((i, j, k)):
+                    triple_keys[(a * DECK_SIZE + b) * DECK_SIZE + c] = triple_key
+                
+                # THREE_CARD_COMBOS 순서: (i, j), (i, k), (j, k) → 빠지는 카드 k, j, i
+                combos = (
+                    (pair_keys[i * DECK_SIZE + j], k),
+                    (pair_keys[i * DECK_SIZE + k], j),
+                    (pair_keys[j * DECK_SIZE + k], i)
+                )
+                best, best_rank = None, None
+                for order, (key, excluded) in enumerate(combos):
+                    margin = sum(
+                        _COMPARE_RESULTS[matchup_table[key * pair_count + other] & ~MATCH_REMATCH]
+                        for other, _ in combos
+                    )
+                    rank = (margin, pair_strengths[key], -order)
+                    if best_rank is None or rank > best_rank:
+                        best, best_rank = (key, excluded), rank
+                triple_best.append(best)
+    
+    return tuple(triple_keys), tuple(triple_best)
+
+
+def _pair_hand(pair_key: int, index1: int, index2: int) -> Dict:
+    """조합 키의 족보 레코드를 카드를 낸 순서(index1, index2)대로 반환합니다 (설명의 월 순서)."""
+    return PAIR_HANDS[pair_key] if index1 < index2 else _REVERSED_PAIR_HANDS[pair_key]
+
+
+def pair_key(index1: int, index2: int) -> int:
+    """두 카드 인덱스의 조합 키를 반환합니다 (같은 카드면 -1)."""
+    return _PAIR_KEYS[index1 * DECK_SIZE + index2]
+
+
+def best_pair_key(index1: int, index2: int, index3: int) -> int:
+    """세 카드 인덱스로 만들 수 있는 최고 조합의 키를 반환합니다."""
+    return TRIPLE_BEST[_TRIPLE_KEYS[(index1 * DECK_SIZE + index2) * DECK_SIZE + index3]][0]
+
+
+def _import_numpy():
+    """배치 평가용 NumPy를 가져옵니다 (선택 의존성)."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("evaluate_batch()를 사용하려면 numpy가 필요합니다 (pip install numpy)") from e
+    return numpy
+
+
+_BATCH_TABLES = None
+
+
+def _get_batch_tables() -> Dict:
+    """족보 테이블의 NumPy 배열 버전을 만듭니다 (첫 호출 시 한 번만)."""
+    global _BATCH_TABLES
+    if _BATCH_TABLES is not None:
+        return _BATCH_TABLES
+    
+    np = _import_numpy()
+    
+    pair_keys = np.array(_PAIR_KEYS, dtype=np.int16).reshape(DECK_SIZE, DECK_SIZE)
+    
+    triple_best = np.full(DECK_SIZE ** 3, -1, dtype=np.int16)
+    triple_keys = np.array(_TRIPLE_KEYS, dtype=np.int32)
+    valid = triple_keys >= 0
+    best_keys = np.array([best for best, _ in TRIPLE_BEST], dtype=np.int16)
+    triple_best[valid] = best_keys[triple_keys[valid]]
+    
+    _BATCH_TABLES = {
+        'pair_keys': pair_keys,
+        'triple_best': triple_best.reshape(DECK_SIZE, DECK_SIZE, DECK_SIZE),
+        'strength': np.array(PAIR_STRENGTHS, dtype=np.int16),
+        'rank': np.array([hand['rank'] for hand in PAIR_HANDS], dtype=np.int8),
+        'special': np.array([SPECIAL_CODES.index(hand['special']) for hand in PAIR_HANDS],
+                            dtype=np.int8)
+    }
+    return _BATCH_TABLES
+
+
+# 모듈 로드 시 한 번만 생성
+_PAIR_KEYS, PAIR_HANDS, _REVERSED_PAIR_HANDS, PAIR_STRENGTHS = _build_pair_table()
+PAIR_COUNT = len(PAIR_HANDS)
+MATCHUP_TABLE = _build_matchup_table(PAIR_HANDS)
+_TRIPLE_KEYS, TRIPLE_BEST = _build_triple_table(_PAIR_KEYS, PAIR_STRENGTHS, MATCHUP_TABLE)
+TRIPLE_COUNT = len(TRIPLE_BEST)
+
+
 # 테스트 코드
 if __name__ == "__main__":
     from core.card import Card, CARD_TYPE_GWANG, CARD_TYPE_TTI, CARD_TYPE_YEOLKKUT
@@ -8,7 +8,7 @@ import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.card import Card
+from core.card import Card, register_card_holder, release_card_holder
 
 
 class Player:
@@ -23,6 +23,8 @@ class Player:
         self.name = name
         self.money = money
         self.cards: List[Card] = []  # 현재 보유 카드
+        self.card_mask = 0  # 보유 카드 비트마스크 (cards와 동기화)
+        self.revealed_mask = 0  # 공개한 카드 비트마스크
         
         # 게임 기록
         self.wins = 0  # 승리 횟수
@@ -37,10 +39,16 @@ class Player:
     def add_card(self, card: Card):
         """카드를 받습니다."""
         self.cards.append(card)
+        self.card_mask |= card.mask
+        register_card_holder(card, self)
     
     def clear_cards(self):
         """카드를 모두 제거합니다."""
+        for card in self.cards:
+            release_card_holder(card, self)
         self.cards = []
+        self.card_mask = 0
+        self.revealed_mask = 0
     
     def bet(self, amount: int) -> bool:
         """
@@ -88,13 +96,17 @@ class Player:
         """파산 여부를 확인합니다."""
         return self.money <= 0
     
+    def is_card_revealed(self, card: Card) -> bool:
+        """카드를 공개했는지 확인합니다."""
+        return bool(card.mask & self.revealed_mask)
+    
     def get_revealed_cards(self) -> List[Card]:
         """공개된 카드만 반환합니다."""
-        return [card for card in self.cards if card.is_revealed]
+        return [card for card in self.cards if card.mask & self.revealed_mask]
     
     def get_hidden_cards(self) -> List[Card]:
         """비공개 카드만 반환합니다."""
-        return [card for card in self.cards if not card.is_revealed]
+        return [card for card in self.cards if not card.mask & self.revealed_mask]
     
     def reveal_card(self, index: int) -> bool:
         """
@@ -107,14 +119,13 @@ class Player:
             성공 여부
         """
         if 0 <= index < len(self.cards):
-            self.cards[index].reveal()
+            self.revealed_mask |= self.cards[index].mask
             return True
         return False
     
     def reveal_all_cards(self):
         """모든 카드를 공개합니다."""
-        for card in self.cards:
-            card.reveal()
+        self.revealed_mask = self.card_mask
     
     def __str__(self) -> str:
         return f"{self.name} (자금: {self.money:,}원)"
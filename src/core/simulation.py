@@ -0,0 +1,188 @@
+"""
+헤드리스 게임 시뮬레이션
+화면, 콘솔 출력, LLM 없이 NPC끼리 게임을 자동으로 진행합니다 (능력치 밸런싱용).
+"""
+
+from typing import Dict, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.game import SutdaGame, GameState, BetAction
+from core.player import Player
+from ai.npc import NPCPlayer
+from core.equity import precompute_equity
+
+
+class SimulationGame(SutdaGame):
+    """
+    NPC 대 NPC 자동 진행 게임
+
+    SutdaGame의 규칙(start_new_round, process_bet, deal_third_card, showdown,
+    _determine_winner)을 그대로 사용하고, UI가 하던 진행(카드 공개, 턴 처리,
+    조합 선택)만 대신합니다. 플레이어 자리에도 NPCPlayer가 앉습니다.
+
+    NPC 결정마다 승률을 조회하므로, 처음 만들 때 프로세스당 한 번 전체 승률 표를
+    만들어 둡니다 (core.equity.precompute_equity).
+    """
+
+    # 한 베팅 페이즈의 최대 행동 수 (규칙상 무한 레이즈를 막기 위한 안전장치)
+    MAX_ACTIONS_PER_PHASE = 50
+
+    def __init__(self, player_npc: NPCPlayer, npc: NPCPlayer, seed: Optional[int] = None):
+        """
+        Args:
+            player_npc: 플레이어 자리에 앉을 NPC
+            npc: 상대 NPC
+            seed: 카드 섞기 난수 시드
+        """
+        super().__init__(player_npc.name, npc, seed=seed, headless=True)
+        self.player = player_npc
+        precompute_equity()
+
+    def play_game(self) -> Dict:
+        """
+        게임 한 판(모든 라운드 또는 파산까지)을 진행합니다.
+
+        Returns:
+            {
+                'winner': str or None,  # 최종 자금이 많은 쪽 이름 (같으면 None)
+                'rounds': int,  # 진행한 라운드 수
+                'player_money': int,  # 플레이어 자리 최종 자금
+                'npc_money': int,  # NPC 최종 자금
+                'pots': list,  # 라운드별 최종 판돈
+                'bankrupt': str or None  # 파산한 쪽 이름
+            }
+        """
+        pots = []
+        self.start_new_game()
+
+        while self.state != GameState.GAME_OVER:
+            pots.append(self.play_round())
+            self.end_round()
+
+        bankrupt = None
+        if self.player.is_bankrupt():
+            bankrupt = self.player.name
+        elif self.npc.is_bankrupt():
+            bankrupt = self.npc.name
+
+        winner = None
+        if self.player.money > self.npc.money:
+            winner = self.player.name
+        elif self.npc.money > self.player.money:
+            winner = self.npc.name
+
+        return {
+            'winner': winner,
+            'rounds': self.current_round,
+            'player_money': self.player.money,
+            'npc_money': self.npc.money,
+            'pots': pots,
+            'bankrupt': bankrupt
+        }
+
+    def play_round(self) -> int:
+        """
+        현재 라운드를 쇼다운까지 진행합니다 (end_round는 호출하지 않음).
+
+        Returns:
+            라운드 최종 판돈
+        """
+        # 카드 공개 (각자 1장)
+        self.player.reveal_card(self.player.choose_card_to_reveal(self.npc.get_revealed_cards()))
+        self.npc.reveal_card(self.npc.choose_card_to_reveal(self.player.get_revealed_cards()))
+
+        # 1차 베팅
+        self.state = GameState.BETTING
+        self.start_new_betting_phase(0)
+        self._play_betting_phase()
+
+        # 2차 베팅 (다이가 없을 때만)
+        if not (self.player.has_folded or self.npc.has_folded):
+            self.deal_third_card()
+            self._play_betting_phase()
+
+        pot = self.pot
+        self.showdown()
+
+        # 플레이어 자리 NPC도 최고 조합 선택
+        if self.state == GameState.SHOWDOWN:
+            self.select_player_combination(self.get_best_hand_index(self.player.cards))
+            self.finalize_showdown()
+
+        # 플레이어 자리 NPC의 멘탈 변화 (SutdaGame은 self.npc만 처리)
+        if self.last_winner is self.player:
+            self.player.on_victory()
+        elif self.last_winner is self.npc:
+            self.player.on_defeat()
+        self.player.recover_mental()
+
+        return pot
+
+    def _play_betting_phase(self):
+        """베팅이 끝날 때까지 양쪽 NPC의 행동을 처리합니다."""
+        for _ in range(self.MAX_ACTIONS_PER_PHASE):
+            if self.is_betting_done():
+                return
+
+            current = self.get_current_turn_player()
+            opponent = self.npc if current is self.player else self.player
+            action, amount = self._decide_action(current, opponent)
+
+            if not self.process_bet(current, action, amount):
+                # 돈이 모자라 실패한 베팅은 가진 돈 전부(올인) 또는 다이로 대체
+                fallback = BetAction.ALLIN if current.money > 0 else BetAction.DIE
+                self.process_bet(current, fallback, current.money)
+
+        # 안전장치: 마지막 행동으로도 끝나지 않은 베팅은 현재 턴 플레이어의 다이로 종료
+        if not self.is_betting_done():
+            self.process_bet(self.get_current_turn_player(), BetAction.DIE)
+
+    def _decide_action(self, current: Player, opponent: Player):
+        """현재 턴 NPC의 베팅 행동을 결정합니다 (GameScreen._npc_turn과 같은 입력)."""
+        if current is self.player:
+            my_bet, opponent_bet = self.player_current_bet, self.npc_current_bet
+        else:
+            my_bet, opponent_bet = self.npc_current_bet, self.player_current_bet
+        call_amount = opponent_bet - my_bet
+
+        action, amount = current.decide_bet_action(
+            self.evaluator.evaluate(current.cards),
+            opponent.get_revealed_cards(),
+            self.pot,
+            call_amount,
+            my_bet == 0
+        )
+
+        # 낼 돈이 없는 콜은 턴이 넘어가지 않으므로 체크로 처리
+        if action == BetAction.CALL and call_amount <= 0:
+            return BetAction.CHECK, 0
+        return action, amount
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import time
+
+    print("=== 헤드리스 시뮬레이션 테스트 ===\n")
+
+    start = time.perf_counter()
+    precompute_equity()
+    print(f"승률 표 생성: {time.perf_counter() - start:.2f}초")
+
+    games = 1000
+    wins = {}
+    start = time.perf_counter()
+    for seed in range(games):
+        game = SimulationGame(
+            NPCPlayer("호구", 100_000, composure=1, deception=1, boldness=2, recovery=1),
+            NPCPlayer("아귀", 100_000, composure=10, deception=9, boldness=9, recovery=10),
+            seed=seed
+        )
+        result = game.play_game()
+        wins[result['winner']] = wins.get(result['winner'], 0) + 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{games}판 결과: {wins}")
+    print(f"소요 시간: {elapsed:.2f}초 ({games / elapsed:,.0f}판/초)")
@@ -0,0 +1,217 @@
+"""
+NPC 토너먼트
+여러 프로세스에서 NPC 프로필끼리 헤드리스 게임을 대량으로 진행하고 결과를 집계합니다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+from typing import List, Dict, Iterator, Optional, Tuple
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DEFAULT_START_MONEY, NPC_PROFILES
+from core.simulation import SimulationGame
+from ai.npc import NPCPlayer
+
+
+# 작업 하나(프로세스에 한 번 보내는 단위)에서 진행할 게임 수
+DEFAULT_BATCH_SIZE = 200
+
+
+def create_npc(profile: Dict) -> NPCPlayer:
+    """프로필(config.NPC_PROFILES 형식)로 NPC를 생성합니다."""
+    npc = NPCPlayer(
+        name=profile["name"],
+        money=DEFAULT_START_MONEY,
+        composure=profile["composure"],
+        deception=profile["deception"],
+        boldness=profile["boldness"],
+        recovery=profile["recovery"]
+    )
+    npc.persona = profile.get("persona", "")
+    npc.catchphrase = profile.get("catchphrase", "")
+    return npc
+
+
+def _empty_stats() -> Dict:
+    """대진 하나의 집계 초기값"""
+    return {
+        'games': 0,
+        'wins': [0, 0],  # [프로필1 승, 프로필2 승]
+        'draws': 0,
+        'bankrupt': [0, 0],  # [프로필1 파산, 프로필2 파산]
+        'rounds': 0,
+        'pot_total': 0
+    }
+
+
+def _merge_stats(total: Dict, batch: Dict):
+    """배치 결과를 대진 집계에 더합니다."""
+    total['games'] += batch['games']
+    total['draws'] += batch['draws']
+    total['rounds'] += batch['rounds']
+    total['pot_total'] += batch['pot_total']
+    for i in range(2):
+        total['wins'][i] += batch['wins'][i]
+        total['bankrupt'][i] += batch['bankrupt'][i]
+
+
+def play_batch(profile1: Dict, profile2: Dict, games: int, seed: int,
+               swap_seats: bool = False) -> Dict:
+    """
+    두 프로필의 게임을 games판 진행합니다 (작업 프로세스에서 실행).
+
+    NPC 행동은 전역 random을 사용하므로 작업마다 seed로 다시 시드하고,
+    게임별 카드 시드도 같은 seed에서 뽑아 배치 결과를 재현할 수 있게 합니다.
+
+    Args:
+        profile1, profile2: NPC 프로필
+        games: 진행할 게임 수
+        seed: 배치 난수 시드
+        swap_seats: True면 profile2가 플레이어 자리에 앉음 (자리 편향 상쇄용)
+
+    Returns:
+        집계 딕셔너리 (wins/bankrupt는 항상 [profile1, profile2] 순서)
+    """
+    random.seed(seed)
+    rng = random.Random(seed)
+    stats = _empty_stats()
+
+    for _ in range(games):
+        npc1 = create_npc(profile1)
+        npc2 = create_npc(profile2)
+        seated = (npc2, npc1) if swap_seats else (npc1, npc2)
+        result = SimulationGame(*seated, seed=rng.getrandbits(32)).play_game()
+
+        stats['games'] += 1
+        stats['rounds'] += result['rounds']
+        stats['pot_total'] += sum(result['pots'])
+
+        # 이름이 같을 수 있으므로 객체 기준으로 판정
+        if npc1.money > npc2.money:
+            stats['wins'][0] += 1
+        elif npc2.money > npc1.money:
+            stats['wins'][1] += 1
+        else:
+            stats['draws'] += 1
+
+        if npc1.is_bankrupt():
+            stats['bankrupt'][0] += 1
+        if npc2.is_bankrupt():
+            stats['bankrupt'][1] += 1
+
+    return stats
+
+
+def summarize(stats: Dict) -> Dict:
+    """
+    집계를 비율로 변환합니다.
+
+    Returns:
+        {
+            'games': int,
+            'win_rate': (float, float),  # 프로필별 승률
+            'draw_rate': float,
+            'bankrupt_rate': (float, float),  # 프로필별 파산율
+            'avg_pot': float,  # 라운드당 평균 판돈
+            'avg_rounds': float  # 게임당 평균 라운드 수
+        }
+    """
+    games = stats['games']
+    rounds = stats['rounds']
+    if games == 0:
+        return {'games': 0, 'win_rate': (0.0, 0.0), 'draw_rate': 0.0,
+                'bankrupt_rate': (0.0, 0.0), 'avg_pot': 0.0, 'avg_rounds': 0.0}
+
+    return {
+        'games': games,
+        'win_rate': (stats['wins'][0] / games, stats['wins'][1] / games),
+        'draw_rate': stats['draws'] / games,
+        'bankrupt_rate': (stats['bankrupt'][0] / games, stats['bankrupt'][1] / games),
+        'avg_pot': stats['pot_total'] / rounds if rounds else 0.0,
+        'avg_rounds': rounds / games
+    }
+
+
+def run_tournament(profiles: Optional[List[Dict]] = None, games_per_matchup: int = 1000,
+                   workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                   seed: int = 0) -> Iterator[Tuple[Tuple[str, str], Dict]]:
+    """
+    모든 프로필 쌍의 대진을 ProcessPoolExecutor로 나눠 진행합니다.
+
+    배치가 끝날 때마다 해당 대진의 누적 결과를 내보내므로,
+    큰 표본도 진행 상황을 보면서 중간에 멈출 수 있습니다.
+
+    Args:
+        profiles: NPC 프로필 목록 (None이면 config.NPC_PROFILES)
+        games_per_matchup: 대진당 게임 수
+        workers: 작업 프로세스 수 (None이면 CPU 수)
+        batch_size: 작업 하나에서 진행할 게임 수
+        seed: 전체 난수 시드 (같은 시드면 같은 결과)
+
+    Yields:
+        ((프로필1 이름, 프로필2 이름), 누적 집계 딕셔너리)
+        마지막 배치가 끝난 대진은 집계['games'] == games_per_matchup
+    """
+    if profiles is None:
+        profiles = NPC_PROFILES
+
+    # 배치 시드는 작업 순서로 미리 정해 두어, 어느 프로세스가 처리해도 결과가 같음
+    seed_rng = random.Random(seed)
+    jobs = []
+    for index1, index2 in combinations(range(len(profiles)), 2):
+        remaining = games_per_matchup
+        batch_index = 0
+        while remaining > 0:
+            games = min(batch_size, remaining)
+            jobs.append(((index1, index2), games, seed_rng.getrandbits(64), batch_index % 2 == 1))
+            remaining -= games
+            batch_index += 1
+
+    totals = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(play_batch, profiles[index1], profiles[index2],
+                            games, batch_seed, swap_seats): (index1, index2)
+            for (index1, index2), games, batch_seed, swap_seats in jobs
+        }
+
+        for future in as_completed(futures):
+            matchup = futures[future]
+            total = totals.setdefault(matchup, _empty_stats())
+            _merge_stats(total, future.result())
+            names = (profiles[matchup[0]]["name"], profiles[matchup[1]]["name"])
+            yield names, total
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="NPC 토너먼트 시뮬레이션")
+    parser.add_argument("--games", type=int, default=2000, help="대진당 게임 수")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    print("=== NPC 토너먼트 ===\n")
+
+    start = time.perf_counter()
+    final = {}
+    for names, stats in run_tournament(games_per_matchup=args.games, workers=args.workers, seed=args.seed):
+        final[names] = stats
+        print(f"  진행 중: {names[0]} vs {names[1]} - {stats['games']}/{args.games}판")
+    elapsed = time.perf_counter() - start
+
+    print(f"\n결과 ({elapsed:.1f}초):")
+    for (name1, name2), stats in final.items():
+        summary = summarize(stats)
+        print(f"\n{name1} vs {name2} ({summary['games']}판, 평균 {summary['avg_rounds']:.1f}라운드)")
+        print(f"  승률: {name1} {summary['win_rate'][0]*100:.1f}% | "
+              f"{name2} {summary['win_rate'][1]*100:.1f}% | 무승부 {summary['draw_rate']*100:.1f}%")
+        print(f"  파산율: {name1} {summary['bankrupt_rate'][0]*100:.1f}% | "
+              f"{name2} {summary['bankrupt_rate'][1]*100:.1f}%")
+        print(f"  라운드당 평균 판돈: {summary['avg_pot']:,.0f}원")
@@ -24,7 +24,7 @@ def show_player_cards(game: SutdaGame):
     """플레이어 카드를 출력합니다."""
     print(f"\n{game.player.name}의 카드:")
     for i, card in enumerate(game.player.cards):
-        status = "공개" if card.is_revealed else "비공개"
+        status = "공개" if game.player.is_card_revealed(card) else "비공개"
         print(f"  [{i+1}] {card} ({status})")
 
 
@@ -32,7 +32,7 @@ def show_npc_cards(game: SutdaGame):
     """NPC 카드를 출력합니다 (공개된 것만)."""
     print(f"\n{game.npc.name}의 카드:")
     for i, card in enumerate(game.npc.cards):
-        if card.is_revealed:
+        if game.npc.is_card_revealed(card):
             print(f"  [{i+1}] {card} (공개)")
         else:
             print(f"  [{i+1}] ???  (비공개)")
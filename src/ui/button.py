@@ -9,6 +9,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import COLOR_WHITE, COLOR_BLACK, COLOR_HIGHLIGHT, COLOR_DANGER, COLOR_SUCCESS
+from ui.renderer import render_text
+from ui.display_list import draw_rect
 
 
 class Button:
@@ -105,14 +107,14 @@ class Button:
             text_color = self.text_color
         
         # 배경 그리기
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=8)
+        draw_rect(screen, bg_color, self.rect, border_radius=8)
         
         # 테두리 그리기
         border_color = self.border_color if self.enabled else (80, 80, 80)
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=8)
+        draw_rect(screen, border_color, self.rect, 2, border_radius=8)
         
         # 텍스트 그리기
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = render_text(self.font, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
     
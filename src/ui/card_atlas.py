@@ -0,0 +1,66 @@
+"""
+카드 텍스처 아틀라스
+카드 앞면 20장과 뒷면을 자주 쓰는 크기별로 미리 조정해 화면 픽셀 형식의
+큰 surface 하나에 모아 두고, 카드마다 subsurface로 꺼내 씁니다.
+"""
+
+import pygame
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+
+class CardAtlas:
+    """
+    카드 이미지 아틀라스
+
+    배율마다 한 줄씩 카드를 나란히 배치합니다.
+        1.0 : [1g][1t][2k]...[back]
+        0.8 : [1g][1t][2k]...[back]
+        ...
+    모든 카드가 같은 surface(화면 픽셀 형식)를 공유하므로 blit은 형식 변환 없는 복사입니다.
+    """
+
+    def __init__(self, images: Dict[Hashable, pygame.Surface], base_size: Tuple[int, int],
+                 scales: Iterable[float]):
+        """
+        Args:
+            images: {이미지 키: 원본 surface} (원본 크기는 달라도 됨)
+            base_size: 배율 1.0의 카드 크기 (너비, 높이)
+            scales: 미리 만들 배율
+        """
+        self.keys = list(images)
+        self.sizes = [(int(base_size[0] * scale), int(base_size[1] * scale))
+                      for scale in sorted(set(scales), reverse=True)]
+        self.regions = {}  # {(이미지 키, (너비, 높이)): subsurface}
+
+        # 카드별 위치 (배율마다 한 줄)
+        layout = []
+        y = 0
+        for size in self.sizes:
+            for index, key in enumerate(self.keys):
+                layout.append((key, pygame.Rect((index * size[0], y), size)))
+            y += size[1]
+
+        width = self.sizes[0][0] * len(self.keys) if self.sizes else 0
+        self.surface = pygame.Surface((max(width, 1), max(y, 1)), pygame.SRCALPHA)
+
+        # 원본에서 바로 조정해 배치 (1.0 배율 이미지를 다시 줄이는 것보다 화질이 좋음)
+        for key, rect in layout:
+            source = images[key]
+            if source.get_size() != rect.size:
+                source = pygame.transform.scale(source, rect.size)
+            self.surface.blit(source, rect)
+
+        # 화면이 있으면 화면 픽셀 형식으로 변환 (blit마다 형식 변환을 하지 않도록)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+        # 변환이 끝난 surface에서 카드별 영역을 잘라 둠
+        for key, rect in layout:
+            self.regions[(key, rect.size)] = self.surface.subsurface(rect)
+
+    def get(self, key: Hashable, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """미리 만든 카드 이미지를 반환합니다 (없는 키나 크기면 None)."""
+        return self.regions.get((key, size))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.keys
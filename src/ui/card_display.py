@@ -3,15 +3,24 @@
 """
 
 import pygame
+from collections import OrderedDict
+from typing import Tuple, Union
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     CARD_ASSETS_PATH, CARD_WIDTH, CARD_HEIGHT, COLOR_WHITE, COLOR_BLACK,
-    CARD_TYPE_GWANG, CARD_TYPE_TTI, CARD_TYPE_YEOLKKUT, CARD_TYPE_CODES
+    CARD_TYPE_GWANG, CARD_TYPE_TTI, CARD_TYPE_YEOLKKUT, CARD_TYPE_CODES,
+    CARD_SURFACE_CACHE_SIZE, CARD_ATLAS_SCALES
 )
 from core.card import Card
+from ui.card_atlas import CardAtlas
+from ui.display_list import draw_rect
+
+
+# 카드 뒷면 이미지 키 (get_scaled_image용)
+CARD_BACK_KEY = "back"
 
 
 class CardDisplay:
@@ -19,8 +28,17 @@ class CardDisplay:
     
     def __init__(self):
         """카드 표시 시스템을 초기화합니다."""
-        self.card_images = {}  # {(month, card_type): surface}
+        self.card_images = {}  # {(month, card_type): surface} (아틀라스의 1.0 배율 영역)
         self.card_back_image = None
+        self.atlas = None  # 카드 앞면 + 뒷면 아틀라스 (CARD_ATLAS_SCALES 배율)
+        
+        # 파일에서 읽은 원본 이미지 {파일명: surface 또는 None} (디스크는 파일당 한 번만 읽음)
+        self.file_images = {}
+        self.file_keys = {}  # {파일명: (month, card_type)} (아틀라스에 있는 카드 파일)
+        
+        # 크기별 이미지 캐시 {(이미지 키, (너비, 높이)): surface}, 오래 안 쓴 것부터 삭제
+        self.scaled_images = OrderedDict()
+        self.scaled_cache_size = CARD_SURFACE_CACHE_SIZE
         
         self.card_width = CARD_WIDTH
         self.card_height = CARD_HEIGHT
@@ -28,21 +46,24 @@ class CardDisplay:
         self._load_card_images()
     
     def _load_card_images(self):
-        """카드 이미지를 로드합니다."""
+        """
+        카드 이미지를 로드하고 아틀라스로 묶습니다.
+        
+        원본 이미지를 모두 읽은 뒤 CARD_ATLAS_SCALES 배율로 미리 조정해
+        화면 픽셀 형식의 surface 하나에 담고, 카드별로 그 영역을 씁니다.
+        """
+        originals = {}  # {이미지 키: 원본 surface}
+        
         # 카드 뒷면 이미지 로드 (또는 생성)
         back_path = os.path.join(CARD_ASSETS_PATH, "back.png")
         
         if os.path.exists(back_path):
             try:
-                self.card_back_image = pygame.image.load(back_path)
-                self.card_back_image = pygame.transform.scale(
-                    self.card_back_image, 
-                    (self.card_width, self.card_height)
-                )
+                originals[CARD_BACK_KEY] = pygame.image.load(back_path)
             except:
-                self.card_back_image = self._create_card_back()
+                originals[CARD_BACK_KEY] = self._create_card_back()
         else:
-            self.card_back_image = self._create_card_back()
+            originals[CARD_BACK_KEY] = self._create_card_back()
         
         # 화투 카드 이미지 로드
         # 파일명 패턴: {month}{code}.png (예: 1g.png, 2t.png, 3k.png)
@@ -62,19 +83,26 @@ class CardDisplay:
                 if os.path.exists(card_path):
                     try:
                         image = pygame.image.load(card_path)
-                        image = pygame.transform.scale(
-                            image, 
-                            (self.card_width, self.card_height)
-                        )
-                        self.card_images[(month, card_type)] = image
+                        originals[(month, card_type)] = image
+                        # 족보 안내처럼 파일명으로 찾는 경우도 아틀라스를 쓰도록 기록
+                        self.file_images[f"{month}{type_code}.png"] = image
+                        self.file_keys[f"{month}{type_code}.png"] = (month, card_type)
                         # print(f"카드 이미지 로드 성공: {month}{type_code}.png")
                     except Exception as e:
                         print(f"카드 이미지 로드 실패: {card_path} - {e}")
                         # 폴백: 텍스트 카드 생성
-                        self.card_images[(month, card_type)] = self._create_text_card(
+                        originals[(month, card_type)] = self._create_text_card(
                             month, card_type
                         )
                 # 이미지 파일이 없어도 에러 없이 진행 (해당 월에 그 타입이 없을 수 있음)
+        
+        # 아틀라스 생성 및 1.0 배율 영역 연결
+        base_size = (self.card_width, self.card_height)
+        self.atlas = CardAtlas(originals, base_size, CARD_ATLAS_SCALES + (1.0,))  # 1.0은 항상 포함
+        self.card_back_image = self.atlas.get(CARD_BACK_KEY, base_size)
+        for key in originals:
+            if key != CARD_BACK_KEY:
+                self.card_images[key] = self.atlas.get(key, base_size)
     
     def _create_card_back(self) -> pygame.Surface:
         """
@@ -138,29 +166,80 @@ class CardDisplay:
         
         return surface
     
-    def get_card_image(self, card: Card, revealed: bool = None) -> pygame.Surface:
+    def get_card_image(self, card: Card, revealed: bool = True) -> pygame.Surface:
         """
         카드 이미지를 가져옵니다.
         
         Args:
             card: 카드 객체
-            revealed: 공개 여부 (None이면 카드의 상태 사용)
+            revealed: 공개 여부 (False면 뒷면, 카드는 게임끼리 공유하므로 공개 여부는
+                      Player.is_card_revealed로 구해서 넘김)
             
         Returns:
             카드 이미지 surface
         """
-        if revealed is None:
-            revealed = card.is_revealed
-        
         if revealed:
             key = (card.month, card.card_type)
-            return self.card_images.get(key, self._create_text_card(card.month, card.card_type))
+            if key not in self.card_images:
+                self.card_images[key] = self._create_text_card(card.month, card.card_type)
+            return self.card_images[key]
         else:
             return self.card_back_image
     
+    def get_scaled_image(self, key: Union[Tuple[int, str], str],
+                         size: Tuple[int, int]) -> pygame.Surface:
+        """
+        크기를 조정한 카드 이미지를 가져옵니다.
+        
+        아틀라스에 미리 만든 크기는 그 영역을 그대로 쓰고,
+        그 밖의 크기는 한 번만 조정해 캐시합니다.
+        
+        Args:
+            key: (month, card_type), CARD_BACK_KEY, 또는 이미지 파일명 (예: "1g.png")
+            size: (너비, 높이)
+            
+        Returns:
+            카드 이미지 surface (파일을 읽을 수 없으면 None)
+        """
+        # 아틀라스에 미리 만든 크기면 그대로 사용
+        if isinstance(key, str) and key in self.file_keys:
+            key = self.file_keys[key]
+        if self.atlas is not None:
+            image = self.atlas.get(key, size)
+            if image is not None:
+                return image
+        
+        cache_key = (key, size)
+        image = self.scaled_images.get(cache_key)
+        if image is not None:
+            self.scaled_images.move_to_end(cache_key)
+            return image
+        
+        if key == CARD_BACK_KEY:
+            source = self.card_back_image
+        elif isinstance(key, str):
+            source = self.load_card_image(key)
+        else:
+            if key not in self.card_images:
+                self.card_images[key] = self._create_text_card(*key)
+            source = self.card_images[key]
+        if source is None:
+            return None
+        
+        if source.get_size() == size:
+            image = source
+        else:
+            image = pygame.transform.scale(source, size)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()  # 화면 픽셀 형식으로 (blit 시 변환 없음)
+        self.scaled_images[cache_key] = image
+        if len(self.scaled_images) > self.scaled_cache_size:
+            self.scaled_images.popitem(last=False)
+        return image
+    
     def load_card_image(self, filename: str) -> pygame.Surface:
         """
-        파일명으로 카드 이미지를 직접 로드합니다.
+        파일명으로 카드 이미지를 직접 로드합니다 (파일당 한 번만 읽고 캐시).
         
         Args:
             filename: 카드 이미지 파일명 (예: "1g.png", "2t.png")
@@ -168,22 +247,27 @@ class CardDisplay:
         Returns:
             카드 이미지 surface (로드 실패 시 None)
         """
+        if filename in self.file_images:
+            return self.file_images[filename]
+        
         card_path = os.path.join(CARD_ASSETS_PATH, filename)
+        image = None
         
         if os.path.exists(card_path):
             try:
                 image = pygame.image.load(card_path)
-                # 원본 크기로 반환 (스케일링은 호출자가 처리)
-                return image
+                # 원본 크기로 반환 (스케일링은 호출자가 처리, 크기별 캐시는 get_scaled_image)
             except Exception as e:
                 print(f"카드 이미지 로드 실패: {card_path} - {e}")
-                return None
         else:
             print(f"카드 이미지 파일이 없습니다: {card_path}")
-            return None
+        
+        # 실패도 기록해 매 프레임 다시 읽거나 경고를 반복하지 않음
+        self.file_images[filename] = image
+        return image
     
     def draw_card(self, screen, card: Card, x: int, y: int, 
-                  revealed: bool = None, scale: float = 1.0):
+                  revealed: bool = True, scale: float = 1.0):
         """
         카드를 화면에 그립니다.
         
@@ -196,11 +280,11 @@ class CardDisplay:
         """
         image = self.get_card_image(card, revealed)
         
-        # 크기 조정
+        # 크기 조정 (크기별 캐시 사용)
         if scale != 1.0:
-            new_width = int(self.card_width * scale)
-            new_height = int(self.card_height * scale)
-            image = pygame.transform.scale(image, (new_width, new_height))
+            key = (card.month, card.card_type) if revealed else CARD_BACK_KEY
+            size = (int(self.card_width * scale), int(self.card_height * scale))
+            image = self.get_scaled_image(key, size)
         
         screen.blit(image, (x, y))
     
@@ -214,14 +298,14 @@ class CardDisplay:
             cards: 카드 리스트
             x, y: 시작 위치
             spacing: 카드 간 간격
-            revealed: 각 카드의 공개 여부 리스트
+            revealed: 각 카드의 공개 여부 리스트 (None이면 모두 앞면)
             scale: 크기 배율
         """
         current_x = x
         card_width = int(self.card_width * scale)
         
         for i, card in enumerate(cards):
-            is_revealed = revealed[i] if revealed else None
+            is_revealed = revealed[i] if revealed else True
             self.draw_card(screen, card, current_x, y, is_revealed, scale)
             current_x += card_width + spacing
     
@@ -288,7 +372,7 @@ class CardDisplay:
             
             # 선택 표시
             if i in selected_indices:
-                pygame.draw.rect(screen, (255, 255, 0), rect, 3, border_radius=8)
+                draw_rect(screen, (255, 255, 0), rect, 3, border_radius=8)
             
             current_x += card_width + spacing
         
@@ -313,8 +397,7 @@ if __name__ == "__main__":
     deck.shuffle()
     
     test_cards = [deck.draw() for _ in range(5)]
-    test_cards[0].reveal()
-    test_cards[2].reveal()
+    test_revealed = [True, False, True, False, False]
     
     selected = {1, 3}
     
@@ -349,7 +432,7 @@ if __name__ == "__main__":
         # 여러 카드 (일부 공개)
         label3 = small_font.render("여러 카드 (일부 공개):", True, COLOR_WHITE)
         screen.blit(label3, (100, 300))
-        card_display.draw_cards(screen, test_cards, 100, 330)
+        card_display.draw_cards(screen, test_cards, 100, 330, revealed=test_revealed)
         
         # 클릭 가능한 카드 (선택된 카드 있음)
         label4 = small_font.render("클릭 가능한 카드 (노란색=선택됨):", True, COLOR_WHITE)
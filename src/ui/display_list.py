@@ -0,0 +1,265 @@
+"""
+화면 그리기 기록 (디스플레이 리스트)
+화면에 바로 그리지 않고 blit/fill/도형 그리기 호출을 프레임마다 기록한 뒤,
+직전 프레임의 기록과 비교해 달라진 그리기의 영역만 다시 그리고 화면에 반영합니다.
+"""
+
+import pygame
+from collections import Counter
+from typing import List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DIRTY_RECT_LIMIT
+
+
+def _freeze(value):
+    """Rect/Color/리스트처럼 바뀔 수 있는 인자를 비교 가능한 튜플로 바꿉니다."""
+    if isinstance(value, (pygame.Rect, pygame.Color)):
+        return tuple(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _DrawOp:
+    """기록된 그리기 호출 하나"""
+
+    __slots__ = ('key', 'rect', 'kind', 'args', 'kwargs', 'clip')
+
+    def __init__(self, kind: str, args: tuple, kwargs: dict, rect: pygame.Rect, clip):
+        self.kind = kind
+        self.args = args
+        self.kwargs = kwargs
+        self.rect = rect  # 이 그리기가 바꿀 수 있는 영역 (클리핑 적용)
+        self.clip = clip  # 기록할 때의 클리핑 영역 (None이면 없음)
+        # blit할 surface는 객체 자체로 비교 (캐시에서 꺼낸 같은 surface면 같은 그리기)
+        self.key = (kind, args, tuple(sorted(kwargs.items())), clip)
+
+
+class DisplayList:
+    """
+    화면 surface 대신 그리기 호출을 기록하는 객체
+
+    blit/fill/set_clip과 크기 조회는 화면 surface와 같은 방식으로 쓰고,
+    도형은 draw_rect/draw_ellipse/draw_line으로 그립니다.
+    present()가 직전 프레임과 달라진 그리기의 영역만 실제 화면에 다시 그립니다.
+
+    blit한 surface는 객체로 비교하므로 캐시처럼 한 번 만든 뒤 수정하지 않는
+    surface여야 합니다 (매번 새로 만든 surface는 항상 변경으로 처리).
+    """
+
+    def __init__(self, target: pygame.Surface):
+        """
+        Args:
+            target: 실제로 그릴 화면 surface
+        """
+        self.target = target
+        self._ops: List[_DrawOp] = []
+        self._clip = None
+        self._previous: Optional[List[_DrawOp]] = None  # 직전 프레임 기록 (surface가 재사용되지 않도록 유지)
+        self._previous_keys = None
+
+    # ---------- 화면 정보 (실제 화면에 위임) ----------
+
+    def get_size(self):
+        return self.target.get_size()
+
+    def get_width(self) -> int:
+        return self.target.get_width()
+
+    def get_height(self) -> int:
+        return self.target.get_height()
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        return self.target.get_rect(**kwargs)
+
+    def get_flags(self) -> int:
+        return self.target.get_flags()
+
+    # ---------- 그리기 기록 ----------
+
+    def set_clip(self, rect=None):
+        """이후 그리기의 클리핑 영역을 정합니다 (None이면 해제)."""
+        self._clip = None if rect is None else tuple(pygame.Rect(rect).clip(self.target.get_rect()))
+
+    def get_clip(self) -> pygame.Rect:
+        return pygame.Rect(self._clip) if self._clip is not None else self.target.get_rect()
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags=0) -> pygame.Rect:
+        """surface를 그립니다 (Surface.blit과 같은 인자)."""
+        x, y = dest[0], dest[1]
+        width, height = pygame.Rect(area).size if area is not None else source.get_size()
+        return self.record('blit', (source, _freeze(dest), _freeze(area), special_flags), {},
+                           pygame.Rect(x, y, width, height))
+
+    def fill(self, color, rect=None, special_flags=0) -> pygame.Rect:
+        """영역을 단색으로 채웁니다 (Surface.fill과 같은 인자)."""
+        bounds = pygame.Rect(rect) if rect is not None else self.target.get_rect()
+        return self.record('fill', (_freeze(color), _freeze(rect), special_flags), {}, bounds)
+
+    def record(self, kind: str, args: tuple, kwargs: dict, bounds: pygame.Rect) -> pygame.Rect:
+        """
+        그리기 호출 하나를 기록합니다.
+
+        Args:
+            kind: 'blit', 'fill' 또는 pygame.draw 함수 이름
+            args: 그릴 대상 surface를 뺀 인자 (튜플로 고정된 값)
+            kwargs: 키워드 인자
+            bounds: 그리기가 바꿀 수 있는 영역
+
+        Returns:
+            화면과 클리핑 영역 안으로 자른 영역
+        """
+        rect = bounds.clip(self.get_clip())
+        self._ops.append(_DrawOp(kind, args, kwargs, rect, self._clip))
+        return rect
+
+    # ---------- 화면 반영 ----------
+
+    def retarget(self, target: pygame.Surface):
+        """그릴 화면을 바꿉니다 (set_mode 후). 다음 프레임은 전체를 다시 그립니다."""
+        self.target = target
+        self.invalidate()
+
+    def invalidate(self):
+        """다음 프레임은 전체를 다시 그립니다 (창 복원 등 화면 내용이 사라졌을 때)."""
+        self._previous = None
+        self._previous_keys = None
+
+    def present(self):
+        """
+        이번 프레임 기록을 화면에 그리고 기록을 비웁니다.
+
+        Returns:
+            다시 그린 영역 Rect 목록 (바뀐 게 없으면 빈 목록), 전체를 다시 그렸으면 None
+        """
+        ops, previous, previous_keys = self._ops, self._previous, self._previous_keys
+        keys = [op.key for op in ops]
+        self._ops, self._previous, self._previous_keys = [], ops, keys
+        self._clip = None
+
+        if previous_keys is None:
+            self._replay(ops)
+            return None
+        if keys == previous_keys:
+            return []
+
+        # 개수가 달라진 그리기 = 이번 프레임에 새로 생기거나 사라진 그리기
+        old_counts, new_counts = Counter(previous_keys), Counter(keys)
+        changed = {key for key in old_counts.keys() | new_counts.keys() if old_counts[key] != new_counts[key]}
+
+        # 나머지 그리기의 순서가 바뀌었으면 (겹친 순서 변경) 영역을 특정할 수 없어 전체를 다시 그림
+        if [key for key in previous_keys if key not in changed] != [key for key in keys if key not in changed]:
+            self._replay(ops)
+            return None
+
+        rects = [op.rect for op in previous if op.key in changed and op.rect]
+        rects += [op.rect for op in ops if op.key in changed and op.rect]
+        dirty = _merge_rects(rects)
+        for rect in dirty:
+            self._replay(ops, rect)
+        return dirty
+
+    def _replay(self, ops: List[_DrawOp], region: pygame.Rect = None):
+        """기록을 실제 화면에 그립니다 (region이 있으면 그 영역만)."""
+        target = self.target
+        current_clip = None
+        for op in ops:
+            if region is not None and not region.colliderect(op.rect):
+                continue
+
+            clip = op.clip
+            if region is not None:
+                clip = region.clip(clip) if clip is not None else region
+            if clip != current_clip:
+                target.set_clip(clip)
+                current_clip = clip
+
+            if op.kind == 'blit':
+                target.blit(*op.args)
+            elif op.kind == 'fill':
+                target.fill(*op.args)
+            else:
+                getattr(pygame.draw, op.kind)(target, *op.args, **op.kwargs)
+        target.set_clip(None)
+
+
+def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """겹치는 영역을 합칩니다. DIRTY_RECT_LIMIT개보다 많으면 전부 하나로 합칩니다."""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+
+    if len(merged) > DIRTY_RECT_LIMIT:
+        return [merged[0].unionall(merged[1:])]
+    return merged
+
+
+# ---------- 도형 그리기 (pygame.draw와 같은 인자, DisplayList면 기록) ----------
+
+def draw_rect(surface, color, rect, width=0, **kwargs) -> pygame.Rect:
+    """pygame.draw.rect와 같습니다 (DisplayList에는 기록)."""
+    if isinstance(surface, DisplayList):
+        frozen = {name: _freeze(value) for name, value in kwargs.items()}
+        return surface.record('rect', (_freeze(color), _freeze(rect), width), frozen, pygame.Rect(rect))
+    return pygame.draw.rect(surface, color, rect, width, **kwargs)
+
+
+def draw_ellipse(surface, color, rect, width=0) -> pygame.Rect:
+    """pygame.draw.ellipse와 같습니다 (DisplayList에는 기록)."""
+    if isinstance(surface, DisplayList):
+        return surface.record('ellipse', (_freeze(color), _freeze(rect), width), {}, pygame.Rect(rect))
+    return pygame.draw.ellipse(surface, color, rect, width)
+
+
+def draw_line(surface, color, start_pos, end_pos, width=1) -> pygame.Rect:
+    """pygame.draw.line과 같습니다 (DisplayList에는 기록)."""
+    if isinstance(surface, DisplayList):
+        left, right = sorted((int(start_pos[0]), int(end_pos[0])))
+        top, bottom = sorted((int(start_pos[1]), int(end_pos[1])))
+        bounds = pygame.Rect(left, top, right - left + 1, bottom - top + 1).inflate(width * 2, width * 2)
+        return surface.record('line', (_freeze(color), _freeze(start_pos), _freeze(end_pos), width), {}, bounds)
+    return pygame.draw.line(surface, color, start_pos, end_pos, width)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 디스플레이 리스트 테스트 ===\n")
+
+    pygame.init()
+    screen = pygame.display.set_mode((320, 240))
+    display_list = DisplayList(screen)
+    label = pygame.font.Font(None, 24).render("Tazza", True, (255, 255, 255))
+
+    def draw_frame(toast: bool):
+        display_list.fill((20, 40, 30))
+        draw_ellipse(display_list, (0, 100, 50), (40, 60, 240, 120))
+        draw_rect(display_list, (255, 215, 0), (10, 10, 100, 40), 2, border_radius=8)
+        display_list.blit(label, (20, 20))
+        if toast:
+            draw_rect(display_list, (0, 0, 0), (200, 200, 100, 30))
+
+    draw_frame(False)
+    print(f"첫 프레임: {'전체' if display_list.present() is None else '부분'}")
+    draw_frame(False)
+    print(f"같은 프레임 다시 그린 영역: {display_list.present()}")
+    draw_frame(True)
+    print(f"알림 추가 시 다시 그린 영역: {display_list.present()}")
+
+    # 기록 후 다시 그린 화면이 바로 그린 화면과 같은지 확인
+    expected = pygame.Surface(screen.get_size())
+    expected.fill((20, 40, 30))
+    pygame.draw.ellipse(expected, (0, 100, 50), (40, 60, 240, 120))
+    pygame.draw.rect(expected, (255, 215, 0), (10, 10, 100, 40), 2, border_radius=8)
+    expected.blit(label, (20, 20))
+    pygame.draw.rect(expected, (0, 0, 0), (200, 200, 100, 30))
+    print(f"바로 그린 화면과 같음: {pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')}")
+
+    pygame.quit()
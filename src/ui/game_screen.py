@@ -14,13 +14,16 @@ from config import (
     COLOR_WHITE, COLOR_HIGHLIGHT, COLOR_GOLD, COLOR_SUCCESS, COLOR_DANGER,
     COLOR_BLACK, COLOR_WARNING, COLOR_LIGHT_GRAY,
     CARD_WIDTH, CARD_HEIGHT,
-    COLOR_COMMON, COLOR_UNCOMMON, COLOR_RARE, COLOR_EPIC, COLOR_LEGENDARY, COLOR_MYTHIC
+    COLOR_COMMON, COLOR_UNCOMMON, COLOR_RARE, COLOR_EPIC, COLOR_LEGENDARY, COLOR_MYTHIC,
+    NPC_PROFILES
 )
 
 from core.game import SutdaGame, GameState, BetAction
+from ai.dialogue_service import DialogueService, situation_key
 from ui.renderer import Renderer
+from ui.display_list import draw_rect, draw_line
 from ui.button import Button, BetButton, DangerButton, HighlightButton, ButtonGroup
-from ui.card_display import CardDisplay
+from ui.card_display import CardDisplay, CARD_BACK_KEY
 
 
 class GameScreen:
@@ -50,6 +53,11 @@ class GameScreen:
         self.show_inner_thought = False  # 속마음 표시 여부
         self.inner_thought_text = ""  # 속마음 텍스트
         self.inner_thought_close_button = None  # 속마음 닫기 버튼
+        self.dialogue_streaming = False  # NPC 대사가 아직 생성 중 (말풍선에 실시간 출력)
+        self.npc_will_speak = None  # 이번 베팅 페이즈 첫 NPC 턴에 말할지 (미리 생성할 때 정함, None이면 턴에서 정함)
+        
+        # NPC 대사 생성 (백그라운드 스레드, 현재 게임의 LLM 핸들러를 처음 요청할 때 불러옴)
+        self.dialogue_service = DialogueService(lambda: self.game.llm)
         
         # Zone UI
         self.zone_active = False
@@ -105,6 +113,10 @@ class GameScreen:
                 self.running = False
                 return False
             
+            # 창이 다시 보이면 화면 전체를 다시 반영 (변경 영역 렌더링)
+            if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED):
+                self.renderer.invalidate()
+            
             # 족보 화면이 열려있을 때는 족보 관련 이벤트만 처리
             if self.show_hand_guide:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -517,10 +529,7 @@ class GameScreen:
     def _draw_hand_guide(self):
         """족보 화면을 그립니다."""
         # 반투명 배경
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(COLOR_BLACK)
-        self.renderer.screen.blit(overlay, (0, 0))
+        self.renderer.draw_overlay(200)
         
         # 족보 상자 크기 및 위치
         box_width = 900
@@ -529,13 +538,11 @@ class GameScreen:
         box_y = (SCREEN_HEIGHT - box_height) // 2
         
         # 족보 상자 배경
-        guide_bg = pygame.Surface((box_width, box_height))
-        guide_bg.set_alpha(240)
-        guide_bg.fill((30, 30, 40))
+        guide_bg = self.renderer.layers.fill((box_width, box_height), (30, 30, 40), 240)
         self.renderer.screen.blit(guide_bg, (box_x, box_y))
         
         # 족보 상자 테두리
-        pygame.draw.rect(
+        draw_rect(
             self.renderer.screen,
             COLOR_GOLD,
             (box_x, box_y, box_width, box_height),
@@ -642,11 +649,10 @@ class GameScreen:
                 card_x = x_pos + card_idx * (card_img_width + card_spacing)
                 card_y = y_pos + 25  # 월 이름과 카드 사이 간격 증가
                 
-                # 카드 이미지 로드 및 표시
-                card_img = self.card_display.load_card_image(card_file)
+                # 카드 이미지 표시 (크기별 캐시)
+                card_img = self.card_display.get_scaled_image(card_file, (card_img_width, card_img_height))
                 if card_img:
-                    scaled_img = pygame.transform.scale(card_img, (card_img_width, card_img_height))
-                    self.renderer.screen.blit(scaled_img, (card_x, card_y))
+                    self.renderer.screen.blit(card_img, (card_x, card_y))
         
         # 다음 섹션 위치 조정
         y_offset += row_height * 2 + 20
@@ -697,11 +703,10 @@ class GameScreen:
                 card_x = card_start_x + idx * (rank_card_width + rank_card_spacing)
                 card_y = y_offset - 5  # 텍스트와 정렬
                 
-                # 카드 이미지 로드 및 표시
-                card_img = self.card_display.load_card_image(card_file)
+                # 카드 이미지 표시 (크기별 캐시)
+                card_img = self.card_display.get_scaled_image(card_file, (rank_card_width, rank_card_height))
                 if card_img:
-                    scaled_img = pygame.transform.scale(card_img, (rank_card_width, rank_card_height))
-                    self.renderer.screen.blit(scaled_img, (card_x, card_y))
+                    self.renderer.screen.blit(card_img, (card_x, card_y))
             
             # 설명 (오른쪽)
             self.renderer.draw_text(
@@ -734,7 +739,7 @@ class GameScreen:
             scrollbar_height = max(30, int(content_height * content_height / total_content_height))
             scrollbar_y = content_y + int((self.hand_guide_scroll / max_scroll) * (content_height - scrollbar_height))
             
-            pygame.draw.rect(
+            draw_rect(
                 self.renderer.screen,
                 COLOR_GOLD,
                 (box_x + box_width - 15, scrollbar_y, 8, scrollbar_height),
@@ -755,13 +760,11 @@ class GameScreen:
         box_y = 100
         
         # 배경
-        history_bg = pygame.Surface((box_width, box_height))
-        history_bg.set_alpha(220)
-        history_bg.fill((20, 20, 30))
+        history_bg = self.renderer.layers.fill((box_width, box_height), (20, 20, 30), 220)
         self.renderer.screen.blit(history_bg, (box_x, box_y))
         
         # 테두리
-        pygame.draw.rect(
+        draw_rect(
             self.renderer.screen,
             COLOR_GOLD,
             (box_x, box_y, box_width, box_height),
@@ -888,16 +891,16 @@ class GameScreen:
             npc_hand = evaluator.evaluate(self.game.npc.cards)
             
             # 상대방 공개 카드
-            player_visible_cards = [card for card in self.game.player.cards if card.is_revealed]
+            player_visible_cards = self.game.player.get_revealed_cards()
 
-            # NPC 대사
-            if self.game.npc.should_speak():
-                from ai.llm_handler import LLMHandler
-                llm = LLMHandler()
-                # 대사 가져오기
-                talk, inner_talk = llm.generate_dialogue(self.game)
-                self.inner_thought_text = inner_talk  # 속마음 저장
-                self.show_dialogue(self.game.npc.name, talk, wait_for_click=True)
+            # NPC 대사 (백그라운드에서 생성, 완성되면 update에서 표시 - 베팅은 기다리지 않음)
+            # 베팅 페이즈 첫 턴은 대사를 미리 생성할 때 정한 결정을 따름
+            will_speak = self.npc_will_speak
+            self.npc_will_speak = None
+            if will_speak is None:
+                will_speak = self.game.npc.should_speak()
+            if will_speak:
+                self.dialogue_service.request(self.game, self.game.npc.name)
             
             # NPC가 콜해야 하는 금액 계산 (플레이어 베팅액 - NPC 베팅액)
             call_amount = self.game.player_current_bet - self.game.npc_current_bet
@@ -967,6 +970,7 @@ class GameScreen:
             # 1차 베팅이 끝났고 아직 카드가 2장이면 3번째 카드 배분
             if self.game.betting_phase == 0 and len(self.game.player.cards) == 2:
                 self.game.deal_third_card()
+                self._prefetch_npc_dialogue()
                 self.show_message("3번째 카드 배분! 2차 베팅 시작!", 3000)
                 
                 # 2차 베팅 시작 - NPC가 선이면 NPC 턴 대기 설정
@@ -1216,10 +1220,7 @@ class GameScreen:
     def _draw_exit_popup(self):
         """ESC 팝업 그리기"""
         # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.renderer.screen.blit(overlay, (0, 0))
+        self.renderer.draw_overlay(200)
         
         # 팝업 창
         popup_width = 500
@@ -1228,8 +1229,8 @@ class GameScreen:
         popup_y = (SCREEN_HEIGHT - popup_height) // 2
         
         popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(self.renderer.screen, (40, 40, 40), popup_rect)
-        pygame.draw.rect(self.renderer.screen, (100, 100, 100), popup_rect, 3)
+        draw_rect(self.renderer.screen, (40, 40, 40), popup_rect)
+        draw_rect(self.renderer.screen, (100, 100, 100), popup_rect, 3)
         
         # 타이틀
         self.renderer.draw_text(
@@ -1252,37 +1253,7 @@ class GameScreen:
     def _confirm_npc_selection(self):
         """NPC 선택을 확정하고 게임을 시작합니다."""
         # 선택된 NPC 정보
-        npc_list = [
-            {
-                "name": "호구",
-                "composure": 1,
-                "deception": 1,
-                "boldness": 2,
-                "recovery": 1,
-                "persona": "도박판의 가장 밑바닥",
-                "catchphrase": "그래, 파도! 올라갔으면 내려가고, 내려갔다가 다시 올라가는 거야!"
-            },
-            {
-                "name": "고광렬",
-                "composure": 3,
-                "deception": 9,
-                "boldness": 7,
-                "recovery": 5,
-                "persona": "대학 시절 타짜였던 노련한 플레이어",
-                "catchphrase": "아유... 뭐 돈 따려고 칩니까? 재미있자고 치는 거지."
-            },
-            {
-                "name": "아귀",
-                "composure": 10,
-                "deception": 9,
-                "boldness": 9,
-                "recovery": 10,
-                "persona": "냉철하고 계산적인 베테랑 도박사",
-                "catchphrase": "깨끗이 칩시다. 혹시나 뽀록나면 저 망치로 손모가지 분질러 블랑게."
-            }
-        ]
-        
-        selected_npc = npc_list[self.selected_npc_index]
+        selected_npc = NPC_PROFILES[self.selected_npc_index]
         
         # NPC 생성 및 게임 초기화
         from ai.npc import NPCPlayer
@@ -1325,11 +1296,11 @@ class GameScreen:
         
         # 선택한 카드 공개
         selected_index = list(self.selected_card_indices)[0]
-        self.game.player.cards[selected_index].reveal()
+        self.game.player.reveal_card(selected_index)
         
         # NPC도 카드 선택 (AI 로직 사용)
-        npc_choice = self.game.npc.choose_card_to_reveal(self.game.player.cards)
-        self.game.npc.cards[npc_choice].reveal()
+        npc_choice = self.game.npc.choose_card_to_reveal(self.game.player.get_revealed_cards())
+        self.game.npc.reveal_card(npc_choice)
         
         # 선택 초기화
         self.selected_card_indices.clear()
@@ -1339,6 +1310,7 @@ class GameScreen:
         
         # 1차 베팅 시작
         self.game.start_new_betting_phase(0)
+        self._prefetch_npc_dialogue()
         
         # 추가 베팅 버튼 생성
         self._create_additional_bet_buttons()
@@ -1399,15 +1371,10 @@ class GameScreen:
         
         if current_flags & pygame.FULLSCREEN:
             # 전체화면 -> 창 모드
-            self.renderer.screen = pygame.display.set_mode(
-                (SCREEN_WIDTH, SCREEN_HEIGHT)
-            )
+            self.renderer.set_mode()
         else:
             # 창 모드 -> 전체화면
-            self.renderer.screen = pygame.display.set_mode(
-                (SCREEN_WIDTH, SCREEN_HEIGHT),
-                pygame.FULLSCREEN
-            )
+            self.renderer.set_mode(pygame.FULLSCREEN)
         
         # 화면 제목 유지
         pygame.display.set_caption(SCREEN_TITLE)
@@ -1419,8 +1386,9 @@ class GameScreen:
             self.game.showdown()
             self.show_message("쇼다운! 패를 공개합니다!", 3000)
         elif self.game.state == GameState.ROUND_END:
-            # 라운드 종료
+            # 라운드 종료 (끝난 라운드의 대사 요청은 버림)
             self.game.end_round()
+            self._cancel_npc_dialogue()
             
             if self.game.state != GameState.GAME_OVER:
                 # 라운드 종료 후 선택 초기화
@@ -1435,6 +1403,7 @@ class GameScreen:
         """게임을 재시작하고 메인 타이틀로 돌아갑니다."""
         # 게임 상태 초기화
         self.game = SutdaGame()
+        self._cancel_npc_dialogue()
         
         # UI 상태 초기화
         self.selected_combo_index = None
@@ -1529,37 +1498,24 @@ class GameScreen:
         # 플레이어 이름 입력 필드
         self._draw_name_input()
         
-        # NPC 목록 (예시로 3명의 NPC)
-        npc_list = [            
-            {
-                "name": "호구",
-                "desc": "도박판의 가장 밑바닥.",
-                "stats": "침착 1 | 기만 1 | 대담 2 | 회복 1",
-                "catchphrase": "그래, 파도! 올라갔으면 내려가고,\n내려갔다가 다시 올라가는 거야!",
-                "difficulty": "초급"
-            },
-            {
-                "name": "고광렬",
-                "desc": "대학 시절 타짜였던 노련한 플레이어",
-                "stats": "침착 3 | 기만 9 | 대담 7 | 회복 5",
-                "catchphrase": "아유... 뭐 돈 따려고 칩니까?\n재미있자고 치는 거지.",
-                "difficulty": "중급"
-            },
+        # NPC 목록 (config.NPC_PROFILES, 능력치는 프로필 값으로 표시)
+        stat_labels = [("composure", "침착"), ("deception", "기만"), ("boldness", "대담"), ("recovery", "회복")]
+        npc_list = [
             {
-                "name": "아귀",
-                "desc": "냉철하고 계산적인 베테랑 도박사",
-                "stats": "침착 10 | 기만 9 | 대담 9 | 회복 10",
-                "catchphrase": "깨끗이 칩시다. 혹시나 뽀록나면\n저 망치로 손모가지 분질러 블랑게.",
-                "difficulty": "고급"
+                "name": profile["name"],
+                "desc": profile["persona"],
+                "stats": " | ".join(f"{label} {profile[key]}" for key, label in stat_labels),
+                "catchphrase": profile["catchphrase"],
+                "difficulty": profile["difficulty"]
             }
-            
+            for profile in NPC_PROFILES
         ]
         
         # NPC 카드 표시
         card_width = 350
         card_height = 300
         spacing = 40
-        start_x = (SCREEN_WIDTH - (card_width * 3 + spacing * 2)) // 2
+        start_x = (SCREEN_WIDTH - (card_width * len(npc_list) + spacing * (len(npc_list) - 1))) // 2
         start_y = 180
         
         # NPC 카드 영역 초기화
@@ -1584,8 +1540,7 @@ class GameScreen:
                 bg_color = (40, 40, 40, 220)  # 기본 배경
             
             # 카드 배경
-            surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-            pygame.draw.rect(surface, bg_color, surface.get_rect(), border_radius=15)
+            surface = self.renderer.layers.rounded((card_width, card_height), bg_color, 15)
             self.renderer.screen.blit(surface, (x, y))
             
             # 테두리 (선택 시 골드, 호버 시 흰색, 기본 회색)
@@ -1599,7 +1554,7 @@ class GameScreen:
                 border_color = COLOR_LIGHT_GRAY
                 border_width = 2
             
-            pygame.draw.rect(self.renderer.screen, border_color, card_rect, border_width, border_radius=15)
+            draw_rect(self.renderer.screen, border_color, card_rect, border_width, border_radius=15)
             
             # 난이도 뱃지
             difficulty_colors = {
@@ -1609,7 +1564,7 @@ class GameScreen:
             }
             badge_color = difficulty_colors.get(npc_info["difficulty"], COLOR_WHITE)
             badge_rect = pygame.Rect(x + 10, y + 10, 60, 30)
-            pygame.draw.rect(self.renderer.screen, badge_color, badge_rect, border_radius=5)
+            draw_rect(self.renderer.screen, badge_color, badge_rect, border_radius=5)
             self.renderer.draw_text(
                 npc_info["difficulty"],
                 x + 40, y + 25,
@@ -1705,11 +1660,11 @@ class GameScreen:
         
         # 입력 상자 배경
         bg_color = (50, 50, 60) if self.name_input_active else (30, 30, 40)
-        pygame.draw.rect(self.renderer.screen, bg_color, self.name_input_rect, border_radius=5)
+        draw_rect(self.renderer.screen, bg_color, self.name_input_rect, border_radius=5)
         
         # 입력 상자 테두리
         border_color = COLOR_GOLD if self.name_input_active else COLOR_LIGHT_GRAY
-        pygame.draw.rect(self.renderer.screen, border_color, self.name_input_rect, 2, border_radius=5)
+        draw_rect(self.renderer.screen, border_color, self.name_input_rect, 2, border_radius=5)
         
         # 입력된 텍스트
         self.renderer.draw_text(
@@ -1720,10 +1675,9 @@ class GameScreen:
         
         # 활성 상태일 때 커서 표시
         if self.name_input_active and (pygame.time.get_ticks() // 500) % 2 == 0:
-            text_surf = self.renderer.font_normal.render(self.player_name, True, COLOR_WHITE)
-            cursor_x = input_x + 10 + text_surf.get_width()
+            cursor_x = input_x + 10 + self.renderer.font_normal.size(self.player_name)[0]
             cursor_y = input_y + 5
-            pygame.draw.line(self.renderer.screen, COLOR_WHITE, (cursor_x, cursor_y), (cursor_x, cursor_y + input_box_height - 10), 2)
+            draw_line(self.renderer.screen, COLOR_WHITE, (cursor_x, cursor_y), (cursor_x, cursor_y + input_box_height - 10), 2)
     
     def _draw_card_selection(self):
         """카드 선택 화면을 그립니다."""
@@ -1828,13 +1782,13 @@ class GameScreen:
             
             if is_selected:
                 # 선택된 조합: 금색 테두리
-                pygame.draw.rect(self.renderer.screen, COLOR_GOLD, rect, 3)
+                draw_rect(self.renderer.screen, COLOR_GOLD, rect, 3)
             elif is_hovered:
                 # 호버: 흰색 테두리
-                pygame.draw.rect(self.renderer.screen, COLOR_WHITE, rect, 2)
+                draw_rect(self.renderer.screen, COLOR_WHITE, rect, 2)
             else:
                 # 기본: 회색 테두리
-                pygame.draw.rect(self.renderer.screen, COLOR_LIGHT_GRAY, rect, 1)
+                draw_rect(self.renderer.screen, COLOR_LIGHT_GRAY, rect, 1)
         
         for i, card in enumerate(cards):
             card_x = start_x + i * (card_width + card_spacing)
@@ -1901,11 +1855,12 @@ class GameScreen:
                 
                 for i in range(2):
                     card_x = start_x + i * (card_width + card_spacing)
-                    # 뒷면 이미지 직접 그리기
-                    back_img = self.card_display.card_back_image
+                    # 뒷면 이미지 직접 그리기 (크기별 캐시)
+                    back_img = self.card_display.get_scaled_image(
+                        CARD_BACK_KEY, (card_width, int(CARD_HEIGHT * 0.8))
+                    )
                     if back_img:
-                        scaled_back = pygame.transform.scale(back_img, (card_width, int(CARD_HEIGHT * 0.8)))
-                        self.renderer.screen.blit(scaled_back, (card_x, combo_y))
+                        self.renderer.screen.blit(back_img, (card_x, combo_y))
                 
                 self.renderer.draw_text(
                     "???",
@@ -2143,7 +2098,8 @@ class GameScreen:
                         
                         for i, card in enumerate(self.game.npc.cards):
                             x = start_x + i * (card_width + 10)
-                            self.card_display.draw_card(self.renderer.screen, card, x, fold_y, scale=0.6)
+                            self.card_display.draw_card(self.renderer.screen, card, x, fold_y,
+                                                        revealed=self.game.npc.is_card_revealed(card), scale=0.6)
                     
                     fold_y += card_height + 40
                     
@@ -2165,7 +2121,8 @@ class GameScreen:
                         
                         for i, card in enumerate(self.game.player.cards):
                             x = start_x + i * (card_width + 10)
-                            self.card_display.draw_card(self.renderer.screen, card, x, fold_y, scale=0.6)
+                            self.card_display.draw_card(self.renderer.screen, card, x, fold_y,
+                                                        revealed=self.game.player.is_card_revealed(card), scale=0.6)
                     
                     fold_y += card_height + 40
                 
@@ -2273,8 +2230,8 @@ class GameScreen:
         
         # NPC 카드 (공개된 카드는 앞면, 나머지는 뒷면)
         if self.game.npc.cards:
-            # 각 카드의 is_revealed 상태에 따라 공개 여부 결정
-            npc_revealed = [card.is_revealed for card in self.game.npc.cards]
+            # NPC가 공개한 카드만 앞면
+            npc_revealed = [self.game.npc.is_card_revealed(card) for card in self.game.npc.cards]
             self.card_display.draw_cards(
                 self.renderer.screen,
                 self.game.npc.cards,
@@ -2315,10 +2272,7 @@ class GameScreen:
         # NPC 대기 중 표시
         if self.waiting_for_npc:
             # 반투명 오버레이
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(100)
-            overlay.fill(COLOR_BLACK)
-            self.renderer.screen.blit(overlay, (0, 0))
+            self.renderer.draw_overlay(100)
             
             # 대기 중 텍스트
             self.renderer.draw_text_outlined(
@@ -2335,15 +2289,21 @@ class GameScreen:
                 self.renderer.font_medium, COLOR_HIGHLIGHT
             )
         
+        # NPC 대사 생성 중 표시 (점 개수로 애니메이션)
+        if self.dialogue_service.is_busy() and not self.dialogue:
+            dots = "." * (pygame.time.get_ticks() // 400 % 3 + 1)
+            self.renderer.draw_text_outlined(
+                f"💭 {self.game.npc.name} 생각 중{dots}",
+                SCREEN_WIDTH // 2 + 200, 150,
+                self.renderer.font_small, COLOR_LIGHT_GRAY
+            )
+        
         # 대화 (개선된 스타일)
         if self.dialogue:
             speaker, text = self.dialogue
             
             # 반투명 커튼
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(COLOR_BLACK)
-            self.renderer.screen.blit(overlay, (0, 0))
+            self.renderer.draw_overlay(180)
             
             # 대화 상자 크기 및 위치
             box_width = 900
@@ -2352,13 +2312,11 @@ class GameScreen:
             box_y = (SCREEN_HEIGHT - box_height) // 2
             
             # 대화 상자 배경 (반투명 검정)
-            dialog_bg = pygame.Surface((box_width, box_height))
-            dialog_bg.set_alpha(220)
-            dialog_bg.fill((20, 20, 20))
+            dialog_bg = self.renderer.layers.fill((box_width, box_height), (20, 20, 20), 220)
             self.renderer.screen.blit(dialog_bg, (box_x, box_y))
             
             # 대화 상자 테두리 (금색)
-            pygame.draw.rect(
+            draw_rect(
                 self.renderer.screen,
                 COLOR_GOLD,
                 (box_x, box_y, box_width, box_height),
@@ -2385,9 +2343,8 @@ class GameScreen:
             
             for word in words:
                 test_line = current_line + (" " if current_line else "") + word
-                # 텍스트 너비 측정
-                text_surface = self.renderer.font_medium.render(test_line, True, COLOR_WHITE)
-                if text_surface.get_width() <= max_width:
+                # 텍스트 너비 측정 (렌더링 없이 크기만 계산)
+                if self.renderer.font_medium.size(test_line)[0] <= max_width:
                     current_line = test_line
                 else:
                     if current_line:
@@ -2419,10 +2376,7 @@ class GameScreen:
         # 속마음 대화창 (대화창 위에 레이어로 표시)
         if self.show_inner_thought and self.inner_thought_text:
             # 추가 반투명 레이어 (연한 보라색, 불투명도 높임)
-            overlay2 = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay2.set_alpha(230)  # 불투명도 증가 (180 -> 230)
-            overlay2.fill((60, 40, 80))  # 연한 보라색
-            self.renderer.screen.blit(overlay2, (0, 0))
+            self.renderer.draw_overlay(230, (60, 40, 80))  # 연한 보라색, 불투명도 증가 (180 -> 230)
             
             # 속마음 대화 상자 크기 및 위치 (대화창과 동일한 크기)
             inner_box_width = 900  # 700 -> 900
@@ -2431,13 +2385,11 @@ class GameScreen:
             inner_box_y = (SCREEN_HEIGHT - inner_box_height) // 2
             
             # 속마음 대화 상자 배경 (진한 보라색)
-            inner_dialog_bg = pygame.Surface((inner_box_width, inner_box_height))
-            inner_dialog_bg.set_alpha(230)
-            inner_dialog_bg.fill((50, 20, 80))
+            inner_dialog_bg = self.renderer.layers.fill((inner_box_width, inner_box_height), (50, 20, 80), 230)
             self.renderer.screen.blit(inner_dialog_bg, (inner_box_x, inner_box_y))
             
             # 속마음 대화 상자 테두리 (밝은 보라색)
-            pygame.draw.rect(
+            draw_rect(
                 self.renderer.screen,
                 (150, 100, 200),
                 (inner_box_x, inner_box_y, inner_box_width, inner_box_height),
@@ -2464,8 +2416,7 @@ class GameScreen:
             
             for word in inner_words:
                 test_line = inner_current_line + (" " if inner_current_line else "") + word
-                text_surface = self.renderer.font_medium.render(test_line, True, COLOR_WHITE)
-                if text_surface.get_width() <= inner_max_width:
+                if self.renderer.font_medium.size(test_line)[0] <= inner_max_width:
                     inner_current_line = test_line
                 else:
                     if inner_current_line:
@@ -2500,8 +2451,10 @@ class GameScreen:
 
     def update(self):
         """화면을 업데이트합니다."""
-        # 대화창이 클릭 대기 중이면 다른 프로세스 멈춤
+        # 대화창이 클릭 대기 중이면 다른 프로세스 멈춤 (생성 중인 대사는 계속 받음)
         if self.dialogue_waiting_click:
+            if self.dialogue_streaming:
+                self._poll_dialogue()
             return
         
         # 메시지 타이머
@@ -2528,6 +2481,9 @@ class GameScreen:
             mouse_pos = pygame.mouse.get_pos()
             self.inner_thought_close_button.update(mouse_pos)
         
+        # 완성된 NPC 대사 표시
+        self._poll_dialogue()
+        
         # NPC 턴 대기 처리
         if self.waiting_for_npc:
             current_time = pygame.time.get_ticks()
@@ -2547,6 +2503,61 @@ class GameScreen:
         if self.card_confirm_button and self.game.state == GameState.CARD_SELECTION:
             self.card_confirm_button.update(mouse_pos)
 
+    def _prefetch_npc_dialogue(self):
+        """
+        베팅 페이즈가 시작되면 NPC 턴에 쓸 대사를 미리 생성합니다.
+        
+        말할지는 여기서 한 번 정해 두고 첫 NPC 턴(_npc_turn)이 같은 결정을 따르므로,
+        말하지 않을 턴의 대사는 생성하지 않습니다.
+        """
+        self.npc_will_speak = self.game.npc.should_speak()
+        if self.npc_will_speak:
+            self.dialogue_service.prefetch(self.game, self.game.npc.name)
+    
+    def _cancel_npc_dialogue(self):
+        """라운드가 끝나면 생성 중이거나 미리 생성한 대사를 모두 버립니다."""
+        self.dialogue_service.cancel_all()
+        self.dialogue_streaming = False
+        self.npc_will_speak = None
+    
+    def _poll_dialogue(self):
+        """백그라운드에서 완성된 NPC 대사를 꺼내 표시합니다 (매 프레임 호출)."""
+        results = self.dialogue_service.poll()
+        
+        # 재시작 전 게임이나 지난 라운드의 대사는 버리고, 도착 순서대로 처리 (마지막 대사가 남음)
+        for result in results:
+            if result['game'] is not self.game or result['round'] != self.game.current_round:
+                continue
+            
+            # 요청한 뒤 상황이 바뀐 대사는 새 말풍선으로 열지 않음 (이미 열린 말풍선은 계속 채움)
+            stale = result['key'] != situation_key(self.game)
+            
+            if result['partial']:
+                # 생성 중인 대사: 첫 조각에서 말풍선을 열고 이후에는 글자만 늘림
+                if not self.dialogue_streaming:
+                    if stale:
+                        continue
+                    self.dialogue_streaming = True
+                    self.inner_thought_text = ""
+                    self.show_dialogue(result['speaker'], result['talk'], wait_for_click=True)
+                elif self.dialogue is not None:
+                    self.dialogue = (result['speaker'], result['talk'])
+                continue
+            
+            if self.dialogue_streaming:
+                # 생성 중에 확인을 눌러 닫은 대사는 다시 열지 않음
+                self.dialogue_streaming = False
+                if self.dialogue is None:
+                    continue
+                self.inner_thought_text = result['inner']  # 속마음 저장
+                self.dialogue = (result['speaker'], result['talk'])
+                continue
+            
+            if stale:
+                continue
+            self.inner_thought_text = result['inner']  # 속마음 저장
+            self.show_dialogue(result['speaker'], result['talk'], wait_for_click=True)
+    
     def run(self):
         """게임 루프를 실행합니다."""
         while self.running:
@@ -2557,6 +2568,7 @@ class GameScreen:
             self.draw()
             self.renderer.tick()
         
+        self.dialogue_service.shutdown()
         self.renderer.quit()
 
 
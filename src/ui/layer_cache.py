@@ -0,0 +1,103 @@
+"""
+반투명 배경 레이어 캐시
+화면 가림막, 대화 상자, 패널처럼 매 프레임 똑같이 다시 만들던 반투명 surface를
+한 번만 만들어 두고 다시 씁니다. 화면(set_mode)이 바뀌면 새 화면 형식으로 다시 만듭니다.
+"""
+
+import pygame
+from typing import Callable, Dict, Hashable, Tuple
+
+
+class LayerCache:
+    """
+    반투명 배경 레이어 캐시
+
+    - fill: 단색 + 면 전체 불투명도 (set_alpha, 픽셀 알파 없이 빠르게 blit)
+    - rounded: 둥근 모서리 사각형 + 픽셀 알파 (SRCALPHA, 모서리 바깥은 투명)
+
+    반환한 surface는 캐시와 공유하므로 수정하지 말고 blit만 해야 합니다.
+    """
+
+    def __init__(self):
+        self._layers: Dict[Hashable, pygame.Surface] = {}
+        self._screen_format = None  # 레이어를 만들 때의 화면 (크기, 픽셀 형식)
+
+    def fill(self, size: Tuple[int, int], color, alpha: int) -> pygame.Surface:
+        """
+        단색 반투명 레이어를 반환합니다.
+
+        Args:
+            size: 크기 (너비, 높이)
+            color: RGB 색상
+            alpha: 면 전체 불투명도 (0 ~ 255)
+        """
+        def build():
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            surface.set_alpha(alpha)
+            return surface
+
+        return self._get(('fill', tuple(size), tuple(color), alpha), build)
+
+    def rounded(self, size: Tuple[int, int], color, border_radius: int) -> pygame.Surface:
+        """
+        둥근 모서리 반투명 레이어를 반환합니다.
+
+        Args:
+            size: 크기 (너비, 높이)
+            color: RGBA 색상 (A가 불투명도)
+            border_radius: 모서리 반지름
+        """
+        def build():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            return surface
+
+        return self._get(('rounded', tuple(size), tuple(color), border_radius), build)
+
+    def clear(self):
+        """만들어 둔 레이어를 모두 버립니다."""
+        self._layers.clear()
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def _get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """캐시에서 레이어를 꺼내고, 없으면 만들어 저장합니다."""
+        # set_mode는 같은 화면 surface 객체를 돌려주므로 크기와 픽셀 형식으로 변경을 판단
+        screen = pygame.display.get_surface()
+        screen_format = (screen.get_size(), screen.get_bitsize(), screen.get_masks()) if screen is not None else None
+        if screen_format != self._screen_format:
+            # 화면 크기나 형식이 바뀌면 새 화면 형식으로 다시 만듦
+            self._layers.clear()
+            self._screen_format = screen_format
+
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._layers[key] = build()
+        return layer
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=== 반투명 레이어 캐시 테스트 ===\n")
+
+    pygame.init()
+    screen = pygame.display.set_mode((320, 240))
+    layers = LayerCache()
+
+    overlay = layers.fill((320, 240), (0, 0, 0), 200)
+    print(f"같은 레이어 재사용: {layers.fill((320, 240), (0, 0, 0), 200) is overlay}")
+    panel = layers.rounded((100, 60), (40, 40, 40, 220), 15)
+    print(f"모서리 투명: {panel.get_at((0, 0)).a == 0}, 가운데 알파: {panel.get_at((50, 30)).a}")
+    print(f"레이어 수: {len(layers)}")
+
+    screen = pygame.display.set_mode((640, 480))
+    layers.fill((640, 480), (0, 0, 0), 200)
+    print(f"화면 변경 후 레이어 수: {len(layers)}")
+
+    pygame.quit()
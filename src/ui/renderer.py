@@ -4,6 +4,7 @@ Pygame 화면 초기화 및 기본 렌더링 기능
 """
 
 import pygame
+from collections import OrderedDict
 import sys
 import os
 
@@ -11,8 +12,49 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, FPS,
     COLOR_BG, COLOR_TEXT, COLOR_TABLE, COLOR_HIGHLIGHT,
-    COLOR_GOLD, COLOR_DANGER, COLOR_SUCCESS, COLOR_WHITE, COLOR_BLACK
+    COLOR_GOLD, COLOR_DANGER, COLOR_SUCCESS, COLOR_WHITE, COLOR_BLACK,
+    TEXT_CACHE_SIZE, DIRTY_RECT_RENDERING, IDLE_FPS, IDLE_AFTER_FRAMES
 )
+from ui.layer_cache import LayerCache
+from ui.display_list import DisplayList, draw_rect, draw_ellipse
+
+
+# 렌더링한 텍스트 {(텍스트, 폰트, 색상, 안티앨리어싱): surface}, 오래 안 쓴 것부터 삭제
+_text_cache = OrderedDict()
+
+# 이모지 폰트 {크기: 폰트} (시스템 폰트 검색은 크기별로 한 번만)
+_emoji_fonts = {}
+
+
+def render_text(font, text: str, antialias: bool, color) -> pygame.Surface:
+    """
+    font.render와 같지만 같은 (텍스트, 폰트, 색상, 안티앨리어싱)은 한 번만 렌더링합니다.
+    
+    반환한 surface는 캐시와 공유하므로 수정하지 말고 blit만 해야 합니다.
+    """
+    key = (text, font, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+    
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def get_emoji_font(size: int, fallback=None):
+    """이모지 폰트를 반환합니다 (없으면 fallback)."""
+    font = _emoji_fonts.get(size)
+    if font is None:
+        try:
+            font = pygame.font.SysFont('segoeuiemoji', size)
+        except (OSError, pygame.error):
+            font = fallback
+        _emoji_fonts[size] = font
+    return font
 
 
 class Renderer:
@@ -25,12 +67,20 @@ class Renderer:
         pygame.font.init()
         
         # 화면 설정
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 변경 영역 렌더링이면 screen은 그리기를 기록하는 DisplayList (실제 화면은 display)
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = DisplayList(self.display) if self.dirty_rendering else self.display
         pygame.display.set_caption(SCREEN_TITLE)
         
         # 시계 (FPS 제어)
         self.clock = pygame.time.Clock()
         
+        # 반투명 배경 레이어 (화면이 바뀔 때만 다시 만듦)
+        self.layers = LayerCache()
+        
+        self.idle_frames = 0  # 연속으로 변화가 없었던 프레임 수
+        
         # 폰트 로딩
         self._load_fonts()
         
@@ -45,7 +95,7 @@ class Renderer:
             self.font_medium = pygame.font.SysFont('malgungothic', 32, bold=True)
             self.font_normal = pygame.font.SysFont('malgungothic', 24)
             self.font_small = pygame.font.SysFont('malgungothic', 18)
-        except:
+        except (OSError, pygame.error):
             # 폴백: 기본 폰트
             print("경고: 맑은 고딕 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
             self.font_large = pygame.font.Font(None, 48)
@@ -74,11 +124,15 @@ class Renderer:
         """화면을 지웁니다."""
         self.screen.fill(COLOR_BG)
     
+    def draw_overlay(self, alpha: int, color=COLOR_BLACK):
+        """화면 전체에 반투명 가림막을 씌웁니다."""
+        self.screen.blit(self.layers.fill(self.screen.get_size(), color, alpha), (0, 0))
+    
     def draw_table(self):
         """테이블을 그립니다."""
         # 테이블 배경 (타원)
-        pygame.draw.ellipse(self.screen, COLOR_TABLE, self.table_area)
-        pygame.draw.ellipse(self.screen, COLOR_GOLD, self.table_area, 3)
+        draw_ellipse(self.screen, COLOR_TABLE, self.table_area)
+        draw_ellipse(self.screen, COLOR_GOLD, self.table_area, 3)
     
     def draw_text(self, text: str, x: int, y: int, 
                   font=None, color=COLOR_TEXT, center=False, center_y=False):
@@ -101,8 +155,8 @@ class Renderer:
             # 이모지와 일반 텍스트를 분리하여 렌더링
             return self._draw_mixed_text(str(text), x, y, font, color, center)
         else:
-            # 일반 텍스트 렌더링
-            text_surface = font.render(str(text), True, color)
+            # 일반 텍스트 렌더링 (같은 문자열은 캐시 사용)
+            text_surface = render_text(font, str(text), True, color)
             text_rect = text_surface.get_rect()
             
             if center:
@@ -130,11 +184,8 @@ class Renderer:
         Returns:
             전체 텍스트의 사각형
         """
-        # 이모지 폰트 준비
-        try:
-            emoji_font = pygame.font.SysFont('segoeuiemoji', font.get_height())
-        except:
-            emoji_font = font
+        # 이모지 폰트 준비 (크기별로 한 번만 검색)
+        emoji_font = get_emoji_font(font.get_height(), font)
         
         # 텍스트를 문자별로 분리하고 각각 렌더링
         segments = []
@@ -168,7 +219,7 @@ class Renderer:
         
         for segment_text, is_emoji in segments:
             segment_font = emoji_font if is_emoji else font
-            surface = segment_font.render(segment_text, True, color)
+            surface = render_text(segment_font, segment_text, True, color)
             surfaces.append(surface)
             total_width += surface.get_width()
             max_height = max(max_height, surface.get_height())
@@ -255,10 +306,10 @@ class Renderer:
             border_color: 테두리 색상 (None이면 테두리 없음)
             border_width: 테두리 두께
         """
-        pygame.draw.rect(self.screen, color, rect)
+        draw_rect(self.screen, color, rect)
         
         if border_color:
-            pygame.draw.rect(self.screen, border_color, rect, border_width)
+            draw_rect(self.screen, border_color, rect, border_width)
     
     def draw_rounded_box(self, rect: pygame.Rect, color, 
                         border_color=None, border_width=2, radius=10):
@@ -272,10 +323,10 @@ class Renderer:
             border_width: 테두리 두께
             radius: 모서리 반경
         """
-        pygame.draw.rect(self.screen, color, rect, border_radius=radius)
+        draw_rect(self.screen, color, rect, border_radius=radius)
         
         if border_color:
-            pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius=radius)
+            draw_rect(self.screen, border_color, rect, border_width, border_radius=radius)
     
     def draw_info_box(self, text: str, x: int, y: int, 
                      width: int = 200, height: int = 60,
@@ -296,12 +347,10 @@ class Renderer:
         rect = pygame.Rect(x, y, width, height)
         
         # 반투명 박스
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(surface, bg_color, surface.get_rect(), border_radius=10)
-        self.screen.blit(surface, (x, y))
+        self.screen.blit(self.layers.rounded((width, height), bg_color, 10), (x, y))
         
         # 테두리
-        pygame.draw.rect(self.screen, COLOR_GOLD, rect, 2, border_radius=10)
+        draw_rect(self.screen, COLOR_GOLD, rect, 2, border_radius=10)
         
         # 텍스트
         self.draw_text(text, x + width // 2, y + height // 2, 
@@ -323,16 +372,16 @@ class Renderer:
         """
         # 배경
         bg_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, bg_color, bg_rect, border_radius=5)
+        draw_rect(self.screen, bg_color, bg_rect, border_radius=5)
         
         # 진행 바
         fill_width = int(width * max(0.0, min(1.0, progress)))
         if fill_width > 0:
             fill_rect = pygame.Rect(x, y, fill_width, height)
-            pygame.draw.rect(self.screen, fill_color, fill_rect, border_radius=5)
+            draw_rect(self.screen, fill_color, fill_rect, border_radius=5)
         
         # 테두리
-        pygame.draw.rect(self.screen, border_color, bg_rect, 2, border_radius=5)
+        draw_rect(self.screen, border_color, bg_rect, 2, border_radius=5)
     
     def draw_player_info(self, name: str, money: int, bet: int,
                         x: int, y: int, is_first=False):
@@ -423,11 +472,9 @@ class Renderer:
         height = 80
         bg_rect = pygame.Rect(x, y, width, height)
         
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(surface, (0, 0, 0, 200), surface.get_rect(), border_radius=10)
-        self.screen.blit(surface, (x, y))
+        self.screen.blit(self.layers.rounded((width, height), (0, 0, 0, 200), 10), (x, y))
         
-        pygame.draw.rect(self.screen, COLOR_HIGHLIGHT, bg_rect, 2, border_radius=10)
+        draw_rect(self.screen, COLOR_HIGHLIGHT, bg_rect, 2, border_radius=10)
         
         # 발화자 이름
         self.draw_text(f"{speaker}:", x + 10, y + 10, 
@@ -470,12 +517,61 @@ class Renderer:
         return lines
     
     def update_display(self):
-        """화면을 업데이트합니다."""
-        pygame.display.flip()
+        """
+        화면을 업데이트합니다.
+        
+        변경 영역 렌더링을 사용하면 이번 프레임에 기록한 그리기를 직전 프레임과 비교해
+        달라진 그리기의 영역만 다시 그리고 display.update로 반영합니다.
+        바뀐 그리기가 없으면 픽셀을 건드리지 않고 화면에 아무것도 보내지 않습니다.
+        """
+        if not self.dirty_rendering:
+            pygame.display.flip()
+            return
+        
+        rects = self.screen.present()
+        if rects is None:
+            pygame.display.flip()
+            self.idle_frames = 0
+        elif rects:
+            pygame.display.update(rects)
+            self.idle_frames = 0
+        else:
+            self.idle_frames += 1
+    
+    def invalidate(self):
+        """다음 프레임에 전체 화면을 다시 그립니다 (창 복원 등)."""
+        if self.dirty_rendering:
+            self.screen.invalidate()
+        self.idle_frames = 0
+    
+    def set_mode(self, flags: int = 0):
+        """
+        화면 모드를 바꿉니다 (전체화면 전환 등).
+        
+        Args:
+            flags: pygame.display.set_mode 플래그
+        """
+        self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+        if self.dirty_rendering:
+            self.screen.retarget(self.display)
+        else:
+            self.screen = self.display
+        self.idle_frames = 0
     
     def tick(self):
-        """FPS를 제어합니다."""
+        """
+        FPS를 제어합니다.
+        
+        화면이 IDLE_AFTER_FRAMES 프레임 동안 그대로였으면 IDLE_FPS로 낮추되,
+        대기 중에도 입력 이벤트가 들어오면 바로 다음 프레임으로 넘어갑니다.
+        """
         self.clock.tick(FPS)
+        if not self.dirty_rendering or self.idle_frames < IDLE_AFTER_FRAMES:
+            return
+        
+        wake_time = pygame.time.get_ticks() + 1000 // IDLE_FPS
+        while not pygame.event.peek() and pygame.time.get_ticks() < wake_time:
+            self.clock.tick(FPS)
     
     def quit(self):
         """Pygame을 종료합니다."""